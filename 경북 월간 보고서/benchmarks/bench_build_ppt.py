@@ -0,0 +1,52 @@
+"""
+build_ppt_from_template 벤치마크.
+합성 템플릿(14행 x 5열 표 + '날짜' 도형)과 합성 서버 report 로 슬라이드 생성 시간을 측정하여,
+서버 수에 따라 시간이 선형으로 늘어나는지(서버당 시간이 일정한지) 확인합니다.
+
+사용법: python benchmarks/bench_build_ppt.py [--sizes 50 100 250 500] [--legacy]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import make_reports, make_template
+from xlsx_to_ppt import build_ppt_from_template
+
+
+def run(template: str, reports, compiled: bool, out_dir: str) -> float:
+    output = os.path.join(out_dir, f"out_{'compiled' if compiled else 'legacy'}_{len(reports)}.pptx")
+    t0 = time.perf_counter()
+    build_ppt_from_template(template, output, reports, date="25년 1월", compiled=compiled)
+    return time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 250, 500])
+    parser.add_argument("--legacy", action="store_true", help="기존 duplicate_slide 방식도 함께 측정")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = os.path.join(tmp, "template02.pptx")
+        make_template(template)
+
+        rows = []
+        for n in args.sizes:
+            reports = make_reports(n)
+            row = {"servers": n, "compiled": run(template, reports, True, tmp)}
+            if args.legacy:
+                row["legacy"] = run(template, reports, False, tmp)
+            rows.append(row)
+
+    print(f"\n{'servers':>8} {'compiled(s)':>12} {'ms/server':>10}" + (f" {'legacy(s)':>10} {'ms/server':>10}" if args.legacy else ""))
+    for row in rows:
+        line = f"{row['servers']:>8} {row['compiled']:>12.2f} {row['compiled'] / row['servers'] * 1000:>10.1f}"
+        if args.legacy:
+            line += f" {row['legacy']:>10.2f} {row['legacy'] / row['servers'] * 1000:>10.1f}"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+월간보고서 생성기 시작(import) 시간 점검.
+python -X importtime 으로 create_report_gyeongbuk 를 import 하는 데 걸린 시간을 측정해
+- 무거운 의존성(pptx, openpyxl, dateutil, pptx_merger, tkinter, PIL, numpy)이 시작 시점에 import 되지 않았는지
+- 전체 import 시간이 예산(--budget-ms) 이내인지
+확인합니다. 하나라도 어기면 종료 코드 1 (CI 에서 그대로 사용).
+
+사용법:
+  python benchmarks/check_import_time.py                    # 기본 예산으로 점검
+  python benchmarks/check_import_time.py --budget-ms 150 --top 20
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCH_DIR)
+
+DEFAULT_MODULE = "create_report_gyeongbuk"
+DEFAULT_BUDGET_MS = 200.0
+# 각 단계(파싱/병합/빌드/기관별 복사/폴더 선택)에서만 불러와야 하는 패키지
+LAZY_PACKAGES = ["pptx", "openpyxl", "dateutil", "pptx_merger", "tkinter", "PIL", "numpy"]
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def measure(module: str) -> List[Tuple[str, int, int, int]]:
+    """
+    새 인터프리터에서 module 을 import 하고 -X importtime 결과를
+    (모듈명, self us, cumulative us, 깊이) 리스트로 반환.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            self_us, cum_us, indent, name = m.groups()
+            rows.append((name, int(self_us), int(cum_us), len(indent) // 2))
+    return rows
+
+def best_of(module: str, repeat: int) -> List[Tuple[str, int, int, int]]:
+    # 디스크 캐시/스케줄링 영향을 줄이기 위해 여러 번 측정해 가장 빠른 결과 사용
+    runs = [measure(module) for _ in range(repeat)]
+    return min(runs, key=lambda rows: total_us(rows, module))
+
+def total_us(rows, module: str) -> int:
+    return next((cum for name, _, cum, _ in rows if name == module), 0)
+
+def lazy_violations(rows, packages: List[str]) -> Dict[str, int]:
+    """
+    시작 시점에 import 된 무거운 패키지와 그 누적 시간(us).
+    """
+    found = {}
+    for name, _, cum, _ in rows:
+        top = name.split(".")[0]
+        if top in packages and name == top:
+            found[top] = cum
+    return found
+
+def print_report(rows, module: str, top: int):
+    print(f"\n{'cumulative(ms)':>15} {'self(ms)':>9}  module")
+    for name, self_us, cum_us, depth in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"{cum_us / 1000:>15.1f} {self_us / 1000:>9.1f}  {'  ' * depth}{name}")
+    print(f"\n{module} import 시간: {total_us(rows, module) / 1000:.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="허용할 import 시간 (ms)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="오래 걸린 모듈 몇 개를 출력할지")
+    args = parser.parse_args()
+
+    rows = best_of(args.module, args.repeat)
+    print_report(rows, args.module, args.top)
+
+    failed = False
+    violations = lazy_violations(rows, LAZY_PACKAGES)
+    if violations:
+        failed = True
+        print("\n시작 시점에 import 되면 안 되는 패키지:")
+        for name, cum in violations.items():
+            print(f"  - {name} ({cum / 1000:.1f} ms)")
+
+    total_ms = total_us(rows, args.module) / 1000
+    if total_ms > args.budget_ms:
+        failed = True
+        print(f"\nimport 시간 예산 초과: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+
+    if not failed:
+        print(f"예산 {args.budget_ms:.1f} ms 이내, 무거운 패키지 지연 import 확인")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+월간보고서 생성기 회귀 점검.
+리뷰에서 나온 경계 조건(압축된 zip 멤버 그대로 복사 등)을 작은 합성 입력으로 확인합니다.
+하나라도 실패하면 종료 코드 1 (CI 에서 그대로 사용).
+
+사용법:
+  python benchmarks/check_regressions.py
+  python benchmarks/check_regressions.py --only zip_raw_copy
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import traceback
+import zipfile
+from typing import Callable, Dict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+
+class _NonSeekable(io.RawIOBase):
+    # 여기에 쓰면 zipfile 이 data descriptor(flag bit 3)를 사용
+    def __init__(self):
+        self.buf = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buf += data
+        return len(data)
+
+
+def check_zip_raw_copy(work_dir: str):
+    """
+    ZipRawWriter 로 옮긴 zip 이 testzip() 을 통과하고, 내용과 압축된 바이트가 원본과 같은지.
+    """
+    from xlsx_stream import ZipRawWriter, _read_compressed, raw_copy_supported
+
+    members = {
+        "[Content_Types].xml": b"<Types/>" * 50,
+        "ppt/media/image1.png": os.urandom(4096),
+        "ppt/slides/슬라이드1.xml": "<p:sld>한글</p:sld>".encode("utf-8") * 100,
+    }
+    sources = []
+    plain = os.path.join(work_dir, "plain.zip")
+    with zipfile.ZipFile(plain, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data, compress_type=zipfile.ZIP_STORED if name.endswith(".png") else None)
+        zf.getinfo("[Content_Types].xml").comment = b"kept"
+    sources.append(plain)
+
+    streamed = _NonSeekable()
+    with zipfile.ZipFile(streamed, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    descriptor = os.path.join(work_dir, "descriptor.zip")
+    with open(descriptor, "wb") as f:
+        f.write(bytes(streamed.buf))
+    sources.append(descriptor)
+
+    for src in sources:
+        dst = src + ".copy.zip"
+        with zipfile.ZipFile(src) as zin:
+            infos = zin.infolist()
+            assert raw_copy_supported(infos)
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                writer = ZipRawWriter(fdst)
+                for info in infos:
+                    writer.copy(fsrc, info)
+                writer.close()
+
+        with zipfile.ZipFile(src) as zin, zipfile.ZipFile(dst) as zout, \
+                open(src, "rb") as fsrc, open(dst, "rb") as fdst:
+            assert zout.testzip() is None, f"{dst}: testzip 실패"
+            assert zout.namelist() == zin.namelist()
+            for a, b in zip(zin.infolist(), zout.infolist()):
+                assert zout.read(b) == members[a.filename]
+                assert (b.compress_type, b.CRC, b.date_time, b.comment) == \
+                       (a.compress_type, a.CRC, a.date_time, a.comment if src == plain else b"")
+                assert _read_compressed(fdst, b.header_offset, b.compress_size) == \
+                       _read_compressed(fsrc, a.header_offset, a.compress_size), f"{a.filename}: 압축 바이트가 다름"
+
+        # 옮긴 zip 에 zipfile 로 이어 쓰기(fan_out 의 표지 추가와 같은 방식)도 되는지
+        with zipfile.ZipFile(dst, "a") as zf:
+            zf.writestr("extra.xml", b"<x/>")
+        with zipfile.ZipFile(dst) as zf:
+            assert zf.testzip() is None and zf.read("extra.xml") == b"<x/>"
+
+
+def check_empty_series(work_dir: str):
+    """
+    헤더만 있고 값 행이 없는 원시 시계열 CSV 가 있어도 차트/통계 적용이 중단되지 않고,
+    그 지표만 건너뛰는지.
+    """
+    import create_report_gyeongbuk as report
+    from series_stats import load_series_csv
+
+    empty = os.path.join(work_dir, "empty.csv")
+    with open(empty, "w", encoding="utf-8") as f:
+        f.write("시각,srv-a (10.0.0.1),srv-b (10.0.0.2)\n")
+    filled = os.path.join(work_dir, "filled.csv")
+    with open(filled, "w", encoding="utf-8") as f:
+        f.write("시각,srv-a (10.0.0.1)\n2024-01-01 00:00,5\n2024-01-01 00:05,7\n")
+
+    table = load_series_csv(empty)
+    assert table.values.shape == (0, 2)
+    tables = {"● CPU Used (%)": table, "● MEM Used (%)": load_series_csv(filled), "● In bps (bps)": table}
+    reports = [report.ServerReport(name, report.MetricBlock({}, []), report.MetricBlock({}, []),
+                                   report.MetricBlock({}, []))
+               for name in ("srv-a", "srv-b")]
+
+    charted = report.apply_series_charts(reports, tables, {"cpu_mem": (400, 120), "network": (400, 120)},
+                                         parallel=False)
+    assert charted == 1, f"차트가 적용된 서버 수 {charted} (기대값 1)"
+    assert report.apply_series_stats(reports, tables) == 1
+
+
+CHECKS: Dict[str, Callable[[str], None]] = {
+    "zip_raw_copy": check_zip_raw_copy,
+    "empty_series": check_empty_series,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--only", nargs="+", choices=list(CHECKS), help="실행할 점검 (기본: 전부)")
+    args = parser.parse_args()
+
+    failed = 0
+    for name in args.only or CHECKS:
+        with tempfile.TemporaryDirectory() as work_dir:
+            try:
+                CHECKS[name](work_dir)
+                print(f"[통과] {name}")
+            except Exception:
+                failed += 1
+                print(f"[실패] {name}")
+                traceback.print_exc()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
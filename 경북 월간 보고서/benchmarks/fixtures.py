@@ -0,0 +1,228 @@
+"""
+벤치마크용 합성 입력 생성기.
+- SMS 내보내기 형식의 Excel 3종 (서버 헤더 블록 + Min/Max/Avg 표 + PNG 그래프)
+- 월간보고서 템플릿 (앞: 표지 '기관명'/'날짜', 본문: 14행 x 5열 표 + '날짜', 뒤: 마무리 슬라이드)
+실제 고객사 파일 없이 서버 수만 바꿔가며 파이프라인 각 단계를 측정할 수 있게 합니다.
+"""
+import io
+import os
+import random
+import sys
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook
+from openpyxl.drawing.image import Image as XLImage
+from PIL import Image, ImageDraw
+from pptx import Presentation
+from pptx.util import Cm
+
+from xlsx_to_ppt import MetricBlock, ServerReport, Stats
+
+# create_report_gyeongbuk 의 입력 파일명과 동일
+CPU_MEM_XLSX = "[SMS] CPU Used (%), MEM Used (%).xlsx"
+NETWORK_XLSX = "[SMS] Network Traffic - In bps (bps), Out bps (bps).xlsx"
+FS_XLSX = "[SMS] Storage - 파일시스템 사용률 (%).xlsx"
+
+SMS_METRICS = {
+    CPU_MEM_XLSX: ["● CPU Used (%)", "● MEM Used (%)"],
+    NETWORK_XLSX: ["● In bps (bps)", "● Out bps (bps)"],
+    FS_XLSX: ["● 파일시스템 사용률 (%)"],
+}
+
+# SMS 내보내기 레이아웃: 서버 헤더 → 그래프 → Min/Max/Avg 표
+CHART_SIZE = (900, 270)
+STATS_OFFSET = 20
+BLOCK_GAP = 5
+
+
+# -----------------------------
+# 그래프 이미지
+# -----------------------------
+def make_png(seed: int, size: Tuple[int, int] = CHART_SIZE) -> bytes:
+    """
+    선 그래프 모양의 PNG. 서버마다 다른 바이트가 나오도록 seed 로 값을 바꿉니다.
+    """
+    rnd = random.Random(seed)
+    img = Image.new("RGB", size, (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    w, h = size
+    points = [(x, int(h * (0.2 + 0.6 * rnd.random()))) for x in range(0, w, 6)]
+    draw.line(points, fill=(31, 119, 180), width=2)
+    bio = io.BytesIO()
+    img.save(bio, format="PNG")
+    return bio.getvalue()
+
+
+# -----------------------------
+# SMS 내보내기 Excel
+# -----------------------------
+def make_sms_workbook(path: str, n_servers: int, metrics: List[str], seed: int = 0):
+    rnd = random.Random(seed)
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "[SMS] 성능 보고서"
+
+    row = 3
+    for i in range(n_servers):
+        ws.cell(row=row, column=1, value=f"■ server-{i:04d} ({10 + i // 62500}.{i // 250 % 250}.{i % 250}.{1 + i % 200})")
+
+        img = XLImage(io.BytesIO(make_png(seed * 100000 + i)))
+        img.anchor = f"A{row + 1}"
+        ws.add_image(img)
+
+        header_row = row + STATS_OFFSET
+        for c, label in enumerate(["Max", "Min", "Avg"], start=2):
+            ws.cell(row=header_row, column=c, value=label)
+        for j, metric in enumerate(metrics, start=1):
+            ws.cell(row=header_row + j, column=1, value=metric)
+            for c in (2, 3, 4):
+                ws.cell(row=header_row + j, column=c, value=f"{rnd.random() * 100:.2f}")
+
+        row = header_row + len(metrics) + BLOCK_GAP
+
+    wb.save(path)
+
+def make_sms_workbooks(folder: str, n_servers: int) -> List[str]:
+    """
+    folder 에 SMS 내보내기 Excel 3종을 만들고 경로 리스트 반환 (이미 있으면 재사용).
+    """
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for seed, (name, metrics) in enumerate(SMS_METRICS.items()):
+        path = os.path.join(folder, name)
+        if not os.path.exists(path):
+            make_sms_workbook(path, n_servers, metrics, seed=seed)
+        paths.append(path)
+    return paths
+
+
+# -----------------------------
+# 원시 시계열 CSV
+# -----------------------------
+RAW_SERIES_FILES = ["CPU Used (%).csv", "MEM Used (%).csv", "In bps (bps).csv", "Out bps (bps).csv", "파일시스템 사용률 (%).csv"]
+
+def make_raw_series(folder: str, n_servers: int, n_points: int = 8640, seed: int = 0) -> List[str]:
+    """
+    folder 에 지표별 원시 시계열 CSV(첫 열 시각, 서버별 열)를 만들고 경로 리스트 반환 (이미 있으면 재사용).
+    기본 8640 시점 = 한 달 5분 간격. 값의 1% 는 빈 칸(결측).
+    """
+    import numpy as np
+
+    os.makedirs(folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    header = ["시각"] + [f"server-{i:04d} ({10 + i // 62500}.{i // 250 % 250}.{i % 250}.{1 + i % 200})"
+                         for i in range(n_servers)]
+    times = [f"2025-01-{1 + m // 288:02d} {m % 288 // 12:02d}:{m % 12 * 5:02d}" for m in range(n_points)]
+
+    paths = []
+    for k, name in enumerate(RAW_SERIES_FILES):
+        path = os.path.join(folder, name)
+        paths.append(path)
+        if os.path.exists(path):
+            continue
+        scale = 1e6 if "bps" in name else 100.0
+        values = rng.random((n_points, n_servers)) * scale
+        cells = np.char.mod("%.2f", values)
+        cells[rng.random(values.shape) < 0.01] = ""
+        with open(path, "w", encoding="utf-8-sig") as f:
+            f.write(",".join(header) + "\n")
+            for t, row in zip(times, cells):
+                f.write(t + "," + ",".join(row) + "\n")
+    return paths
+
+
+# -----------------------------
+# PPT 템플릿
+# -----------------------------
+def make_template(path: str):
+    """
+    본문(template02) 형태: 14행 x 5열 표 + '날짜' 도형이 있는 슬라이드 1장.
+    """
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # 빈 레이아웃
+    table = slide.shapes.add_table(14, 5, Cm(1), Cm(2), Cm(23), Cm(16)).table
+    for c, w in enumerate([3, 5, 5, 5, 5]):
+        table.columns[c].width = Cm(w)
+    date_box = slide.shapes.add_textbox(Cm(1), Cm(0.5), Cm(8), Cm(1))
+    date_box.name = "날짜"
+    date_box.text_frame.text = "(기간: )"
+    prs.save(path)
+
+def _add_text_slide(prs, texts: dict):
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for k, (name, text) in enumerate(texts.items()):
+        box = slide.shapes.add_textbox(Cm(2), Cm(4 + k * 2), Cm(15), Cm(1.5))
+        box.name = name
+        box.text_frame.text = text
+    return slide
+
+def make_front_template(path: str):
+    """
+    앞(template01) 형태: '기관명'/'날짜' 도형이 있는 표지 + 목차 슬라이드.
+    """
+    prs = Presentation()
+    _add_text_slide(prs, {"기관명": "기관명", "날짜": "날짜"})
+    _add_text_slide(prs, {"목차": "목차"})
+    prs.save(path)
+
+def make_back_template(path: str):
+    """
+    뒤(template03) 형태: 마무리 슬라이드 1장.
+    """
+    prs = Presentation()
+    _add_text_slide(prs, {"마무리": "감사합니다"})
+    prs.save(path)
+
+def make_templates(folder: str) -> Tuple[str, str, str]:
+    os.makedirs(folder, exist_ok=True)
+    front = os.path.join(folder, "template01.pptx")
+    body = os.path.join(folder, "template02.pptx")
+    back = os.path.join(folder, "template03.pptx")
+    make_front_template(front)
+    make_template(body)
+    make_back_template(back)
+    return front, body, back
+
+def make_combined_template(folder: str) -> Tuple[str, int, int]:
+    """
+    pptx_merger 없이 앞/본문/뒤 슬라이드를 한 덱에 담은 병합 템플릿 형태를 만든다.
+    return: (경로, 본문 시작 index, 본문 슬라이드 수)
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, "combined.pptx")
+    make_template(path)
+
+    prs = Presentation(path)
+    _add_text_slide(prs, {"기관명": "기관명", "날짜": "날짜"})
+    _add_text_slide(prs, {"목차": "목차"})
+    _add_text_slide(prs, {"마무리": "감사합니다"})
+
+    # [본문, 표지, 목차, 마무리] → [표지, 목차, 본문, 마무리]
+    sld_id_lst = prs.slides._sldIdLst
+    body, cover, toc, back = list(sld_id_lst)
+    for el in (body, cover, toc, back):
+        sld_id_lst.remove(el)
+    for el in (cover, toc, body, back):
+        sld_id_lst.append(el)
+    prs.save(path)
+    return path, 2, 1
+
+
+# -----------------------------
+# ServerReport
+# -----------------------------
+def make_reports(n: int) -> List[ServerReport]:
+    reports = []
+    for i in range(n):
+        def block(metrics):
+            stats = {m: Stats(min=f"{i % 10}.10", max=f"{i % 90}.90", avg=f"{i % 50}.50") for m in metrics}
+            return MetricBlock(stats_by_metric=stats, images=[make_png(i * 3 + len(metrics))])
+        reports.append(ServerReport(
+            server_name=f"server-{i:04d}",
+            cpu_mem=block(SMS_METRICS[CPU_MEM_XLSX]),
+            network=block(SMS_METRICS[NETWORK_XLSX]),
+            filesystem=block(SMS_METRICS[FS_XLSX]),
+        ))
+    return reports
@@ -0,0 +1,233 @@
+"""
+월간보고서 생성기 합성 워크로드 벤치마크.
+fixtures.py 로 만든 SMS Excel/템플릿을 입력으로 아래 단계를 서버 수별로 측정합니다.
+  parse    : parse_excel_as_blocks (Excel 3종)
+  build    : build_ppt_from_template
+  merge    : merge_ppts_with_merger (pptx_merger 가 없으면 건너뜀)
+  copy     : copy_pptx_to_multiple_names (기관 15곳)
+  fan_out  : fan_out_agency_pptx (기관 15곳)
+  charts   : apply_series_charts (원시 시계열 한 달치로 서버별 그래프 3장)
+각 측정은 새 프로세스에서 실행하여 wall time, 최대 RSS, 결과 파일 크기를 기록하고,
+저장된 baseline 과 비교해 허용 범위를 넘으면 회귀로 표시합니다(종료 코드 1).
+
+사용법:
+  python benchmarks/run_benchmarks.py                      # 10, 100, 1000 대 측정 후 baseline 비교
+  python benchmarks/run_benchmarks.py --sizes 10 100 --cases parse build
+  python benchmarks/run_benchmarks.py --save-baseline      # 현재 결과를 baseline 으로 저장
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import fixtures
+from report_trace import _peak_rss_mb
+
+DEFAULT_SIZES = [10, 100, 1000]
+CASES = ["parse", "build", "merge", "copy", "fan_out", "charts"]
+AGENCIES = [f"기관{i:02d}" for i in range(1, 16)]
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_WORK_DIR = os.path.join(BENCH_DIR, ".fixtures")
+# charts 측정의 그래프 크기 (템플릿 그래프 칸 약 20cm x 5cm 를 200 DPI 로 환산)
+CHART_SIZE_PX = (1575, 390)
+
+
+# -----------------------------
+# 측정 대상 (각 함수는 새 프로세스에서 실행)
+# -----------------------------
+def _reports_from_workbooks(paths):
+    from create_report_gyeongbuk import MetricBlock, ServerReport, parse_excel_files
+
+    cpu_mem, net, fs = parse_excel_files(paths, parallel=False, cache_dir=None)
+    return [
+        ServerReport(
+            server_name=s,
+            cpu_mem=cpu_mem.get(s, MetricBlock({}, [])),
+            network=net.get(s, MetricBlock({}, [])),
+            filesystem=fs.get(s, MetricBlock({}, [])),
+        )
+        for s in sorted(set(cpu_mem) | set(net) | set(fs))
+    ]
+
+def _source_deck(size_dir, templates_dir, reports_fn):
+    """
+    기관별 복사의 원본 덱: merge 결과가 있으면 그것을, 없으면 병합 템플릿 형태에 바로 채운 덱.
+    """
+    merged = os.path.join(size_dir, "merged.pptx")
+    if os.path.exists(merged):
+        return merged
+
+    from xlsx_to_ppt import build_report_deck
+
+    combined, body_start, body_count = fixtures.make_combined_template(templates_dir)
+    deck = os.path.join(size_dir, "deck.pptx")
+    build_report_deck(combined, deck, reports_fn(), "25년 1월", body_start, body_count)
+    return deck
+
+def _run_case(case: str, n: int, work_dir: str) -> dict:
+    size_dir = os.path.join(work_dir, f"n{n}")
+    templates_dir = os.path.join(work_dir, "templates")
+    front, body, back = fixtures.make_templates(templates_dir)
+    workbooks = fixtures.make_sms_workbooks(os.path.join(size_dir, "input"), n)
+    server_report = os.path.join(size_dir, "server_report.pptx")
+    outputs = []
+    output_bytes = None
+
+    if case == "parse":
+        from create_report_gyeongbuk import parse_excel_as_blocks
+
+        t0 = time.perf_counter()
+        for path in workbooks:
+            parse_excel_as_blocks(path)
+        wall = time.perf_counter() - t0
+        outputs = workbooks
+
+    elif case == "build":
+        from xlsx_to_ppt import build_ppt_from_template
+
+        reports = _reports_from_workbooks(workbooks)
+        t0 = time.perf_counter()
+        build_ppt_from_template(body, server_report, reports, "25년 1월")
+        wall = time.perf_counter() - t0
+        outputs = [server_report]
+
+    elif case == "merge":
+        try:
+            import pptx_merger  # noqa: F401  (merge_ppt 는 병합할 때만 불러오므로 미리 확인)
+        except ImportError as e:
+            return {"skipped": f"pptx_merger 를 불러올 수 없습니다: {e}"}
+        from merge_ppt import merge_ppts_with_merger
+
+        if not os.path.exists(server_report):
+            return {"skipped": "build 결과(server_report.pptx)가 없습니다. build 를 먼저 측정하세요."}
+
+        merged = os.path.join(size_dir, "merged.pptx")
+        t0 = time.perf_counter()
+        merge_ppts_with_merger([front, server_report, back], merged)
+        wall = time.perf_counter() - t0
+        outputs = [merged]
+
+    elif case in ("copy", "fan_out"):
+        from duplicate_ppts import copy_pptx_to_multiple_names, fan_out_agency_pptx
+
+        src = _source_deck(size_dir, templates_dir, lambda: _reports_from_workbooks(workbooks))
+        out_dir = os.path.join(size_dir, case)
+        os.makedirs(out_dir, exist_ok=True)
+
+        t0 = time.perf_counter()
+        if case == "copy":
+            for agency in AGENCIES:
+                copy_pptx_to_multiple_names(date="25년 1월", src_pptx=src, target_pptx=agency, output_dir=out_dir)
+        else:
+            fan_out_agency_pptx(date="25년 1월", src_pptx=src, agencies=AGENCIES, output_dir=out_dir)
+        wall = time.perf_counter() - t0
+        outputs = [os.path.join(out_dir, f) for f in os.listdir(out_dir)]
+
+    elif case == "charts":
+        from create_report_gyeongbuk import (MetricBlock, ServerReport, _trim_server_name,
+                                             apply_series_charts, load_series_tables, raw_series_paths)
+
+        fixtures.make_raw_series(os.path.join(size_dir, "input", "raw"), n)
+        tables = load_series_tables(raw_series_paths(os.path.join(size_dir, "input")))
+        reports = [
+            ServerReport(_trim_server_name(s), MetricBlock({}, []), MetricBlock({}, []), MetricBlock({}, []))
+            for s in next(iter(tables.values())).servers
+        ]
+        t0 = time.perf_counter()
+        apply_series_charts(reports, tables, dict.fromkeys(("cpu_mem", "network", "filesystem"), CHART_SIZE_PX))
+        wall = time.perf_counter() - t0
+        output_bytes = sum(len(img) for rep in reports for a in ("cpu_mem", "network", "filesystem")
+                           for img in getattr(rep, a).images)
+
+    else:
+        raise ValueError(f"알 수 없는 측정 항목: {case}")
+
+    return {
+        "wall_s": round(wall, 3),
+        "peak_rss_mb": _peak_rss_mb(),
+        "output_bytes": output_bytes if output_bytes is not None else sum(os.path.getsize(p) for p in outputs),
+    }
+
+def run_case(case: str, n: int, work_dir: str) -> dict:
+    # 최대 RSS 가 이전 측정의 영향을 받지 않도록 측정마다 새 프로세스 사용
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_run_case, case, n, work_dir).result()
+
+
+# -----------------------------
+# baseline 비교
+# -----------------------------
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    baseline 대비 wall time/최대 RSS 가 tolerance 비율 이상 늘어난 항목 목록 반환.
+    """
+    regressions = []
+    for key, cur in results.items():
+        base = baseline.get(key)
+        if not base or "skipped" in cur or "skipped" in base:
+            continue
+        for metric in ("wall_s", "peak_rss_mb"):
+            if cur.get(metric) is None or not base.get(metric):
+                continue
+            ratio = cur[metric] / base[metric]
+            if ratio > 1 + tolerance:
+                regressions.append(f"{key} {metric}: {base[metric]} -> {cur[metric]} (x{ratio:.2f})")
+    return regressions
+
+def print_table(results: dict):
+    print(f"\n{'case':<10} {'servers':>8} {'wall(s)':>10} {'peak RSS(MB)':>13} {'output(MB)':>11}")
+    for key, r in results.items():
+        case, n = key.split("@")
+        if "skipped" in r:
+            print(f"{case:<10} {n:>8}  건너뜀: {r['skipped']}")
+            continue
+        rss = "-" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']:.1f}"
+        print(f"{case:<10} {n:>8} {r['wall_s']:>10.3f} {rss:>13} {r['output_bytes'] / 1024 / 1024:>11.2f}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--work-dir", default=DEFAULT_WORK_DIR, help="합성 입력/출력 파일 위치 (입력은 재사용)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 볼 증가 비율 (기본 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 baseline 으로 저장")
+    args = parser.parse_args()
+
+    results = {}
+    for n in args.sizes:
+        for case in args.cases:
+            print(f"[{case} @ {n}] 측정 중...")
+            results[f"{case}@{n}"] = run_case(case, n, args.work_dir)
+
+    print_table(results)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nbaseline 저장 완료: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nbaseline 이 없습니다: {args.baseline} (--save-baseline 으로 먼저 저장하세요)")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n성능 회귀 감지:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("\nbaseline 대비 회귀 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
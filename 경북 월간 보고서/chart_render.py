@@ -0,0 +1,259 @@
+"""
+원시 시계열로 서버별 그래프 이미지(CPU/MEM, Network In/Out, 파일시스템)를 그리는 렌더러.
+- 슬라이드 그래프 칸(get_table_cell_bbox) 크기에 맞는 픽셀 크기로 바로 그림 → 별도 축소/재압축 불필요
+- 시점이 픽셀보다 훨씬 많으므로 모든 서버를 한 번에 픽셀 열 단위 min/max(envelope)로 줄인 뒤 그림 (NumPy)
+- 배경/테두리/눈금선을 그린 기본 캔버스를 크기별로 한 번만 만들고 복사해서 재사용
+- 고정 팔레트(P 모드)에 바로 그려 RGB → 팔레트 변환 없이 작은 PNG 를 빠르게 인코딩
+- 서버 묶음 단위로 프로세스 풀에서 동시에 렌더링
+Pillow 만 사용하므로 matplotlib 없이 PyInstaller 빌드에 그대로 포함됩니다.
+"""
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# -----------------------------
+# 그래프 모양 (SMS 그래프와 비슷하게)
+# -----------------------------
+BACKGROUND = (255, 255, 255)
+GRID_COLOR = (217, 217, 217)
+AXIS_COLOR = (166, 166, 166)
+TEXT_COLOR = (89, 89, 89)
+SERIES_COLORS = [(31, 119, 180), (255, 127, 14)]   # 첫 번째/두 번째 지표
+LINE_WIDTH = 1
+PNG_COMPRESS_LEVEL = 3                              # 6(기본) 대비 인코딩 2배 빠르고 크기는 비슷
+Y_TICKS = 4                                         # 가로 눈금선 수 (0 제외)
+X_LABELS = 5                                        # 가로축 날짜 표시 수
+
+# 한글/숫자 표시용 글꼴 후보 (없으면 Pillow 기본 글꼴)
+FONT_CANDIDATES = ["malgun.ttf", "C:/Windows/Fonts/malgun.ttf", "NanumGothic.ttf", "DejaVuSans.ttf"]
+
+
+def _font(size: int):
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+# -----------------------------
+# 시계열 → 픽셀 열 envelope
+# -----------------------------
+def envelope(values: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (시점 x 서버) 배열을 (width x 서버) 픽셀 열별 최소/최대 값으로 줄임. 값이 없는 칸은 NaN.
+    시점이 하나도 없으면 (0 x 서버) 빈 배열 (그릴 값이 없는 서버로 처리됨).
+    """
+    n = values.shape[0]
+    if n == 0:
+        empty = np.empty((0,) + values.shape[1:])
+        return empty, empty.copy()
+    width = max(1, min(width, n))
+    starts = np.linspace(0, n, width, endpoint=False).astype(np.intp)
+    with np.errstate(invalid="ignore"):
+        # fmin/fmax 는 NaN 을 건너뛰므로 결측 구간이 섞여도 남은 값으로 계산
+        lo = np.fmin.reduceat(values, starts, axis=0)
+        hi = np.fmax.reduceat(values, starts, axis=0)
+    return lo, hi
+
+def nice_ceiling(value: float) -> float:
+    """
+    눈금이 딱 떨어지도록 value 이상인 1/2/2.5/5 x 10^k 값.
+    """
+    if not value or value <= 0 or math.isnan(value):
+        return 1.0
+    exp = math.floor(math.log10(value))
+    for step in (1, 2, 2.5, 5, 10):
+        nice = step * 10 ** exp
+        if nice >= value:
+            return nice
+    return 10 ** (exp + 1)
+
+def format_tick(value: float, percent: bool) -> str:
+    if percent:
+        return f"{value:g}%"
+    for unit, scale in (("G", 1e9), ("M", 1e6), ("K", 1e3)):
+        if abs(value) >= scale:
+            return f"{value / scale:.4g}{unit}"
+    return f"{value:.4g}"
+
+
+# 팔레트 인덱스 (P 모드 이미지에 색 대신 인덱스로 그림)
+_PALETTE_COLORS = [BACKGROUND, GRID_COLOR, AXIS_COLOR, TEXT_COLOR] + SERIES_COLORS
+_BG, _GRID, _AXIS, _TEXT = range(4)
+_SERIES = list(range(4, len(_PALETTE_COLORS)))
+_PALETTE = [v for rgb in _PALETTE_COLORS for v in rgb]
+
+
+# -----------------------------
+# 그래프 한 장
+# -----------------------------
+_BASE_CACHE: Dict[Tuple[int, int], Tuple[Image.Image, Tuple[int, int, int, int], object]] = {}
+
+def _layout(width: int, height: int):
+    """
+    그래프 크기에 맞는 글꼴과 플롯 영역 (left, top, right, bottom).
+    """
+    font = _font(max(9, height // 14))
+    margin_left = max(40, int(font.getlength("000.0M")) + 10)
+    # 위쪽은 범례 한 줄 + 맨 위 눈금 글자 절반, 아래쪽은 날짜 한 줄
+    margin_top = max(12, int(font.size * 1.9))
+    margin_bottom = max(14, int(font.size * 1.4))
+    return font, (margin_left, margin_top, width - 8, height - margin_bottom)
+
+def _base_canvas(width: int, height: int):
+    """
+    크기별 기본 캔버스(배경/플롯 테두리/가로 눈금선)와 플롯 영역, 글꼴. 프로세스마다 한 번만 만듦.
+    """
+    key = (width, height)
+    if key not in _BASE_CACHE:
+        font, plot = _layout(width, height)
+        img = Image.new("P", (width, height), _BG)
+        img.putpalette(_PALETTE)
+        draw = ImageDraw.Draw(img)
+        left, top, right, bottom = plot
+        for k in range(1, Y_TICKS + 1):
+            y = bottom - (bottom - top) * k / Y_TICKS
+            draw.line([(left, y), (right, y)], fill=_GRID)
+        draw.line([(left, top), (left, bottom), (right, bottom)], fill=_AXIS)
+        _BASE_CACHE[key] = (img, plot, font)
+    return _BASE_CACHE[key]
+
+_TEXT_CACHE: Dict[tuple, Tuple[Image.Image, Tuple[int, int]]] = {}
+
+def _draw_text(img, xy, text: str, font, anchor: str = "la"):
+    """
+    글자 모양(mask)을 (글꼴 크기, 문자열, 기준점)별로 한 번만 렌더링해 두고 붙여 넣음.
+    눈금/날짜/범례 문자열은 서버마다 거의 같아서 글꼴 렌더링 비용이 대부분 사라집니다.
+    """
+    key = (font.size, text, anchor)
+    if key not in _TEXT_CACHE:
+        x0, y0, x1, y1 = font.getbbox(text, anchor=anchor)
+        mask = Image.new("1", (max(1, x1 - x0), max(1, y1 - y0)), 0)
+        ImageDraw.Draw(mask).text((-x0, -y0), text, fill=1, font=font, anchor=anchor)
+        _TEXT_CACHE[key] = (mask, (x0, y0))
+    mask, (dx, dy) = _TEXT_CACHE[key]
+    img.paste(_TEXT, (round(xy[0]) + dx, round(xy[1]) + dy), mask)
+
+def render_chart(size: Tuple[int, int], series: Sequence[Tuple[str, np.ndarray, np.ndarray]],
+                 y_max: float, percent: bool, x_labels: Sequence[Tuple[float, str]]) -> bytes:
+    """
+    series: [(범례 이름, 픽셀 열별 최소, 최대)], x_labels: [(0~1 가로 위치, 표시 문자열)]
+    return: PNG 바이트
+    """
+    base, (left, top, right, bottom), font = _base_canvas(*size)
+    img = base.copy()
+    draw = ImageDraw.Draw(img)
+    plot_w = right - left
+    plot_h = bottom - top
+
+    # 눈금 문자열
+    for k in range(Y_TICKS + 1):
+        y = bottom - plot_h * k / Y_TICKS
+        label = format_tick(y_max * k / Y_TICKS, percent)
+        _draw_text(img, (left - 4, y), label, font, anchor="rm")
+    for pos, label in x_labels:
+        # 양 끝 날짜는 그래프 밖으로 잘리지 않게 안쪽으로 정렬
+        anchor = "la" if pos <= 0 else "ra" if pos >= 1 else "ma"
+        _draw_text(img, (left + plot_w * pos, bottom + 2), label, font, anchor=anchor)
+
+    # 선: 픽셀 열마다 최소→최대로 이어 그려 구간 안의 변동(envelope)이 보이게 함
+    for idx, (name, lo, hi) in enumerate(series):
+        color = _SERIES[idx % len(_SERIES)]
+        xs = left + np.arange(len(lo)) * (plot_w / max(1, len(lo) - 1))
+        y_lo = bottom - np.clip(lo / y_max, 0, 1) * plot_h
+        y_hi = bottom - np.clip(hi / y_max, 0, 1) * plot_h
+        valid = ~np.isnan(lo)
+        # 결측 구간에서 선을 끊어 구간별로 그림
+        breaks = np.flatnonzero(np.diff(valid.astype(np.int8)) != 0) + 1
+        for seg in np.split(np.arange(len(lo)), breaks):
+            if len(seg) == 0 or not valid[seg[0]]:
+                continue
+            pts = np.empty((len(seg) * 2, 2))
+            pts[0::2, 0] = pts[1::2, 0] = xs[seg]
+            pts[0::2, 1] = y_lo[seg]
+            pts[1::2, 1] = y_hi[seg]
+            draw.line(pts.ravel().tolist(), fill=color, width=LINE_WIDTH)
+
+        # 범례
+        lx = left + 6 + idx * (font.getlength(name) + 28)
+        ly = 2
+        draw.rectangle([lx, ly + 2, lx + 10, ly + font.size - 1], fill=color)
+        _draw_text(img, (lx + 14, ly), name, font)
+
+    bio = io.BytesIO()
+    img.save(bio, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return bio.getvalue()
+
+def _render_many(jobs: List[tuple]) -> List[bytes]:
+    # 프로세스 풀 worker 용: 같은 worker 안에서는 기본 캔버스를 재사용
+    return [render_chart(*job) for job in jobs]
+
+
+# -----------------------------
+# 전체 서버
+# -----------------------------
+def _x_labels(times: Sequence[str]) -> List[Tuple[float, str]]:
+    if not times:
+        return []
+    labels = []
+    for k in range(X_LABELS):
+        pos = k / (X_LABELS - 1) if X_LABELS > 1 else 0
+        text = str(times[min(len(times) - 1, int(pos * (len(times) - 1)))]).split(" ")[0]
+        labels.append((pos, text[-5:]))
+    return labels
+
+def render_server_charts(charts: Dict[str, Tuple[Tuple[int, int], bool, List[Tuple[str, object]]]],
+                         servers: Sequence[str], server_key=None,
+                         parallel: bool = True) -> Dict[str, Dict[str, bytes]]:
+    """
+    charts: {그래프 이름: ((너비 px, 높이 px), 백분율 여부, [(범례 이름, SeriesTable)])}
+    servers: 그릴 서버명. server_key 가 있으면 SeriesTable 헤더의 서버명을 server_key(헤더)로 바꿔 대조.
+    return: {서버명: {그래프 이름: PNG 바이트}}. 어느 지표에도 값이 없는 그래프는 빠짐.
+    """
+    jobs, owners = [], []
+    for name, (size, percent, tables) in charts.items():
+        _, (left, _, right, _) = _layout(*size)
+        plot_w = right - left + 1
+        prepared = []
+        for label, table in tables:
+            lo, hi = envelope(table.values, plot_w)
+            cols = {(server_key(s) if server_key else s): i for i, s in enumerate(table.servers)}
+            prepared.append((label, lo, hi, cols, _x_labels(table.times)))
+
+        for server in servers:
+            series = []
+            peak = 0.0
+            x_labels = []
+            for label, lo, hi, cols, xl in prepared:
+                col = cols.get(server)
+                if col is None or np.isnan(hi[:, col]).all():
+                    continue
+                series.append((label, lo[:, col], hi[:, col]))
+                peak = max(peak, float(np.nanmax(hi[:, col])))
+                x_labels = x_labels or xl
+            if not series:
+                continue
+            y_max = 100.0 if percent and peak <= 100 else nice_ceiling(peak)
+            jobs.append((size, series, y_max, percent, x_labels))
+            owners.append((server, name))
+
+    workers = os.cpu_count() or 1
+    if parallel and len(jobs) > 1 and workers > 1:
+        chunk = max(1, math.ceil(len(jobs) / (workers * 4)))
+        batches = [jobs[i:i + chunk] for i in range(0, len(jobs), chunk)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            images = [png for batch in pool.map(_render_many, batches) for png in batch]
+    else:
+        images = _render_many(jobs)
+
+    result: Dict[str, Dict[str, bytes]] = {}
+    for (server, name), png in zip(owners, images):
+        result.setdefault(server, {})[name] = png
+    return result
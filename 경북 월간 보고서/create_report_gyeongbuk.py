@@ -1,18 +1,29 @@
 import re
 import io
 import os
-from datetime import date
-from dateutil.relativedelta import relativedelta
+import sys
+import shutil
+import json
+import time
+import argparse
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
-from xlsx_to_ppt import build_ppt_from_template
-from openpyxl import load_workbook
-from merge_ppt import merge_ppts_with_merger
-
-from duplicate_ppts import copy_pptx_to_multiple_names
-
-from select_folder_file import select_folder
+from typing import Dict, List, Optional, Tuple, Union
+
+# pptx/openpyxl/dateutil/pptx_merger/tkinter 는 시작 속도(PyInstaller 빌드 포함)를 위해
+# 모듈 최상단이 아니라 실제로 쓰는 단계의 함수 안에서 import 합니다.
+# (benchmarks/check_import_time.py 가 시작 시 import 되지 않는지와 import 시간 예산을 확인)
+import report_trace
+from report_trace import Tracer
+from parse_cache import cache_key, evict_cache, file_sha256, load_cached, store_cached
+from report_manifest import deck_hash, load_manifest, output_entry, plan_deck, save_manifest, server_report_hash, stale_outputs
+from xlsx_stream import ImageAnchor, ImageRef, PresizedImage, find_sheet_part, iter_rows, read_image_anchors, read_shared_strings
+from xlsx_project import drop_columns_inplace
 
 # -----------------------------
 # 0) 사용자 환경에 맞게 수정할 설정
@@ -20,8 +31,12 @@ from select_folder_file import select_folder
 CPU_MEM_XLSX = "[SMS] CPU Used (%), MEM Used (%).xlsx"
 NETWORK_XLSX = "[SMS] Network Traffic - In bps (bps), Out bps (bps).xlsx"
 FS_XLSX = "[SMS] Storage - 파일시스템 사용률 (%).xlsx"
-REPORT_OUTPUT_PPTX = "server_report.pptx"
+FRONT_TEMPLATE_PPTX = "template01.pptx"
 TEMPLATE_PPTX = "template02.pptx"
+BACK_TEMPLATE_PPTX = "template03.pptx"
+
+# 슬라이드에 넣는 그래프 이미지 해상도(DPI). None 이면 원본 이미지를 그대로 사용
+IMAGE_DPI = 200
 
 # 서버 블록을 찾을 때 사용할 패턴 (예: bastion-lnx (172.25.0.74))
 SERVER_NAME_PATTERN = re.compile(r".+\(\s*\d{1,3}(?:\.\d{1,3}){3}\s*\)")
@@ -30,6 +45,40 @@ SERVER_NAME_PATTERN = re.compile(r".+\(\s*\d{1,3}(?:\.\d{1,3}){3}\s*\)")
 # Excel 레이아웃에 따라 필요 시 늘리세요.
 DEFAULT_BLOCK_HEIGHT = 60
 
+# Min/Max/Avg 헤더를 찾을 때 살펴볼 최대 열 수
+MAX_SCAN_COLUMN = 30
+
+# 파싱 결과 캐시 (입력 xlsx 내용이 같으면 재실행 시 파싱 생략)
+# 파싱 로직을 바꾸면 PARSER_VERSION 을 올려 기존 캐시를 무효화하세요.
+PARSE_CACHE_DIR = ".parse_cache"
+PARSE_CACHE_MAX_AGE_DAYS = 62
+PARSER_VERSION = 2
+
+# 원시 시계열(수집 주기별 값) CSV 위치: 입력 디렉토리 하위 폴더.
+# 지표별 CSV 가 있으면 요약표 대신 원시 데이터로 min/max/avg(와 p95/p99)를 계산합니다.
+# CSV 형식: 첫 행은 "시각,서버1,서버2,..." 헤더, 이후 행마다 수집 시각과 서버별 값 (빈 칸은 결측)
+RAW_SERIES_DIR = "raw"
+RAW_SERIES_FILES = {
+    "cpu_mem": {"● CPU Used (%)": "CPU Used (%).csv", "● MEM Used (%)": "MEM Used (%).csv"},
+    "network": {"● In bps (bps)": "In bps (bps).csv", "● Out bps (bps)": "Out bps (bps).csv"},
+    "filesystem": {"● 파일시스템 사용률 (%)": "파일시스템 사용률 (%).csv"},
+}
+
+# 원시 시계열이 있으면 SMS Excel 에 붙은 그래프 대신 원시 데이터로 그래프를 직접 그려 넣을지 여부
+# (그래프 칸 크기에 맞춰 그리므로 이미지 축소가 필요 없고, 서버 수백 대도 몇 초 안에 그림)
+RENDER_RAW_CHARTS = True
+# IMAGE_DPI 가 None(원본 그대로)일 때 그래프를 그릴 해상도
+DEFAULT_CHART_DPI = 200
+
+# 증분 재생성 상태(manifest, 월간보고서 덱)를 저장할 출력 디렉토리 하위 폴더
+REPORT_STATE_DIR = ".report_state"
+
+# 기관별 PPT 를 만들 기관 목록 (배치 manifest 에서 agencies 를 생략하면 이 목록 사용)
+DEFAULT_AGENCIES = ["경북농식품유통교육진흥원","경북문화재단","경북바이오산업연구원","경북여성정책개발원","경북종합자원봉사센터","경북행복재단","경상북도경제진흥원","경상북도교통문화연수원","경상북도인재평생교육재단","경상북도장애인체육회","경상북도호국보훈재단","경상북도환경연수원","독도재단","새마을재단","한국국학진흥원"]
+
+# 실행 계측: cProfile 로 프로파일링할 단계 ("parse", "merge", "build", "agency_copy" 중 하나, None 이면 안 함)
+PROFILE_STAGE = None
+
 # Min/Max/Avg 라벨 후보 (영/한 혼용 대응)
 LABEL_MIN = {"min", "minimum", "최소"}
 LABEL_MAX = {"max", "maximum", "최대"}
@@ -43,12 +92,17 @@ class Stats:
     min: Optional[float] = None
     max: Optional[float] = None
     avg: Optional[float] = None
+    # 원시 시계열이 있을 때만 채워짐 (슬라이드 표에는 min/max/avg 만 표시)
+    p95: Optional[float] = None
+    p99: Optional[float] = None
 
 @dataclass
 class MetricBlock:
     # CPU/MEM 은 2개 지표, Network는 IN/OUT 2개 지표 등 복수 가능
     stats_by_metric: Dict[str, Stats]     # e.g. {"CPU": Stats(...), "MEM": Stats(...)}
-    images: List[bytes]                  # 이미지(PNG/JPG 바이너리). 블록 내 이미지 순서대로 담김
+    # 이미지(PNG/JPG 바이너리 또는 xlsx 안 위치 ImageRef). 블록 내 이미지 순서대로 담김
+    # 스트리밍 파싱은 ImageRef 만 담고, 바이너리는 슬라이드에 넣을 때 읽습니다 (xlsx_stream.image_bytes)
+    images: List[Union[bytes, ImageRef]]
 
 @dataclass
 class ServerReport:
@@ -60,13 +114,21 @@ class ServerReport:
 # -----------------------------
 # 2) 원하는 column 삭제
 # -----------------------------
-def delete_columns(files, columns_to_delete):
-    for file in files:
-        wb = load_workbook(file)
-        ws = wb.active
-        for col in sorted(columns_to_delete, reverse=True):
-            ws.delete_cols(col)
-        wb.save(file)
+def delete_columns(files, columns_to_delete, parallel: bool = True):
+    """
+    각 파일의 활성 시트에서 columns_to_delete(1-based 열 번호)를 한 번에 삭제 (제자리 수정).
+    openpyxl delete_cols 처럼 열마다 셀을 옮기지 않고 시트 XML 을 한 번만 스트리밍으로 다시 쓰며,
+    병합 셀 범위와 그림 앵커도 함께 보정합니다. 파일끼리는 독립적이므로 프로세스 풀에서 동시에 처리.
+    """
+    columns = sorted(set(columns_to_delete))
+    if not parallel or len(files) < 2:
+        for file in files:
+            drop_columns_inplace(file, columns)
+        return
+
+    workers = min(len(files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(drop_columns_inplace, files, [columns] * len(files)))
 
 # -----------------------------
 # 2) Excel 파싱 유틸
@@ -82,13 +144,13 @@ def _is_server_header(value) -> bool:
     s = str(value).strip()
     return bool(SERVER_NAME_PATTERN.fullmatch(s))
 
-def _scan_server_headers(ws, header_col=1) -> List[Tuple[str, int]]:
+def _scan_server_headers(grid: "SheetGrid", header_col=1) -> List[Tuple[str, int]]:
     """
     A열(기본)에서 서버 헤더 행을 찾고 [(서버명, 행번호)] 리스트 반환.
     """
     found = []
-    for row in range(1, ws.max_row + 1):
-        v = ws.cell(row=row, column=header_col).value
+    for row in grid.row_numbers():
+        v = grid.row(row).get(header_col)
         if _is_server_header(v):
             found.append((str(v).strip(), row))
     return found
@@ -98,36 +160,138 @@ def _block_end(start_row: int, next_start_row: Optional[int], default_height: in
         return next_start_row - 1
     return start_row + default_height
 
-def _extract_images_in_row_range(ws, row_start: int, row_end: int) -> List[bytes]:
+class ImageRowIndex:
     """
-    openpyxl로 추출 가능한 삽입 이미지들을 row_start~row_end 범위에서 찾아 bytes로 반환.
+    시트의 이미지 앵커를 (시작 행, 시작 열) 순으로 한 번만 정렬해 두고,
+    서버 블록의 행 범위로 이분 탐색하여 O(log n + k)에 조회하는 인덱스.
+    items: [(ImageAnchor, payload)] — payload 는 openpyxl Image 또는 zip 내부 media 경로
     """
-    images_bytes: List[bytes] = []
+    def __init__(self, items: List[Tuple[ImageAnchor, object]]):
+        # 정렬 키가 같으면 drawing 에 들어있던 순서를 유지 (sorted 는 안정 정렬)
+        self._items = sorted(items, key=lambda it: (it[0].row, it[0].col))
+        self._rows = [a.row for a, _ in self._items]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def lookup(self, row_start: int, row_end: int) -> List[Tuple[ImageAnchor, object]]:
+        """
+        시작 행이 row_start~row_end 에 있는 이미지를 위→아래, 왼쪽→오른쪽 순서로 반환.
+        """
+        lo = bisect_left(self._rows, row_start)
+        hi = bisect_right(self._rows, row_end)
+        return self._items[lo:hi]
+
+def _index_sheet_images(ws) -> ImageRowIndex:
+    """
+    openpyxl 워크시트의 삽입 이미지(ws._images) 앵커를 한 번 읽어 ImageRowIndex 로 만든다.
+    """
+    items = []
     imgs = getattr(ws, "_images", []) or []
     for img in imgs:
         try:
             anchor = img.anchor
             # OneCellAnchor / TwoCellAnchor 모두 _from 을 가짐
-            r = anchor._from.row + 1  # 0-based -> 1-based
+            frm = anchor._from
+            item = ImageAnchor(row=frm.row + 1, col=frm.col + 1)  # 0-based -> 1-based
         except Exception:
             continue
 
-        if row_start <= r <= row_end:
-            bio = io.BytesIO()
-            # openpyxl Image는 PIL 이미지 또는 원본을 internal로 가짐.
-            # _data()가 있으면 가장 안전.
-            if hasattr(img, "_data") and callable(img._data):
-                images_bytes.append(img._data())
-            else:
-                # fallback: PIL로 저장 시도
-                try:
-                    img.image.save(bio, format="PNG")
-                    images_bytes.append(bio.getvalue())
-                except Exception:
-                    pass
+        to = getattr(anchor, "to", None)
+        if to is not None:
+            item.to_row, item.to_col = to.row + 1, to.col + 1
+        ext = getattr(anchor, "ext", None)
+        if ext is not None:
+            item.cx, item.cy = ext.cx, ext.cy
+
+        items.append((item, img))
+    return ImageRowIndex(items)
+
+def _extract_images_in_row_range(index: ImageRowIndex, row_start: int, row_end: int) -> List[bytes]:
+    """
+    openpyxl로 추출 가능한 삽입 이미지들을 row_start~row_end 범위에서 찾아 bytes로 반환.
+    """
+    images_bytes: List[bytes] = []
+    for _, img in index.lookup(row_start, row_end):
+        bio = io.BytesIO()
+        # openpyxl Image는 PIL 이미지 또는 원본을 internal로 가짐.
+        # _data()가 있으면 가장 안전.
+        if hasattr(img, "_data") and callable(img._data):
+            images_bytes.append(img._data())
+        else:
+            # fallback: PIL로 저장 시도
+            try:
+                img.image.save(bio, format="PNG")
+                images_bytes.append(bio.getvalue())
+            except Exception:
+                pass
     return images_bytes
 
-def _try_parse_stats_table(ws, row_start: int, row_end: int) -> Dict[str, Stats]:
+_LABEL_KINDS = (("min", LABEL_MIN), ("max", LABEL_MAX), ("avg", LABEL_AVG))
+
+class SheetGrid:
+    """
+    시트 값을 한 번만 읽어 둔 격자({행: {열: 값}}, 값 있는 셀만)와
+    정규화 라벨(LABEL_MIN/MAX/AVG) -> [(행, 열)] 인덱스.
+    라벨이 2종류 이상 있는 행을 "Min/Max/Avg 헤더 행" 후보로 미리 정렬해 두어,
+    블록의 헤더 행 찾기는 이분 탐색 한 번으로 끝납니다.
+    """
+    def __init__(self):
+        self._rows: Dict[int, Dict[int, object]] = {}
+        self.label_index: Dict[str, List[Tuple[int, int]]] = {k: [] for k, _ in _LABEL_KINDS}
+        self._header_rows: List[int] = []
+        self._header_cols: Dict[int, Dict[str, int]] = {}
+
+    @classmethod
+    def from_worksheet(cls, ws, max_col: int = MAX_SCAN_COLUMN) -> "SheetGrid":
+        grid = cls()
+        max_col = min(ws.max_column, max_col)
+        for r, row_vals in enumerate(ws.iter_rows(max_col=max_col, values_only=True), start=1):
+            grid.add_row(r, {c: v for c, v in enumerate(row_vals, start=1) if v is not None})
+        return grid
+
+    def add_row(self, r: int, cells: Dict[int, object]):
+        """
+        행을 격자에 넣으면서 라벨 인덱스/헤더 행 후보를 갱신. 행은 오름차순으로 넣어야 합니다.
+        """
+        if not cells:
+            return
+        self._rows[r] = cells
+
+        # 종류별로 가장 왼쪽 라벨 열만 사용 (기존 find_col 과 동일)
+        cols: Dict[str, int] = {}
+        for c in sorted(cells):
+            v = cells[c]
+            if not isinstance(v, str):
+                continue
+            norm = _normalize_label(v)
+            for kind, candidates in _LABEL_KINDS:
+                if kind not in cols and norm in candidates:
+                    cols[kind] = c
+                    self.label_index[kind].append((r, c))
+
+        # 최소한 2개 이상 잡히면 "헤더 행"으로 간주
+        if len(cols) >= 2:
+            self._header_rows.append(r)
+            self._header_cols[r] = cols
+
+    def row(self, r: int) -> Dict[int, object]:
+        return self._rows.get(r) or {}
+
+    def row_numbers(self) -> List[int]:
+        return list(self._rows)
+
+    def find_header_row(self, row_start: int, row_end: int) -> Optional[Tuple[int, Dict[str, int]]]:
+        """
+        row_start~row_end 안의 첫 번째 Min/Max/Avg 헤더 행과 {"min": 열, "max": 열, "avg": 열} 반환.
+        """
+        i = bisect_left(self._header_rows, row_start)
+        if i < len(self._header_rows) and self._header_rows[i] <= row_end:
+            r = self._header_rows[i]
+            return r, self._header_cols[r]
+        return None
+
+def _try_parse_stats_table(grid: SheetGrid, row_start: int, row_end: int) -> Dict[str, Stats]:
     """
     블록 내에서 '지표명 / Min / Max / Avg' 형태를 휴리스틱으로 파싱.
     - 지표명은 좌측(예: B열)이나 첫 번째 컬럼에 있을 수 있어, 행 단위로 탐색합니다.
@@ -136,41 +300,19 @@ def _try_parse_stats_table(ws, row_start: int, row_end: int) -> Dict[str, Stats]
     """
     stats_by_metric: Dict[str, Stats] = {}
 
-    # 1) "Min/Max/Avg" 헤더가 있는 행을 찾는다.
-    header_row = None
-    header_cols = {}  # {"min": col, "max": col, "avg": col}
-    for r in range(row_start, min(row_end, ws.max_row) + 1):
-        row_vals = [ws.cell(row=r, column=c).value for c in range(1, min(ws.max_column, 30) + 1)]
-        norm = [_normalize_label(v) for v in row_vals]
-
-        def find_col(candidates: set) -> Optional[int]:
-            for idx, val in enumerate(norm, start=1):
-                if val in candidates:
-                    return idx
-            return None
-
-        cmin = find_col(LABEL_MIN)
-        cmax = find_col(LABEL_MAX)
-        cavg = find_col(LABEL_AVG)
-
-        # 최소한 2개 이상 잡히면 "헤더 행"으로 간주
-        hit = sum(x is not None for x in [cmin, cmax, cavg])
-        if hit >= 2:
-            header_row = r
-            if cmin: header_cols["min"] = cmin
-            if cmax: header_cols["max"] = cmax
-            if cavg: header_cols["avg"] = cavg
-            break
-
-    if header_row is None:
+    # 1) "Min/Max/Avg" 헤더가 있는 행을 찾는다. (SheetGrid 의 라벨 인덱스 사용)
+    found = grid.find_header_row(row_start, row_end)
+    if found is None:
         return stats_by_metric  # 못 찾으면 빈 dict 반환
+    header_row, header_cols = found
 
     # 2) 헤더 바로 아래 몇 줄을 지표 행으로 파싱 (빈 줄/다음 섹션 만나면 중단)
     for r in range(header_row + 1, min(header_row + 15, row_end) + 1):
-        metric_name = ws.cell(row=r, column=1).value  # 기본: A열에 지표명
+        row_vals = grid.row(r)
+        metric_name = row_vals.get(1)  # 기본: A열에 지표명
         if metric_name is None:
             # A열이 비었는데 B열에 지표명이 있을 수 있음
-            metric_name = ws.cell(row=r, column=2).value
+            metric_name = row_vals.get(2)
 
         if metric_name is None:
             continue
@@ -183,10 +325,7 @@ def _try_parse_stats_table(ws, row_start: int, row_end: int) -> Dict[str, Stats]
         # 숫자값 추출
         st = Stats()
         for k, c in header_cols.items():
-            val = ws.cell(row=r, column=c).value
-            if val is None:
-                val = None
-            setattr(st, k, val)
+            setattr(st, k, row_vals.get(c))
 
         # "의미있는 값"이 하나라도 있으면 등록
         if any(getattr(st, k) is not None for k in ["min", "max", "avg"]):
@@ -195,89 +334,503 @@ def _try_parse_stats_table(ws, row_start: int, row_end: int) -> Dict[str, Stats]
 
     return stats_by_metric
 
-def parse_excel_as_blocks(xlsx_path: str, sheet_name: Optional[str] = None,
-                          default_height: int = DEFAULT_BLOCK_HEIGHT) -> Dict[str, MetricBlock]:
-    """
-    Excel 한 파일을 서버명 기준 MetricBlock으로 파싱하여 dict 반환.
-    """
+def _trim_server_name(server: str) -> str:
+    return re.sub(r'^\s*■\s*|\s*\([^)]*\)\s*$', '', server).strip()
+
+def _parse_excel_as_blocks_openpyxl(xlsx_path: str, sheet_name: Optional[str],
+                                    default_height: int) -> Dict[str, MetricBlock]:
+    from openpyxl import load_workbook
 
     wb = load_workbook(xlsx_path, data_only=True)
     ws = wb[sheet_name] if sheet_name else wb.active
 
-    headers = _scan_server_headers(ws, header_col=1)
+    grid = SheetGrid.from_worksheet(ws)
+    headers = _scan_server_headers(grid, header_col=1)
     if not headers:
         raise RuntimeError(f"[{xlsx_path}] A열에서 서버 헤더를 찾지 못했습니다. (패턴/열 위치 확인 필요)")
 
+    image_index = _index_sheet_images(ws)
+    tracer = report_trace.current()
     results: Dict[str, MetricBlock] = {}
     for i, (server, start_row) in enumerate(headers):
         next_row = headers[i + 1][1] if i + 1 < len(headers) else None
         end_row = _block_end(start_row, next_row, default_height)
 
-        images = _extract_images_in_row_range(ws, start_row, end_row)
-        stats = _try_parse_stats_table(ws, start_row, end_row)
+        server_name = _trim_server_name(server)
+        with tracer.timed("parse_server", file=os.path.basename(xlsx_path), server=server_name):
+            images = _extract_images_in_row_range(image_index, start_row, end_row)
+            stats = _try_parse_stats_table(grid, start_row, end_row)
 
-        server_trimed = re.sub(r'^\s*■\s*|\s*\([^)]*\)\s*$', '', server).strip()
+        results[server_name] = MetricBlock(stats_by_metric=stats, images=images)
 
-        results[server_trimed] = MetricBlock(stats_by_metric=stats, images=images)
+    return results
+
+def _parse_excel_as_blocks_streaming(xlsx_path: str, sheet_name: Optional[str],
+                                     default_height: int) -> Dict[str, MetricBlock]:
+    """
+    xlsx(zip) 안의 시트 XML과 drawing 앵커를 직접 읽어 한 번의 순회로 파싱.
+    현재 서버 블록의 행만 메모리에 두고, 블록이 끝나면 통계/이미지를 만들어 바로 버립니다.
+    """
+    results: Dict[str, MetricBlock] = {}
+
+    with zipfile.ZipFile(xlsx_path) as zf:
+        sheet_part = find_sheet_part(zf, sheet_name)
+        shared = read_shared_strings(zf)
+        image_index = ImageRowIndex([(a, a.media) for a in read_image_anchors(zf, sheet_part)])
+
+        tracer = report_trace.current()
+        file_name = os.path.basename(xlsx_path)
+
+        def flush(server: str, start_row: int, end_row: int, grid: SheetGrid, started: float):
+            # 이미지 바이너리는 읽지 않고 zip member 위치만 기록 (서버 수백 대의 그래프를 메모리에 들고 있지 않도록)
+            images = [ImageRef.from_zipinfo(xlsx_path, zf.getinfo(media))
+                      for _, media in image_index.lookup(start_row, end_row)]
+            stats = _try_parse_stats_table(grid, start_row, end_row)
+            server_name = _trim_server_name(server)
+            results[server_name] = MetricBlock(stats_by_metric=stats, images=images)
+            # 블록 행 읽기부터 통계/이미지 추출까지의 시간
+            tracer.event("parse_server", time.perf_counter() - started, file=file_name, server=server_name)
+
+        current = None  # (서버명, 시작행, 블록 SheetGrid, 블록 시작 시각)
+        for r, cells in iter_rows(zf, sheet_part, shared, max_col=MAX_SCAN_COLUMN):
+            v = cells.get(1)
+            if _is_server_header(v):
+                if current is not None:
+                    flush(current[0], current[1], _block_end(current[1], r, default_height), current[2], current[3])
+                current = (str(v).strip(), r, SheetGrid(), time.perf_counter())
+            if current is not None:
+                current[2].add_row(r, cells)
+
+        if current is None:
+            raise RuntimeError(f"[{xlsx_path}] A열에서 서버 헤더를 찾지 못했습니다. (패턴/열 위치 확인 필요)")
+
+        # 마지막 블록은 다음 헤더가 없으므로 기본 높이까지만
+        flush(current[0], current[1], _block_end(current[1], None, default_height), current[2], current[3])
+
+    return results
+
+def parse_excel_as_blocks(xlsx_path: str, sheet_name: Optional[str] = None,
+                          default_height: int = DEFAULT_BLOCK_HEIGHT,
+                          streaming: bool = True) -> Dict[str, MetricBlock]:
+    """
+    Excel 한 파일을 서버명 기준 MetricBlock으로 파싱하여 dict 반환.
+    streaming=True(기본)면 openpyxl 로드 없이 zip 내부 XML을 직접 스트리밍으로 읽고,
+    False면 기존 openpyxl(load_workbook) 방식으로 파싱합니다.
+    """
+    if streaming:
+        results = _parse_excel_as_blocks_streaming(xlsx_path, sheet_name, default_height)
+    else:
+        results = _parse_excel_as_blocks_openpyxl(xlsx_path, sheet_name, default_height)
 
     print(f"{xlsx_path}파일에 대해 총 {len(results)}개 서버 블록 파싱 완료.")
     return results
 
+def _image_to_payload(image):
+    # ImageRef 는 xlsx 경로를 빼고 저장 (내용이 같으면 다른 경로의 입력도 같은 캐시를 씀)
+    if isinstance(image, ImageRef):
+        return (image.member, image.offset, image.compress_type, image.compress_size, image.file_size, image.crc)
+    return image
+
+def _payload_to_image(item, xlsx_path: str):
+    if isinstance(item, tuple):
+        return ImageRef(os.path.abspath(xlsx_path), *item)
+    return item
+
+def _blocks_to_payload(blocks: Dict[str, MetricBlock]) -> dict:
+    # 캐시는 모듈 경로와 무관하게 읽을 수 있도록 기본 자료형으로만 저장
+    return {
+        server: (
+            {m: (st.min, st.max, st.avg) for m, st in block.stats_by_metric.items()},
+            [_image_to_payload(img) for img in block.images],
+        )
+        for server, block in blocks.items()
+    }
+
+def _payload_to_blocks(payload: dict, xlsx_path: str) -> Dict[str, MetricBlock]:
+    return {
+        server: MetricBlock(
+            stats_by_metric={m: Stats(*vals) for m, vals in stats.items()},
+            images=[_payload_to_image(item, xlsx_path) for item in images],
+        )
+        for server, (stats, images) in payload.items()
+    }
+
+def _parse_traced(xlsx_path: str) -> Tuple[Dict[str, MetricBlock], List[dict]]:
+    # 프로세스 풀 worker 용: worker 에서 기록한 서버별 파싱 시간을 결과와 함께 돌려줌
+    with report_trace.activate(Tracer()) as tracer:
+        blocks = parse_excel_as_blocks(xlsx_path)
+    return blocks, tracer.records
+
+def parse_excel_files(xlsx_paths: List[str], parallel: bool = True,
+                      cache_dir: Optional[str] = PARSE_CACHE_DIR,
+                      digests: Optional[List[str]] = None) -> List[Dict[str, MetricBlock]]:
+    """
+    여러 Excel 파일을 파싱하여 입력 순서대로 결과 리스트 반환.
+    파일별 파싱은 서로 독립적이고 CPU 위주이므로 parallel=True 면 프로세스 풀에서 동시에 실행합니다.
+    (MetricBlock/Stats 는 dataclass 라 그대로 pickle 되어 돌아옵니다.)
+    cache_dir 이 있으면 파일 내용(SHA-256)이 같은 입력은 캐시에서 읽고 파싱을 건너뜁니다.
+    digests: xlsx_paths 와 같은 순서의 SHA-256 (이미 계산했다면 넘겨서 다시 해시하지 않음)
+    """
+    results: List[Optional[Dict[str, MetricBlock]]] = [None] * len(xlsx_paths)
+    keys: List[Optional[str]] = [None] * len(xlsx_paths)
+
+    if cache_dir:
+        evict_cache(cache_dir, PARSE_CACHE_MAX_AGE_DAYS, PARSER_VERSION)
+        for i, path in enumerate(xlsx_paths):
+            keys[i] = cache_key(path, PARSER_VERSION, digests[i] if digests else None)
+            payload = load_cached(cache_dir, keys[i])
+            if payload is not None:
+                results[i] = _payload_to_blocks(payload, path)
+                print(f"{path}파일은 이전 파싱 결과(캐시)를 사용합니다. ({len(results[i])}개 서버 블록)")
+
+    todo = [i for i, r in enumerate(results) if r is None]
+    todo_paths = [xlsx_paths[i] for i in todo]
+    if not parallel or len(todo_paths) < 2:
+        parsed = [parse_excel_as_blocks(p) for p in todo_paths]
+    else:
+        workers = min(len(todo_paths), os.cpu_count() or 1)
+        tracer = report_trace.current()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = []
+            for blocks, records in pool.map(_parse_traced, todo_paths):
+                parsed.append(blocks)
+                tracer.extend(records)
+
+    for i, blocks in zip(todo, parsed):
+        results[i] = blocks
+        if cache_dir:
+            store_cached(cache_dir, keys[i], _blocks_to_payload(blocks))
+
+    return results
+
+def raw_series_paths(input_dir: str) -> Dict[str, str]:
+    """
+    입력 디렉토리에 있는 원시 시계열 CSV {지표명: 경로}. 없는 지표는 빠짐.
+    """
+    raw_dir = os.path.join(input_dir, RAW_SERIES_DIR)
+    paths = {}
+    for metrics in RAW_SERIES_FILES.values():
+        for metric, filename in metrics.items():
+            path = os.path.join(raw_dir, filename)
+            if os.path.exists(path):
+                paths[metric] = path
+    return paths
+
+def load_series_tables(series_paths: Dict[str, str]) -> dict:
+    """
+    원시 시계열 CSV 를 읽어 {지표명: SeriesTable} 반환 (통계와 그래프가 같은 데이터를 공유).
+    """
+    from series_stats import load_series_csv
+
+    return {metric: load_series_csv(path) for metric, path in series_paths.items()}
+
+def apply_series_stats(reports: List[ServerReport], tables: dict) -> int:
+    """
+    원시 시계열로 계산한 통계로 reports 의 Stats 를 채움 (요약표 값이 있어도 덮어씀).
+    원시 데이터에 없는 서버/지표는 요약표 값을 그대로 둡니다. 채운 (서버, 지표) 수 반환.
+    """
+    if not tables:
+        return 0
+    from series_stats import describe_table
+
+    by_name = {rep.server_name: rep for rep in reports}
+    filled = 0
+    for attr, metrics in RAW_SERIES_FILES.items():
+        for metric in metrics:
+            if metric not in tables:
+                continue
+            for server, st in describe_table(tables[metric]).items():
+                rep = by_name.get(_trim_server_name(server))
+                if rep is None:
+                    continue
+                # 숫자(float) 그대로 저장하고, 표시 형식은 슬라이드에 쓸 때 정함
+                getattr(rep, attr).stats_by_metric[metric] = Stats(**st)
+                filled += 1
+    return filled
+
+def apply_series_charts(reports: List[ServerReport], tables: dict, sizes: Dict[str, Tuple[int, int]],
+                        parallel: bool = True) -> int:
+    """
+    원시 시계열로 그린 그래프로 reports 의 그래프 이미지를 교체 (CPU/MEM, In/Out, 파일시스템 각 1장).
+    sizes: {ServerReport 속성명: (너비 px, 높이 px)} 슬라이드 그래프 칸 크기.
+    원시 데이터가 없는 서버/그래프는 Excel 그래프를 그대로 둡니다. 교체한 (서버, 그래프) 수 반환.
+    """
+    if not tables:
+        return 0
+    from chart_render import render_server_charts
+
+    charts = {}
+    for attr, metrics in RAW_SERIES_FILES.items():
+        series = [(metric.lstrip("● "), tables[metric]) for metric in metrics if metric in tables]
+        if series and attr in sizes:
+            charts[attr] = (sizes[attr], all(m.endswith("(%)") for m in metrics), series)
+
+    rendered = render_server_charts(charts, [rep.server_name for rep in reports],
+                                    server_key=_trim_server_name, parallel=parallel)
+    replaced = 0
+    for rep in reports:
+        for attr, png in rendered.get(rep.server_name, {}).items():
+            # 슬라이드 칸 크기로 그렸으므로 이미지 사전 처리(축소/재압축)는 건너뜀
+            getattr(rep, attr).images = [PresizedImage(png)]
+            replaced += 1
+    return replaced
+
 # -----------------------------
-# 4) 메인 실행부
+# 4) 보고서 생성 파이프라인
 # -----------------------------
-def main():
-
-    date_str = (date.today() - relativedelta(months=1)).strftime("%y년 %#m월")
-    OUTPUT_PPTX = f"{date_str} 월간 운영보고서.pptx"
+def month_label(month: str) -> str:
+    """
+    "2025-01" 형식의 월을 보고서 표기("25년 1월")로 변환.
+    """
+    d = datetime.strptime(month, "%Y-%m")
+    return f"{d:%y}년 {d.month}월"
 
-    # CPU/MEM, Network, Filesystem 파일 선택 후 excel 파싱
-    folder_path = select_folder(msg="CPU/MEM, Network Traffic, 파일시스템 사용률이 위치한 디렉토리를 선택하세요")
+def generate_report(date_str: str, input_dir: str, output_dir: str, agencies: List[str],
+                    combined_template: Optional[Tuple[str, int, int]] = None, parallel: bool = True,
+                    full: bool = False) -> List[Path]:
+    """
+    입력 디렉토리의 SMS Excel 3종으로 월간보고서를 만들고 기관별 PPTX 를 output_dir 에 생성.
+    combined_template: merge_templates_cached 결과 (병합된 템플릿 경로, 본문 시작 index, 본문 슬라이드 수)
+                       None 이면 여기서 병합 (배치에서는 한 번 병합한 결과를 모든 작업이 공유)
+    parallel=False 면 파싱/이미지 처리를 현재 프로세스에서만 수행 (배치 worker 용)
 
-    print("step1. Excel 파일 파싱 중...")
-    cpu_mem_blocks = parse_excel_as_blocks(folder_path+"/"+CPU_MEM_XLSX)
-    net_blocks = parse_excel_as_blocks(folder_path+"/"+NETWORK_XLSX)
-    fs_blocks = parse_excel_as_blocks(folder_path+"/"+FS_XLSX)
-
-    # 서버 키(서버명 (IP)) 기준으로 교집합/합집합 구성
-    all_servers = sorted(set(cpu_mem_blocks) | set(net_blocks) | set(fs_blocks))
-    
-    reports: List[ServerReport] = []
-    for s in all_servers:
-        reports.append(
-            ServerReport(
-                server_name=s,
-                cpu_mem=cpu_mem_blocks.get(s, MetricBlock({}, [])),
-                network=net_blocks.get(s, MetricBlock({}, [])),
-                filesystem=fs_blocks.get(s, MetricBlock({}, [])),
+    output_dir/REPORT_STATE_DIR 에 manifest 와 월간보고서 덱을 남겨 두고, 재실행 시
+    바뀐 서버 슬라이드와 기관별 파일만 다시 만듭니다. full=True 면 전부 다시 생성.
+    """
+    tracer = report_trace.current()
+    state_dir = os.path.join(output_dir, REPORT_STATE_DIR)
+    manifest_path = os.path.join(state_dir, f"{date_str}.json")
+    deck_pptx = os.path.join(state_dir, f"{date_str} 월간 운영보고서.pptx")
+    previous = None if full else load_manifest(manifest_path)
+
+    if combined_template is None:
+        print("step1. template 파일들 merge 중... (내용이 같으면 이전 병합 결과 재사용)")
+        with tracer.span("merge"):
+            from merge_ppt import merge_templates_cached
+
+            combined_template = merge_templates_cached(FRONT_TEMPLATE_PPTX, TEMPLATE_PPTX, BACK_TEMPLATE_PPTX)
+    combined_pptx, body_start, body_count = combined_template
+
+    input_paths = [os.path.join(input_dir, name) for name in (CPU_MEM_XLSX, NETWORK_XLSX, FS_XLSX)]
+    series_paths = raw_series_paths(input_dir)
+    inputs = {os.path.basename(path): file_sha256(path) for path in input_paths}
+    inputs.update({f"{RAW_SERIES_DIR}/{os.path.basename(path)}": file_sha256(path) for path in series_paths.values()})
+    settings = {
+        "date": date_str,
+        "template": file_sha256(combined_pptx),
+        "body_start": body_start,
+        "image_dpi": IMAGE_DPI,
+        "raw_charts": RENDER_RAW_CHARTS,
+    }
+
+    if (previous is not None and previous.get("inputs") == inputs and previous.get("settings") == settings
+            and os.path.exists(deck_pptx)):
+        print("\n step2~3. 입력 파일과 템플릿이 이전 실행과 같아 파싱/슬라이드 생성을 건너뜁니다.")
+        servers = previous["servers"]
+    else:
+        print("\n step2. Excel 파일 파싱 중...")
+        with tracer.span("parse"):
+            cpu_mem_blocks, net_blocks, fs_blocks = parse_excel_files(
+                input_paths, parallel=parallel, digests=[inputs[os.path.basename(p)] for p in input_paths])
+
+        # 서버 키(서버명 (IP)) 기준으로 교집합/합집합 구성
+        all_servers = sorted(set(cpu_mem_blocks) | set(net_blocks) | set(fs_blocks))
+
+        reports: List[ServerReport] = []
+        for s in all_servers:
+            reports.append(
+                ServerReport(
+                    server_name=s,
+                    cpu_mem=cpu_mem_blocks.get(s, MetricBlock({}, [])),
+                    network=net_blocks.get(s, MetricBlock({}, [])),
+                    filesystem=fs_blocks.get(s, MetricBlock({}, [])),
+                )
             )
-        )
 
-    print("\n step2. 엑셀 파일을 토대로 PPT 파일 생성 중...")
-    build_ppt_from_template(
-        template_pptx=TEMPLATE_PPTX,
-        output_pptx=REPORT_OUTPUT_PPTX,
-        reports=reports,
-        date=date_str
+        if series_paths:
+            print("\n step2-1. 원시 시계열로 서버별 통계 계산 중...")
+            with tracer.span("stats", metrics=len(series_paths)):
+                tables = load_series_tables(series_paths)
+                filled = apply_series_stats(reports, tables)
+            print(f"원시 시계열 통계 적용 완료: {filled}개 (서버, 지표)")
+
+            if RENDER_RAW_CHARTS:
+                with tracer.span("charts", servers=len(reports)):
+                    from xlsx_to_ppt import report_chart_sizes
+
+                    sizes = report_chart_sizes(combined_pptx, body_start, IMAGE_DPI or DEFAULT_CHART_DPI)
+                    drawn = apply_series_charts(reports, tables, sizes, parallel=parallel)
+                print(f"원시 시계열 그래프 생성 완료: {drawn}개 (서버, 그래프)")
+
+        servers = {rep.server_name: server_report_hash(rep) for rep in reports}
+        plan = plan_deck(previous, settings, servers, os.path.exists(deck_pptx))
+
+        print("\n step3. 엑셀 파일을 토대로 PPT 파일 생성 중...")
+        with tracer.span("build", servers=len(reports), full=plan.full,
+                         rebuilt=len(reports) if plan.full else len(plan.stale) + len(plan.added)):
+            from xlsx_to_ppt import build_report_deck, update_report_deck
+
+            # 상태 디렉토리는 덱을 처음 저장할 때 생성 (파싱 단계에서 실패하면 남기지 않음)
+            os.makedirs(state_dir, exist_ok=True)
+            if plan.full:
+                build_report_deck(
+                    combined_pptx=combined_pptx,
+                    output_pptx=deck_pptx,
+                    reports=reports,
+                    date=date_str,
+                    body_start=body_start,
+                    body_count=body_count,
+                    image_dpi=IMAGE_DPI,
+                    parallel=parallel,
+                )
+            elif plan.changed:
+                update_report_deck(
+                    previous_pptx=deck_pptx,
+                    combined_pptx=combined_pptx,
+                    output_pptx=deck_pptx,
+                    reports=reports,
+                    previous_servers=list(previous["servers"]),
+                    stale=set(plan.stale),
+                    date=date_str,
+                    body_start=body_start,
+                    image_dpi=IMAGE_DPI,
+                    parallel=parallel,
+                )
+            else:
+                print("서버 슬라이드 변경 없음: 이전 월간보고서를 그대로 사용합니다.")
+
+    deck = deck_hash(settings, servers)
+    stale_agencies = stale_outputs(previous, deck, agencies, output_dir)
+
+    print(f"\n step4. 기관별 PPT 복사 및 텍스트 교체 중... ({len(agencies)}곳 중 {len(stale_agencies)}곳 다시 생성)")
+    with tracer.span("agency_copy", agencies=len(stale_agencies)):
+        if stale_agencies:
+            from duplicate_ppts import fan_out_agency_pptx
+
+            fan_out_agency_pptx(
+                date=date_str,
+                src_pptx=deck_pptx,
+                agencies=stale_agencies,
+                output_dir=output_dir)
+
+    # SR내역 추가
+
+    outputs = [Path(output_dir) / f"{Path(deck_pptx).stem}({agency}).pptx" for agency in agencies]
+    # 다시 만들지 않은 기관은 이전 항목을 넘겨 해시 재계산을 건너뜀
+    prev_outputs = (previous or {}).get("outputs", {})
+    regenerated = set(stale_agencies)
+    save_manifest(manifest_path, {
+        "settings": settings,
+        "inputs": inputs,
+        "servers": servers,
+        "deck": deck,
+        "outputs": {
+            agency: output_entry(str(path), deck, None if agency in regenerated else prev_outputs.get(agency))
+            for agency, path in zip(agencies, outputs)
+        },
+    })
+    return outputs
+
+# -----------------------------
+# 5) 배치 실행 (여러 달/고객사 일괄 재생성)
+# -----------------------------
+def _run_batch_job(job: dict, combined_template: Tuple[str, int, int]) -> dict:
+    date_str = month_label(job["month"])
+    output_dir = job["output_dir"]
+    agencies = job.get("agencies") or DEFAULT_AGENCIES
+
+    state_dir = os.path.join(output_dir, REPORT_STATE_DIR)
+    had_state = os.path.isdir(state_dir)
+
+    tracer = Tracer(profile_stage=PROFILE_STAGE, profile_dir=output_dir)
+    with report_trace.activate(tracer):
+        # 배치에서는 작업 단위로 병렬 실행하므로 작업 내부는 단일 프로세스로 처리
+        try:
+            outputs = generate_report(date_str, job["input_dir"], output_dir, agencies, combined_template,
+                                      parallel=False, full=job.get("full", False))
+        except Exception:
+            # 이번 작업이 처음 만든 상태 디렉토리는 manifest 없이 남기지 않음
+            if not had_state:
+                shutil.rmtree(state_dir, ignore_errors=True)
+            raise
+    tracer.write(os.path.join(output_dir, f"{date_str} 월간 운영보고서.trace.json"))
+    return {"month": job["month"], "outputs": [str(p) for p in outputs]}
+
+def run_batch(manifest_path: str, workers: Optional[int] = None, full: bool = False) -> int:
+    """
+    manifest(JSON)의 작업들을 대화상자 없이 프로세스 풀에서 동시에 실행. 실패한 작업 수 반환.
+
+    manifest 형식:
+    {
+      "templates": {"front": "template01.pptx", "body": "template02.pptx", "back": "template03.pptx"},  (생략 가능)
+      "jobs": [
+        {"month": "2025-01", "input_dir": "...", "output_dir": "...", "agencies": ["...", ...]},  (agencies 생략 시 기본 목록)
+        {"month": "2025-02", ..., "full": true},  (true 면 이전 결과와 상관없이 전체 재생성)
+        ...
+      ]
+    }
+    """
+    from merge_ppt import merge_templates_cached
+
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    templates = manifest.get("templates", {})
+    # 템플릿 병합은 한 번만 하고 모든 작업이 공유
+    combined_template = merge_templates_cached(
+        templates.get("front", FRONT_TEMPLATE_PPTX),
+        templates.get("body", TEMPLATE_PPTX),
+        templates.get("back", BACK_TEMPLATE_PPTX),
     )
 
-    print("\n step3. template 파일들 merge 중...")
-    merge_ppts_with_merger(["template01.pptx", REPORT_OUTPUT_PPTX,"template03.pptx"],OUTPUT_PPTX)
-    
-    print("\n step4. 기관별 PPT 복사 및 텍스트 교체 중...")
-    agencies = ["경북농식품유통교육진흥원","경북문화재단","경북바이오산업연구원","경북여성정책개발원","경북종합자원봉사센터","경북행복재단","경상북도경제진흥원","경상북도교통문화연수원","경상북도인재평생교육재단","경상북도장애인체육회","경상북도호국보훈재단","경상북도환경연수원","독도재단","새마을재단","한국국학진흥원"]
+    jobs = manifest["jobs"]
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # --full 은 작업별 "full": false 보다 우선 (어느 한쪽이라도 true 면 전체 재생성)
+        futures = {pool.submit(_run_batch_job, {**job, "full": full or bool(job.get("full"))}, combined_template): job
+                   for job in jobs}
+        for fut in as_completed(futures):
+            job = futures[fut]
+            try:
+                result = fut.result()
+                print(f"[{result['month']}] 완료: 기관별 PPT {len(result['outputs'])}개 → {job['output_dir']}")
+            except Exception as e:
+                failed += 1
+                print(f"[{job.get('month')}] 실패: {e!r}")
+
+    print(f"\n배치 완료: 전체 {len(jobs)}건 중 성공 {len(jobs) - failed}건, 실패 {failed}건")
+    return failed
+
+# -----------------------------
+# 6) 메인 실행부
+# -----------------------------
+def main(full: bool = False):
+    from dateutil.relativedelta import relativedelta
+    from select_folder_file import select_folder
+
+    date_str = (date.today() - relativedelta(months=1)).strftime("%y년 %#m월")
+
+    # CPU/MEM, Network, Filesystem 파일이 있는 디렉토리와 결과 저장 디렉토리 선택
+    folder_path = select_folder(msg="CPU/MEM, Network Traffic, 파일시스템 사용률이 위치한 디렉토리를 선택하세요")
     output_dir = select_folder(msg="월간보고서 PPTX 파일을 저장할 디렉토리를 선택하세요")
-    for agency in agencies:
-        copy_pptx_to_multiple_names(
-            date=date_str,
-            src_pptx=OUTPUT_PPTX,
-            target_pptx=agency,
-            output_dir=output_dir)
-        
-    # SR내역 추가
-    
-    os.remove(REPORT_OUTPUT_PPTX)
-    os.remove(OUTPUT_PPTX)
+
+    tracer = Tracer(profile_stage=PROFILE_STAGE)
+    with report_trace.activate(tracer):
+        generate_report(date_str, folder_path, output_dir, DEFAULT_AGENCIES, full=full)
+
+    # 실행 계측 결과를 출력 파일 옆에 저장
+    tracer.write(os.path.join(output_dir, f"{date_str} 월간 운영보고서.trace.json"))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # PyInstaller(--onedir) 빌드에서 프로세스 풀 자식 프로세스가 main()을 다시 실행하지 않도록
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description="경북 월간 운영보고서 생성")
+    parser.add_argument("--batch", metavar="MANIFEST", help="manifest(JSON)의 작업들을 대화상자 없이 일괄 실행")
+    parser.add_argument("--workers", type=int, default=None, help="배치 동시 실행 작업 수 (기본: CPU 코어 수)")
+    parser.add_argument("--full", action="store_true", help="이전 실행 결과(manifest)를 무시하고 전체 재생성")
+    args = parser.parse_args()
+
+    if args.batch:
+        sys.exit(1 if run_batch(args.batch, args.workers, full=args.full) else 0)
+    main(full=args.full)
@@ -1,9 +1,50 @@
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
+
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.text.text import TextFrame
 from pptx.util import Pt
 
+import report_trace
+from xlsx_stream import NS_REL, ZipRawWriter, raw_copy_supported, read_rels
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+def _set_text_frame(
+    tf,
+    new_text: str,
+    font_size: int,
+    font_name: str,
+    font_align: str,
+    font_bold: bool,
+    font_color_rgb: RGBColor,
+):
+    tf.clear()
+    tf.text = new_text
+
+    # 스타일 설정
+    p = tf.paragraphs[0]
+    if font_align == "center":
+        p.alignment = PP_ALIGN.CENTER
+    elif font_align == "left":
+        p.alignment = PP_ALIGN.LEFT
+    elif font_align == "right":
+        p.alignment = PP_ALIGN.RIGHT
+
+    run = p.runs[0]
+    font = run.font
+    font.name = font_name
+    font.size = Pt(font_size)
+    font.color.rgb = font_color_rgb
+    font.bold = font_bold
+
 def change_shape_text(
     pptx_path: str,
     shape_name: str,
@@ -36,25 +77,7 @@ def change_shape_text(
     if not target.has_text_frame:
         raise ValueError(f"'{shape_name}' shape에 텍스트 프레임이 없습니다.")
 
-    tf = target.text_frame
-    tf.clear()
-    tf.text = new_text
-    
-    # 스타일 설정
-    p = tf.paragraphs[0]
-    if font_align == "center":
-        p.alignment = PP_ALIGN.CENTER
-    elif font_align == "left":
-        p.alignment = PP_ALIGN.LEFT
-    elif font_align == "right":
-        p.alignment = PP_ALIGN.RIGHT
-    
-    run = p.runs[0]
-    font = run.font
-    font.name = font_name
-    font.size = Pt(font_size)
-    font.color.rgb = font_color_rgb
-    font.bold = font_bold
+    _set_text_frame(target.text_frame, new_text, font_size, font_name, font_align, font_bold, font_color_rgb)
     prs.save(pptx_path)
 
 
@@ -100,4 +123,117 @@ def copy_pptx_to_multiple_names(
         font_color_rgb=RGBColor(0x00, 0x21, 0x46)
     )
 
-    print(f"기관별 ppt 생성 완료: {file_path}")
\ No newline at end of file
+    print(f"기관별 ppt 생성 완료: {file_path}")
+
+
+# -----------------------------
+# zip 단위 기관별 복사 (표지 슬라이드 XML만 수정)
+# -----------------------------
+def _cover_slide_part(zf: zipfile.ZipFile, slide_index: int = 0) -> str:
+    """
+    presentation.xml 의 슬라이드 순서(sldIdLst)에서 slide_index 번째 슬라이드 XML 경로 반환.
+    """
+    prs_part = "ppt/presentation.xml"
+    root = parse_xml(zf.read(prs_part))
+    sld_ids = root.findall(f"{{{NS_P}}}sldIdLst/{{{NS_P}}}sldId")
+    return read_rels(zf, prs_part)[sld_ids[slide_index].get(f"{{{NS_REL}}}id")]
+
+def _set_shape_text_in_xml(slide_el, shape_name: str, **style):
+    """
+    슬라이드 XML 트리에서 이름이 shape_name 인 도형의 텍스트를 change_shape_text 와 같은 방식으로 교체.
+    """
+    target = None
+    for sp in slide_el.iter(f"{{{NS_P}}}sp"):
+        c_nv_pr = sp.find(f"{{{NS_P}}}nvSpPr/{{{NS_P}}}cNvPr")
+        if c_nv_pr is not None and c_nv_pr.get("name") == shape_name:
+            target = sp
+            break
+
+    if target is None:
+        raise ValueError(f"'{shape_name}' 이름을 가진 shape을 찾을 수 없습니다.")
+
+    if target.txBody is None:
+        raise ValueError(f"'{shape_name}' shape에 텍스트 프레임이 없습니다.")
+
+    _set_text_frame(TextFrame(target.txBody, None), **style)
+
+def fan_out_agency_pptx(
+    date: str,
+    src_pptx: str | Path,
+    agencies: List[str],
+    output_dir: str | Path = None,
+    max_workers: int = None,
+) -> List[Path]:
+    """
+    src_pptx 를 기관별로 복사하면서 표지의 '기관명'/'날짜' 텍스트만 바꾼 파일들을 생성.
+    - Presentation 로드/저장 없이 표지 슬라이드 XML 파트만 수정합니다.
+    - 나머지 zip 멤버는 압축을 풀지 않고 압축된 바이트 그대로 한 번만 묶어 두고(base) 기관별 파일에 복사한 뒤,
+      기관별 표지 XML 만 추가 기록합니다. → 기관당 파일 쓰기 1회
+    - 기관별 파일은 스레드 풀에서 동시에 생성합니다.
+    """
+    src_pptx = Path(src_pptx)
+    output_dir = Path(output_dir) if output_dir else Path.cwd()
+
+    # 1) 표지 슬라이드를 제외한 멤버를 base zip 으로 한 번만 묶기
+    base = io.BytesIO()
+    with zipfile.ZipFile(src_pptx) as zf:
+        cover_part = _cover_slide_part(zf)
+        cover_info = zf.getinfo(cover_part)
+        cover_xml = zf.read(cover_part)
+        infos = [info for info in zf.infolist() if info.filename != cover_part]
+        if raw_copy_supported(infos):
+            # 압축된 바이트 그대로 옮김 (압축 해제/재압축 없음)
+            writer = ZipRawWriter(base)
+            with open(src_pptx, "rb") as src:
+                for info in infos:
+                    writer.copy(src, info)
+            writer.close()
+        else:
+            with zipfile.ZipFile(base, "w") as out:
+                for info in infos:
+                    out.writestr(info, zf.read(info))
+    base_bytes = base.getvalue()
+
+    # 2) 날짜는 모든 기관이 같으므로 한 번만 교체
+    cover_el = parse_xml(cover_xml)
+    _set_shape_text_in_xml(
+        cover_el, "날짜",
+        new_text=date,
+        font_size=12,
+        font_name="맑은 고딕",
+        font_align="left",
+        font_bold=False,
+        font_color_rgb=RGBColor(0x00, 0x21, 0x46),
+    )
+    cover_xml = serialize_part_xml(cover_el)
+
+    tracer = report_trace.current()
+
+    def write_one(agency: str) -> Path:
+        with tracer.timed("agency_copy", agency=agency):
+            return _write_agency(agency)
+
+    def _write_agency(agency: str) -> Path:
+        file_path = output_dir / f"{src_pptx.stem}({agency}){src_pptx.suffix}"
+
+        slide_el = parse_xml(cover_xml)
+        _set_shape_text_in_xml(
+            slide_el, "기관명",
+            new_text=agency,
+            font_size=36,
+            font_name="맑은 고딕",
+            font_align="left",
+            font_bold=False,
+            font_color_rgb=RGBColor(0x00, 0x42, 0xFF),
+        )
+
+        with open(file_path, "wb") as f:
+            f.write(base_bytes)
+        with zipfile.ZipFile(file_path, "a") as out:
+            out.writestr(cover_info, serialize_part_xml(slide_el))
+
+        print(f"기관별 ppt 생성 완료: {file_path}")
+        return file_path
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(write_one, agencies))
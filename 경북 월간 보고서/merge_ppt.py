@@ -1,11 +1,22 @@
+import hashlib
+import os
+import zipfile
+import xml.etree.ElementTree as ET
 from io import BytesIO
-from pptx_merger import Merger
+from pathlib import Path
+
+from parse_cache import file_sha256
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
 
 def merge_ppts_with_merger(pptx_paths, output_path):
     """
     pptx_paths: 합칠 pptx 파일 경로 리스트 (예: 3개)
     output_path: 결과 pptx 경로
     """
+    # pptx_merger(pptx 포함)는 무거우므로 병합 캐시가 없을 때만 불러옴
+    from pptx_merger import Merger
+
     merger = Merger()
 
     # 1) 파일들을 BytesIO로 읽기
@@ -24,3 +35,33 @@ def merge_ppts_with_merger(pptx_paths, output_path):
     print(f"template 병합 완료: {output_path}")
 
     
+
+
+# 합쳐 둔 고정 템플릿(앞/본문/뒤) 캐시 위치
+TEMPLATE_CACHE_DIR = ".template_cache"
+
+def count_slides(pptx_path) -> int:
+    """
+    pptx 를 열지 않고 presentation.xml 의 슬라이드 목록(sldIdLst)만 읽어 슬라이드 수 반환.
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        root = ET.fromstring(zf.read("ppt/presentation.xml"))
+    return len(root.findall(f"{{{NS_P}}}sldIdLst/{{{NS_P}}}sldId"))
+
+def merge_templates_cached(front_pptx, body_pptx, back_pptx, cache_dir=TEMPLATE_CACHE_DIR):
+    """
+    앞/본문/뒤 템플릿을 한 번 병합해 캐시에 저장해 두고, 세 파일 내용이 같으면 재사용.
+    return: (병합된 템플릿 경로, 본문 시작 슬라이드 index, 본문 슬라이드 수)
+    """
+    paths = [front_pptx, body_pptx, back_pptx]
+    key = hashlib.sha256("".join(file_sha256(p) for p in paths).encode()).hexdigest()
+
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    combined = Path(cache_dir) / f"combined-{key}.pptx"
+    if not combined.exists():
+        # 중간에 중단돼도 깨진 파일이 캐시로 남지 않도록 임시 파일에 병합 후 교체
+        tmp = combined.with_name(f"{combined.name}.{os.getpid()}.tmp")
+        merge_ppts_with_merger(paths, tmp)
+        os.replace(tmp, combined)
+
+    return str(combined), count_slides(front_pptx), count_slides(body_pptx)
@@ -0,0 +1,78 @@
+"""
+Excel 파싱 결과를 디스크에 저장해 두는 내용 기반(content-addressed) 캐시.
+- 키: 입력 xlsx 파일의 SHA-256 + 파서 버전 → 파일 내용이 같으면 같은 키
+- 값: pickle 로 직렬화한 파싱 결과 (통계값 + 이미지 바이너리)
+- 오래된 항목(지난 달 파일 등)은 evict_cache 로 정리
+"""
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_SUFFIX = ".pkl"
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def cache_key(path: str, parser_version: int, sha256: Optional[str] = None) -> str:
+    # 호출한 쪽에서 이미 계산한 SHA-256 이 있으면 파일을 다시 읽지 않음
+    return f"{sha256 or file_sha256(path)}-v{parser_version}"
+
+def load_cached(cache_dir: str, key: str) -> Optional[Any]:
+    """
+    캐시 항목을 읽어 반환. 없거나 깨진 경우 None.
+    읽을 때마다 mtime 을 갱신하여, 자주 쓰는 항목은 evict 대상에서 빠지게 합니다.
+    """
+    path = Path(cache_dir) / f"{key}{CACHE_SUFFIX}"
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass  # 읽은 직후 다른 프로세스(--batch)가 지웠어도 읽은 내용은 그대로 사용
+    return payload
+
+def store_cached(cache_dir: str, key: str, payload: Any):
+    """
+    임시 파일에 쓴 뒤 교체하여, 중간에 중단돼도 깨진 캐시가 남지 않게 저장.
+    """
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(cache_dir) / f"{key}{CACHE_SUFFIX}"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+def evict_cache(cache_dir: str, max_age_days: int, parser_version: Optional[int] = None) -> int:
+    """
+    max_age_days 동안 쓰이지 않은 항목과, parser_version 이 다른 항목을 삭제. 삭제한 개수 반환.
+    """
+    folder = Path(cache_dir)
+    if not folder.is_dir():
+        return 0
+
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    removed = 0
+    for path in folder.glob(f"*{CACHE_SUFFIX}"):
+        try:
+            stale = path.stat().st_mtime < cutoff
+        except FileNotFoundError:
+            continue  # 다른 프로세스(--batch)가 먼저 지우거나 교체한 항목
+        if parser_version is not None and not path.stem.endswith(f"-v{parser_version}"):
+            stale = True
+        if stale:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
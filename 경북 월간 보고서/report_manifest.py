@@ -0,0 +1,126 @@
+"""
+월간보고서 증분 재생성용 manifest.
+- 입력 xlsx, 서버 블록(파싱 결과), 월간보고서 덱, 기관별 PPT 의 해시(PPT 는 크기/수정 시각도)를 JSON 으로 기록
+- 재실행 시 이전 manifest 와 비교해 다시 만들어야 하는 서버 슬라이드와 기관별 파일만 골라냄
+서버 하나의 Excel 값이나 기관 목록 하나가 바뀌어도 전체를 다시 만들지 않게 합니다.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from parse_cache import file_sha256
+from xlsx_stream import ImageRef
+
+# manifest 형식이나 슬라이드 생성 방식을 바꾸면 올려서 이전 manifest 를 무효화하세요.
+MANIFEST_VERSION = 1
+
+
+def _image_digest(image) -> bytes:
+    # ImageRef 는 이미지를 읽지 않고 zip 에 기록된 CRC/크기로 내용을 식별
+    if isinstance(image, ImageRef):
+        return repr((image.crc, image.file_size)).encode("utf-8")
+    return hashlib.sha256(image).digest()
+
+def server_report_hash(report) -> str:
+    """
+    서버 하나의 슬라이드 내용(서버명, 지표별 Min/Max/Avg, 그래프 이미지)에 대한 해시.
+    """
+    h = hashlib.sha256(report.server_name.encode("utf-8"))
+    for block in (report.cpu_mem, report.network, report.filesystem):
+        h.update(b"\0")
+        for metric, st in sorted(block.stats_by_metric.items()):
+            h.update(repr((metric, st.min, st.max, st.avg)).encode("utf-8"))
+        for image in block.images:
+            h.update(_image_digest(image))
+    return h.hexdigest()
+
+def deck_hash(settings: dict, servers: Dict[str, str]) -> str:
+    """
+    월간보고서 덱의 논리적 해시 (설정 + 서버 순서와 서버별 해시).
+    저장할 때마다 zip 타임스탬프가 달라지므로 파일 바이트 대신 이 값으로 덱 변경을 판단합니다.
+    """
+    payload = json.dumps({"settings": settings, "servers": list(servers.items())}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def load_manifest(path: str) -> Optional[dict]:
+    """
+    manifest 를 읽어 반환. 없거나 깨졌거나 버전이 다르면 None.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+def save_manifest(path: str, manifest: dict):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, **manifest}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+@dataclass
+class DeckPlan:
+    full: bool                                       # 템플릿/날짜/설정이 바뀌었거나 이전 덱이 없어 전체 재생성
+    stale: List[str] = field(default_factory=list)   # 값/그래프가 바뀌어 다시 채울 서버
+    added: List[str] = field(default_factory=list)   # 새로 생긴 서버
+    removed: List[str] = field(default_factory=list) # 없어진 서버
+    changed: bool = True                             # 덱을 다시 저장해야 하는지
+
+def plan_deck(previous: Optional[dict], settings: dict, servers: Dict[str, str], deck_exists: bool) -> DeckPlan:
+    """
+    이전 manifest 와 이번 서버별 해시를 비교해 덱에서 다시 만들 부분을 결정.
+    """
+    if previous is None or previous.get("settings") != settings or not deck_exists:
+        return DeckPlan(full=True, added=list(servers))
+
+    prev_servers = previous.get("servers", {})
+    return DeckPlan(
+        full=False,
+        stale=[s for s, h in servers.items() if s in prev_servers and prev_servers[s] != h],
+        added=[s for s in servers if s not in prev_servers],
+        removed=[s for s in prev_servers if s not in servers],
+        changed=previous.get("deck") != deck_hash(settings, servers),
+    )
+
+def _same_stat(entry: dict, st: os.stat_result) -> bool:
+    # 크기와 수정 시각(ns)이 기록과 같으면 내용도 그대로라고 봄 (기록이 없는 이전 manifest 는 False)
+    return entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
+
+def output_entry(path: str, deck: str, previous: Optional[dict] = None) -> dict:
+    """
+    기관별 PPT 하나의 manifest 항목. previous(이전 항목)와 크기/수정 시각이 같으면 해시를 다시 계산하지 않음.
+    """
+    st = os.stat(path)
+    sha256 = previous["sha256"] if previous and _same_stat(previous, st) else file_sha256(path)
+    return {"file": os.path.basename(path), "sha256": sha256,
+            "size": st.st_size, "mtime_ns": st.st_mtime_ns, "deck": deck}
+
+def stale_outputs(previous: Optional[dict], deck: str, agencies: List[str], output_dir: str) -> List[str]:
+    """
+    다시 만들어야 하는 기관 목록: 이전 기록이 없거나, 덱이 바뀌었거나,
+    출력 파일이 없어졌거나 다른 내용으로 바뀐 기관.
+    크기/수정 시각이 기록과 다른 파일만 해시를 다시 계산해 내용을 비교합니다.
+    """
+    outputs = (previous or {}).get("outputs", {})
+    stale = []
+    for agency in agencies:
+        entry = outputs.get(agency)
+        if entry is None or entry.get("deck") != deck:
+            stale.append(agency)
+            continue
+        try:
+            st = os.stat(os.path.join(output_dir, entry["file"]))
+        except OSError:
+            stale.append(agency)
+            continue
+        if not _same_stat(entry, st) and file_sha256(os.path.join(output_dir, entry["file"])) != entry.get("sha256"):
+            stale.append(agency)
+    return stale
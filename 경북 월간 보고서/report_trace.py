@@ -0,0 +1,241 @@
+"""
+월간보고서 파이프라인 계측(trace) 유틸.
+- span: 단계(parse/merge/build/agency_copy)별 소요 시간과 구간 안의 RSS(메모리) 시작/종료/최댓값 기록
+- event: 서버별 파싱/슬라이드 생성, 기관별 복사 같은 항목 단위 소요 시간 기록
+- 지정한 단계 하나는 cProfile 로 프로파일링하여 .prof 파일로 저장
+결과는 JSON 으로 저장하여 느린 달에 어디서 시간이 걸렸는지 확인합니다.
+
+계측 대상 코드에서는 current() 로 현재 활성 Tracer 를 가져와 쓰며,
+활성 Tracer 가 없으면 아무것도 기록하지 않습니다.
+"""
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+
+RSS_SAMPLE_INTERVAL_S = 0.05  # span 동안 현재 RSS 를 재는 간격
+
+
+def _win_memory_counters():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return counters
+    return None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """
+    현재 프로세스(및 종료된 자식 프로세스)의 프로세스 시작 이후 최대 RSS(MB). 측정할 수 없으면 None.
+    값이 줄지 않으므로 단계별 메모리는 _current_rss_mb 로 잽니다.
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        # Linux 는 KB, macOS 는 byte 단위
+        scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return round(max(self_rss, child_rss) / scale, 1)
+
+    if sys.platform == "win32":
+        counters = _win_memory_counters()
+        if counters is not None:
+            return round(counters.PeakWorkingSetSize / (1024 * 1024), 1)
+
+    return None
+
+
+def _current_rss_mb() -> Optional[float]:
+    """
+    현재 프로세스의 지금 RSS(MB). Linux(/proc)와 Windows 만 지원하며, 측정할 수 없으면 None.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                resident_pages = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+    if sys.platform == "win32":
+        counters = _win_memory_counters()
+        if counters is not None:
+            return round(counters.WorkingSetSize / (1024 * 1024), 1)
+
+    return None
+
+
+class _RssSampler:
+    """
+    span 동안 백그라운드 스레드에서 현재 RSS 를 주기적으로 재서 구간 안의 최댓값을 구합니다.
+    """
+    def __init__(self, interval_s: float = RSS_SAMPLE_INTERVAL_S):
+        self.interval_s = interval_s
+        self.start_mb = _current_rss_mb()
+        self.peak_mb = self.start_mb
+        self._stop = threading.Event()
+        self._thread = None
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _sample(self):
+        rss = _current_rss_mb()
+        if rss is not None and (self.peak_mb is None or rss > self.peak_mb):
+            self.peak_mb = rss
+        return rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self._sample()
+
+    def stop(self) -> dict:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        end_mb = self._sample()
+        delta = None if end_mb is None or self.start_mb is None else round(end_mb - self.start_mb, 1)
+        return {"rss_start_mb": self.start_mb, "rss_end_mb": end_mb,
+                "rss_peak_mb": self.peak_mb, "rss_delta_mb": delta}
+
+
+class Tracer:
+    def __init__(self, enabled: bool = True, profile_stage: Optional[str] = None,
+                 profile_dir: Optional[str] = None):
+        """
+        profile_stage: cProfile 로 프로파일링할 span 이름 (예: "build")
+        profile_dir: .prof 파일을 저장할 디렉토리 (기본: 현재 디렉토리)
+        """
+        self.enabled = enabled
+        self.profile_stage = profile_stage
+        self.profile_dir = profile_dir or os.getcwd()
+        self.records: List[dict] = []
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _add(self, record: dict):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.records.append(record)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        단계 하나의 소요 시간과 메모리를 기록.
+        RSS 는 이 프로세스 기준으로 시작/종료 값, 그 차이, 구간 안에서 잰 최댓값을 남깁니다.
+        (프로세스 풀 worker 의 메모리는 포함하지 않음)
+        name 이 profile_stage 와 같으면 해당 구간을 cProfile 로 프로파일링합니다.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        profiler = cProfile.Profile() if name == self.profile_stage else None
+        sampler = _RssSampler()
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            duration = time.perf_counter() - start
+            record = {
+                "type": "span",
+                "name": name,
+                "start_s": round(start - self._t0, 4),
+                "duration_s": round(duration, 4),
+                **sampler.stop(),
+                **attrs,
+            }
+            if profiler is not None:
+                prof_path = os.path.join(self.profile_dir, f"{name}.prof")
+                profiler.dump_stats(prof_path)
+                record["profile"] = prof_path
+            self._add(record)
+
+    @contextmanager
+    def timed(self, name: str, **attrs):
+        """
+        서버/기관 단위 항목의 소요 시간만 가볍게 기록.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.event(name, time.perf_counter() - start, **attrs)
+
+    def event(self, name: str, duration_s: float, **attrs):
+        self._add({"type": "event", "name": name, "duration_s": round(duration_s, 4), **attrs})
+
+    def extend(self, records: List[dict]):
+        """
+        다른 프로세스(프로세스 풀 worker)에서 기록한 항목을 합침.
+        """
+        for record in records:
+            self._add(record)
+
+    def write(self, path: str):
+        spans = [r for r in self.records if r["type"] == "span"]
+        trace = {
+            "total_s": round(time.perf_counter() - self._t0, 4),
+            "max_rss_so_far_mb": _peak_rss_mb(),  # 프로세스 시작 이후 최대 (배치에서는 이전 작업 포함)
+            "stages": spans,
+            "items": [r for r in self.records if r["type"] == "event"],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False, indent=2)
+        print(f"실행 계측 결과 저장 완료: {path}")
+
+
+_NULL_TRACER = Tracer(enabled=False)
+_current = _NULL_TRACER
+
+def current() -> Tracer:
+    return _current
+
+@contextmanager
+def activate(tracer: Tracer):
+    """
+    with 블록 동안 tracer 를 현재 Tracer 로 지정.
+    """
+    global _current
+    prev = _current
+    _current = tracer
+    try:
+        yield tracer
+    finally:
+        _current = prev
@@ -0,0 +1,128 @@
+"""
+SMS 원시 시계열(수집 주기별 값)로 서버별 통계를 계산하는 엔진.
+- 지표 하나 = CSV 파일 하나: 첫 열은 수집 시각, 나머지 열은 서버 (헤더 행에 서버명)
+- 값을 (시점 x 서버) NumPy 배열로 읽고, 열마다 한 번 정렬한 결과에서
+  min/max/avg/p95/p99 를 모든 서버에 대해 한꺼번에 계산합니다. (빈 칸은 결측값으로 제외)
+Excel 요약표를 못 찾아도 슬라이드 숫자를 원시 데이터에서 다시 만들 수 있게 합니다.
+"""
+import csv
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+PERCENTILES = (95, 99)
+STAT_NAMES = ("min", "max", "avg") + tuple(f"p{q}" for q in PERCENTILES)
+
+
+@dataclass
+class SeriesTable:
+    servers: List[str]     # 열 순서대로 서버명 (CSV 헤더 그대로)
+    times: List[str]       # 행 순서대로 수집 시각 (CSV 첫 열 그대로)
+    values: np.ndarray     # (시점 수, 서버 수) float64, 결측은 NaN
+
+
+def _split_row(line: str) -> Tuple[str, str]:
+    """
+    CSV 한 줄을 (수집 시각, 나머지 값 부분) 으로 나눔.
+    첫 열이 따옴표로 감싸져 있으면(예: "2025-01-01, 00:05") 그 안의 쉼표 때문에 csv 모듈로 나눕니다.
+    """
+    if line.startswith('"'):
+        row = next(csv.reader([line]))
+        return row[0], ",".join(row[1:])
+    time, _, rest = line.partition(",")
+    return time, rest
+
+def _fill_missing(values: str) -> str:
+    # 빈 칸을 nan 으로 (맨 앞/맨 뒤 빈 칸과 몇 칸이 연속돼도 남김없이 채워질 때까지 반복)
+    text = f",{values},"
+    while ",," in text:
+        text = text.replace(",,", ",nan,")
+    return text[1:-1]
+
+def load_series_csv(path: str, encoding: str = "utf-8-sig") -> SeriesTable:
+    """
+    원시 시계열 CSV 를 읽어 SeriesTable 반환. 헤더와 따옴표로 감싼 첫 열은 csv 모듈로,
+    값은 numpy.loadtxt(C 파서, 따옴표 처리)로 한 번에 읽습니다. 숫자의 천 단위 쉼표는 허용하지 않습니다.
+    """
+    with open(path, newline="", encoding=encoding) as f:
+        header = next(csv.reader([f.readline()]), None)
+        body = f.read()
+    if not header:
+        raise ValueError(f"{path}: 헤더 행이 없습니다.")
+
+    times, lines = [], []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        time, values = _split_row(line)
+        times.append(time.strip())
+        lines.append(_fill_missing(values))
+
+    n_servers = len(header) - 1
+    if not lines:
+        # 헤더만 있는 파일: 시점 0개인 표
+        return SeriesTable(servers=[h.strip() for h in header[1:]], times=times,
+                           values=np.empty((0, n_servers)))
+    try:
+        values = np.loadtxt(lines, delimiter=",", quotechar='"', dtype=np.float64, ndmin=2)
+    except ValueError as e:
+        raise ValueError(f"{path}: 원시 시계열 값을 읽을 수 없습니다. ({e})") from e
+    if values.shape[1] != n_servers:
+        raise ValueError(f"{path}: 값 열 수({values.shape[1]})가 헤더의 서버 수({n_servers})와 다릅니다.")
+
+    return SeriesTable(servers=[h.strip() for h in header[1:]], times=times,
+                       values=values.reshape(len(lines), n_servers))
+
+def describe(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    (시점 x 서버) 배열의 열(서버)별 통계. 각 값은 (서버 수,) 배열이며 값이 하나도 없는 서버는 NaN.
+    열마다 한 번 정렬하고(NaN 은 뒤로 감) 개수 기준 인덱스로 min/max/백분위를 꺼냅니다.
+    백분위는 numpy.percentile 기본값(linear)과 같은 방식으로 보간합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    count = np.count_nonzero(~np.isnan(values), axis=0)
+    has = count > 0
+    last = np.maximum(count - 1, 0)
+    ordered = np.sort(values, axis=0)
+    if not len(ordered):
+        # 시점이 하나도 없는 표: 모든 서버가 NaN 이 되도록 NaN 한 줄을 둠
+        ordered = np.full((1, values.shape[1]), np.nan)
+
+    def at(index):
+        return np.take_along_axis(ordered, index[None, :], axis=0)[0]
+
+    def percentile(q):
+        pos = last * (q / 100.0)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.ceil(pos).astype(np.intp)
+        lo_v, hi_v = at(lo), at(hi)
+        return lo_v + (hi_v - lo_v) * (pos - lo)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats = {
+            "min": at(np.zeros_like(last)),
+            "max": at(last),
+            "avg": np.nansum(values, axis=0) / count,
+        }
+        for q in PERCENTILES:
+            stats[f"p{q}"] = percentile(q)
+
+    for name in stats:
+        stats[name] = np.where(has, stats[name], np.nan)
+    return stats
+
+def describe_table(table: SeriesTable) -> Dict[str, Dict[str, float]]:
+    """
+    {서버명: {"min": .., "max": .., "avg": .., "p95": .., "p99": ..}}. 값이 없는 서버는 제외.
+    """
+    stats = describe(table.values)
+    result = {}
+    for i, server in enumerate(table.servers):
+        if np.isnan(stats["min"][i]):
+            continue
+        result[server] = {name: float(stats[name][i]) for name in STAT_NAMES}
+    return result
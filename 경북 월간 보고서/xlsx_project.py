@@ -0,0 +1,380 @@
+"""
+xlsx 시트에서 여러 열을 한 번에 삭제(열 projection)하는 스트리밍 재작성 유틸.
+openpyxl 의 delete_cols 는 열 하나를 지울 때마다 오른쪽 셀을 모두 옮기고 파일 전체를 다시 저장하므로
+열 수 x 셀 수 만큼 일을 합니다. 여기서는
+- 시트 XML 을 한 번만 순서대로 읽으면서 행 단위로 지울 셀을 빼고 남은 셀의 참조(r)를 당겨 씀
+- 병합 셀/하이퍼링크/조건부 서식/데이터 유효성/선택 영역 범위, 열 너비(cols), dimension 도 같이 보정
+- 시트에 연결된 drawing 의 그림 앵커(from/to 열)도 보정
+- 나머지 zip 멤버는 압축을 풀지 않고 압축된 바이트 그대로 복사 (ZipRawWriter)
+합니다. 수식 안의 셀 참조는 openpyxl 과 마찬가지로 바꾸지 않습니다.
+"""
+import os
+import re
+import zipfile
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from xlsx_stream import ZipRawWriter, column_index, find_sheet_part, raw_copy_supported, read_rels
+
+_CHUNK_SIZE = 1024 * 1024
+_CELL_REF = re.compile(r"^\$?([A-Z]*)\$?(\d*)$")
+_R_ATTR = re.compile(r'(\sr=")([A-Z]+)(\d+)(")')
+_SPANS_ATTR = re.compile(r'\sspans="[^"]*"')
+_REF_ATTR = re.compile(r'(\s(?:ref|sqref)=")([^"]*)(")')
+_ACTIVE_CELL_ATTR = re.compile(r'(\sactiveCell=")([^"]*)(")')
+_COUNT_ATTR = re.compile(r'(\scount=")\d+(")')
+
+
+def column_letter(idx: int) -> str:
+    letters = ""
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+class ColumnMap:
+    """
+    삭제할 열(1-based) 집합으로 남는 열의 새 위치를 계산.
+    """
+    def __init__(self, deleted: Iterable[int]):
+        self.deleted = sorted(set(deleted))
+        self._letters: dict = {}
+
+    def map_letters(self, letters: str) -> Optional[str]:
+        """
+        셀 참조의 열 문자를 새 열 문자로 변환 (지워진 열이면 None). 셀마다 호출되므로 결과를 캐시.
+        """
+        try:
+            return self._letters[letters]
+        except KeyError:
+            col = column_index(letters)
+            new = None if self.is_deleted(col) else column_letter(self.shift(col))
+            self._letters[letters] = new
+            return new
+
+    def is_deleted(self, col: int) -> bool:
+        i = bisect_left(self.deleted, col)
+        return i < len(self.deleted) and self.deleted[i] == col
+
+    def shift(self, col: int) -> int:
+        """
+        col 이 지워졌으면 그 자리를 이어받는 (오른쪽 첫 남은) 열의 새 위치, 아니면 col 의 새 위치.
+        """
+        return col - bisect_left(self.deleted, col)
+
+    def map_range(self, first: int, last: int) -> Optional[Tuple[int, int]]:
+        """
+        first~last 열 범위 중 남는 열들의 새 범위. 모두 지워지면 None.
+        """
+        new_first = first - bisect_left(self.deleted, first)
+        new_last = last - bisect_right(self.deleted, last)
+        return (new_first, new_last) if new_first <= new_last else None
+
+    def map_ref(self, ref: str) -> Optional[str]:
+        """
+        "B3", "A1:D10", "C:E" 형태의 참조를 새 위치로 변환. 해당 열이 모두 지워지면 None.
+        """
+        ends = [_CELL_REF.match(part) for part in ref.split(":")]
+        if any(m is None for m in ends):
+            return ref
+        if not all(m.group(1) for m in ends):
+            return ref  # "1:3" 같은 행 전체 범위는 열 삭제와 무관
+        cols = [column_index(m.group(1)) for m in ends]
+        mapped = self.map_range(cols[0], cols[-1])
+        if mapped is None:
+            return None
+        parts = [column_letter(c) + m.group(2) for c, m in zip(mapped, ends)]
+        return ":".join(parts) if len(ends) > 1 else parts[0]
+
+    def map_sqref(self, sqref: str) -> str:
+        # 공백으로 구분된 여러 범위. 지워진 범위는 빼고 반환 (모두 지워지면 빈 문자열)
+        return " ".join(r for r in (self.map_ref(part) for part in sqref.split()) if r)
+
+
+# -----------------------------
+# 시트 XML 중 sheetData 바깥 (열 너비, 범위 속성)
+# -----------------------------
+def _rewrite_cols(xml: str, prefix: str, cmap: ColumnMap) -> str:
+    def repl(m):
+        attrs = m.group(1)
+        first = int(re.search(r'\smin="(\d+)"', attrs).group(1))
+        last = int(re.search(r'\smax="(\d+)"', attrs).group(1))
+        mapped = cmap.map_range(first, last)
+        if mapped is None:
+            return ""
+        attrs = re.sub(r'(\smin=")\d+', lambda a: f"{a.group(1)}{mapped[0]}", attrs)
+        attrs = re.sub(r'(\smax=")\d+', lambda a: f"{a.group(1)}{mapped[1]}", attrs)
+        return f"<{prefix}col{attrs}/>"
+
+    xml = re.sub(rf"<{prefix}col\b([^>]*?)\s*/>", repl, xml)
+    # 모든 열 정의가 지워졌으면 빈 cols 요소도 제거 (스키마상 col 이 하나 이상 있어야 함)
+    return re.sub(rf"<{prefix}cols>\s*</{prefix}cols>", "", xml)
+
+def _rewrite_ranges(xml: str, prefix: str, cmap: ColumnMap) -> str:
+    """
+    ref/sqref 범위를 가진 요소들을 보정. 범위가 모두 지워진 병합 셀/하이퍼링크 등은 요소째 제거.
+    """
+    removable = "mergeCell|hyperlink|conditionalFormatting|dataValidation|protectedRange|ignoredError"
+    keep = "dimension|selection|autoFilter"
+
+    def repl(m):
+        name, attrs, rest = m.group(1), m.group(2), m.group(3)
+        ref_m = _REF_ATTR.search(attrs)
+        if ref_m is None:
+            return m.group(0)
+        new_ref = cmap.map_sqref(ref_m.group(2))
+        if name == "mergeCell" and len(set(new_ref.split(":"))) < 2:
+            new_ref = ""  # 한 칸만 남은 병합은 병합이 아님
+        if not new_ref:
+            if name in keep:
+                new_ref = "A1"
+            else:
+                return ""
+        attrs = attrs[:ref_m.start(2)] + new_ref + attrs[ref_m.end(2):]
+
+        active_m = _ACTIVE_CELL_ATTR.search(attrs)
+        if active_m is not None:
+            active = cmap.map_ref(active_m.group(2)) or new_ref.split()[0].split(":")[0]
+            attrs = attrs[:active_m.start(2)] + active + attrs[active_m.end(2):]
+        return f"<{prefix}{name}{attrs}{rest}"
+
+    xml = re.sub(
+        rf"<{prefix}({removable}|{keep})\b([^>]*?)(/>|>.*?</{prefix}\1>)",
+        repl, xml, flags=re.S,
+    )
+
+    # 자식이 모두 지워진 묶음 요소는 제거하고, 남아 있으면 count 를 다시 계산
+    for wrapper, child in (("mergeCells", "mergeCell"), ("hyperlinks", "hyperlink"),
+                           ("dataValidations", "dataValidation"), ("protectedRanges", "protectedRange"),
+                           ("ignoredErrors", "ignoredError")):
+        def fix(m, child=child):
+            n = len(re.findall(rf"<{prefix}{child}\b", m.group(0)))
+            if n == 0:
+                return ""
+            return _COUNT_ATTR.sub(lambda c: f"{c.group(1)}{n}{c.group(2)}", m.group(0), count=1)
+        xml = re.sub(rf"<{prefix}{wrapper}\b[^>]*>.*?</{prefix}{wrapper}>|<{prefix}{wrapper}\b[^>]*/>",
+                     fix, xml, flags=re.S)
+    return xml
+
+def _rewrite_outside_rows(xml: str, prefix: str, cmap: ColumnMap) -> str:
+    return _rewrite_ranges(_rewrite_cols(xml, prefix, cmap), prefix, cmap)
+
+
+# -----------------------------
+# sheetData 행 스트리밍
+# -----------------------------
+def _rewrite_row(row_xml: str, prefix: str, cmap: ColumnMap) -> str:
+    start_end = row_xml.index(">") + 1
+    start_tag = _SPANS_ATTR.sub("", row_xml[:start_end])  # spans 는 선택 속성이므로 다시 계산하지 않고 제거
+    if start_tag.endswith("/>"):
+        return start_tag
+
+    body = row_xml[start_end:]
+    col_idx = 0
+
+    def repl(m):
+        nonlocal col_idx
+        start_attrs = m.group(1)
+        r_m = _R_ATTR.search(start_attrs)
+        if r_m is None:
+            # 참조 없는 셀은 위치로 열이 정해지므로 앞 셀이 빠지면 자동으로 당겨짐
+            col_idx += 1
+            return "" if cmap.is_deleted(col_idx) else m.group(0)
+        letters = r_m.group(2)
+        new_letters = cmap.map_letters(letters)
+        col_idx = column_index(letters)
+        if new_letters is None:
+            return ""
+        if new_letters == letters:
+            return m.group(0)
+        new_ref = f"{r_m.group(1)}{new_letters}{r_m.group(3)}{r_m.group(4)}"
+        return f"<{prefix}c{start_attrs[:r_m.start()]}{new_ref}{start_attrs[r_m.end():]}{m.group(2)}"
+
+    body = re.sub(rf"<{prefix}c\b([^>]*?)(/>|>.*?</{prefix}c>)", repl, body, flags=re.S)
+    return start_tag + body
+
+def _iter_sheet_pieces(stream, prefix_holder: list) -> Iterator[Tuple[str, str]]:
+    """
+    시트 XML 을 조각 단위로 읽어 ("head"|"row"|"tail", 텍스트) 를 순서대로 반환.
+    head 는 sheetData 시작 태그까지, row 는 행 하나, tail 은 sheetData 끝 태그부터 끝까지.
+    """
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        # 읽은 부분은 버리고 다음 조각을 이어 붙임 (행마다 버퍼를 복사하지 않도록 pos 로 관리)
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = stream.read(_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def rest() -> str:
+        while fill():
+            pass
+        return buf[pos:]
+
+    # head
+    while True:
+        m = re.search(r"<(\w+:)?sheetData\b[^>]*?(/?)>", buf)
+        if m is not None:
+            break
+        if not fill():
+            yield "tail", buf
+            return
+    prefix = m.group(1) or ""
+    prefix_holder.append(prefix)
+    yield "head", buf[:m.end()]
+    pos = m.end()
+    if m.group(2):  # <sheetData/>
+        yield "tail", rest()
+        return
+
+    row_open = f"<{prefix}row"
+    row_close = f"</{prefix}row>"
+    data_close = f"</{prefix}sheetData>"
+    while True:
+        start = buf.find(row_open, pos)
+        # sheetData 끝 태그는 다음 행 앞까지만 찾음 (행마다 버퍼 끝까지 훑지 않도록)
+        end_data = buf.find(data_close, pos, len(buf) if start == -1 else start)
+        if end_data != -1:
+            pos = end_data
+            yield "tail", rest()
+            return
+        if start == -1:
+            if not fill():
+                raise ValueError("sheetData 가 닫히지 않았습니다.")
+            continue
+
+        tag_end = buf.find(">", start)
+        if tag_end == -1:
+            if not fill():
+                raise ValueError("행 태그가 닫히지 않았습니다.")
+            continue
+        if buf[tag_end - 1] == "/":
+            end = tag_end + 1
+        else:
+            close = buf.find(row_close, tag_end)
+            if close == -1:
+                if not fill():
+                    raise ValueError("행이 닫히지 않았습니다.")
+                continue
+            end = close + len(row_close)
+        yield "row", buf[start:end]
+        pos = end
+
+def _rewrite_sheet(src, dst, cmap: ColumnMap):
+    import codecs
+
+    reader = codecs.getreader("utf-8")(src)
+    writer = codecs.getwriter("utf-8")(dst)
+    prefix_holder: List[str] = []
+    for kind, text in _iter_sheet_pieces(reader, prefix_holder):
+        prefix = prefix_holder[0] if prefix_holder else ""
+        if kind == "row":
+            writer.write(_rewrite_row(text, prefix, cmap))
+        else:
+            writer.write(_rewrite_outside_rows(text, prefix, cmap))
+
+
+# -----------------------------
+# drawing 앵커
+# -----------------------------
+def _rewrite_drawing(xml: str, cmap: ColumnMap) -> str:
+    """
+    그림 앵커 from/to 의 열(0-based)을 보정. 앵커가 있던 열이 지워졌으면 다음 남은 열의 시작으로 옮김.
+    """
+    def repl(m):
+        col = int(m.group(3)) + 1
+        new_col = cmap.shift(col) - 1
+        off = "0" if cmap.is_deleted(col) else m.group(5)
+        return f"{m.group(1)}{new_col}{m.group(4)}{off}"
+
+    return re.sub(
+        r"(<(?:\w+:)?(from|to)>\s*<(?:\w+:)?col>)(\d+)(</(?:\w+:)?col>\s*<(?:\w+:)?colOff>)(-?\d+)",
+        repl, xml,
+    )
+
+
+# -----------------------------
+# 파일 단위
+# -----------------------------
+def _write_changed(zin: zipfile.ZipFile, info: zipfile.ZipInfo, zout: zipfile.ZipFile, sheet_part: str,
+                   drawings: set, cmap: ColumnMap):
+    # 열 삭제로 내용이 바뀌는 멤버(시트, drawing, 계산 체인 참조) 다시 쓰기
+    name = info.filename
+    if name == sheet_part:
+        with zin.open(info) as src, zout.open(name, "w", force_zip64=True) as dst:
+            _rewrite_sheet(src, dst, cmap)
+    elif name in drawings:
+        zout.writestr(info, _rewrite_drawing(zin.read(info).decode("utf-8"), cmap))
+    elif name == "[Content_Types].xml":
+        xml = zin.read(info).decode("utf-8")
+        zout.writestr(info, re.sub(r'<Override[^>]*PartName="/xl/calcChain\.xml"[^>]*/>', "", xml))
+    elif name == "xl/_rels/workbook.xml.rels":
+        xml = zin.read(info).decode("utf-8")
+        zout.writestr(info, re.sub(r'<Relationship[^>]*Target="[^"]*calcChain\.xml"[^>]*/>', "", xml))
+
+def drop_columns(src_xlsx: str, dst_xlsx: str, columns: Iterable[int], sheet_name: Optional[str] = None):
+    """
+    src_xlsx 의 시트(없으면 활성 시트)에서 columns(1-based 열 번호)를 지운 결과를 dst_xlsx 로 저장.
+    src_xlsx 와 dst_xlsx 는 달라야 합니다. (제자리 수정은 drop_columns_inplace)
+    바뀌는 멤버만 임시 zip 에 새로 압축하고, 결과 파일은 ZipRawWriter 로 원래 순서대로
+    (바뀌지 않은 멤버는 원본에서, 바뀐 멤버는 임시 zip 에서) 압축된 바이트 그대로 옮겨 담습니다.
+    """
+    cmap = ColumnMap(columns)
+    with zipfile.ZipFile(src_xlsx) as zin:
+        sheet_part = find_sheet_part(zin, sheet_name)
+        drawings = {p for p in read_rels(zin, sheet_part).values() if "/drawings/" in p and not p.endswith(".vml")}
+        # 셀 위치가 바뀌므로 계산 체인은 버리고 Excel 이 다시 만들게 함 (openpyxl 저장과 동일)
+        drop = {"xl/calcChain.xml"}
+        changed = {sheet_part, "[Content_Types].xml", "xl/_rels/workbook.xml.rels"} | drawings
+        infos = [info for info in zin.infolist() if info.filename not in drop]
+
+        parts_path = f"{dst_xlsx}.parts"
+        try:
+            with zipfile.ZipFile(parts_path, "w", zipfile.ZIP_DEFLATED) as zparts:
+                for info in infos:
+                    if info.filename in changed:
+                        _write_changed(zin, info, zparts, sheet_part, drawings, cmap)
+
+            with zipfile.ZipFile(parts_path) as zparts:
+                parts = {info.filename: info for info in zparts.infolist()}
+                sources = [parts[info.filename] if info.filename in changed else info for info in infos]
+                if raw_copy_supported(sources):
+                    with open(src_xlsx, "rb") as fsrc, open(parts_path, "rb") as fparts, open(dst_xlsx, "wb") as fdst:
+                        writer = ZipRawWriter(fdst)
+                        for info, source in zip(infos, sources):
+                            writer.copy(fparts if info.filename in changed else fsrc, source)
+                        writer.close()
+                else:
+                    # zip64 가 필요한 크기면 zipfile 로 다시 압축해서 씀
+                    with zipfile.ZipFile(dst_xlsx, "w", zipfile.ZIP_DEFLATED) as zout:
+                        for info in infos:
+                            if info.filename in changed:
+                                zout.writestr(parts[info.filename], zparts.read(info.filename))
+                            else:
+                                zout.writestr(info, zin.read(info))
+        finally:
+            if os.path.exists(parts_path):
+                os.remove(parts_path)
+
+def drop_columns_inplace(xlsx_path: str, columns: Iterable[int], sheet_name: Optional[str] = None) -> str:
+    """
+    임시 파일에 쓴 뒤 교체하여, 중간에 중단돼도 원본이 깨지지 않게 제자리에서 열 삭제.
+    """
+    tmp = f"{xlsx_path}.{os.getpid()}.tmp"
+    try:
+        drop_columns(xlsx_path, tmp, columns, sheet_name)
+        os.replace(tmp, xlsx_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return xlsx_path
@@ -0,0 +1,396 @@
+"""
+openpyxl 객체 모델을 만들지 않고 xlsx(zip) 내부 XML을 직접 스트리밍으로 읽는 유틸.
+- 시트 XML은 iterparse로 한 행씩 읽고, 처리한 행은 바로 버려 메모리를 일정하게 유지합니다.
+- 차트 이미지는 drawing XML의 앵커(행/열)와 media 경로만 먼저 읽고, 바이너리는 필요할 때 꺼냅니다.
+  (ImageRef: zip member 위치만 들고 있다가 슬라이드에 넣을 때 그 member 만 읽음)
+"""
+import os
+import posixpath
+import re
+import struct
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_XDR = "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing"
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+@dataclass
+class ImageAnchor:
+    row: int                       # 1-based 시작 행
+    col: int                       # 1-based 시작 열
+    media: Optional[str] = None    # zip 내부 이미지 경로 (예: xl/media/image1.png)
+    to_row: Optional[int] = None   # TwoCellAnchor 의 끝 행 (1-based)
+    to_col: Optional[int] = None   # TwoCellAnchor 의 끝 열 (1-based)
+    cx: Optional[int] = None       # 이미지 너비 (EMU)
+    cy: Optional[int] = None       # 이미지 높이 (EMU)
+
+
+@dataclass(frozen=True)
+class ImageRef:
+    """
+    xlsx(zip) 안 이미지 member 의 위치. 바이너리 대신 MetricBlock.images 에 담아 두고
+    read() 할 때 해당 member 만 local header 위치(offset)로 바로 찾아 읽습니다.
+    """
+    path: str            # xlsx 파일 경로
+    member: str          # zip 내부 경로 (예: xl/media/image1.png)
+    offset: int          # local file header 위치 (ZipInfo.header_offset)
+    compress_type: int
+    compress_size: int
+    file_size: int
+    crc: int
+
+    @classmethod
+    def from_zipinfo(cls, path: str, info: zipfile.ZipInfo) -> "ImageRef":
+        return cls(path=os.path.abspath(path), member=info.filename, offset=info.header_offset,
+                   compress_type=info.compress_type, compress_size=info.compress_size,
+                   file_size=info.file_size, crc=info.CRC)
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            data = _read_compressed(f, self.offset, self.compress_size)
+            if data is None:
+                raise ValueError(f"{self.path}: {self.member} 위치가 바뀌었습니다. (파싱 후 파일이 수정됨)")
+
+        if self.compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -15)
+        elif self.compress_type != zipfile.ZIP_STORED:
+            # 드문 압축 방식은 zipfile 에 맡김
+            with zipfile.ZipFile(self.path) as zf:
+                data = zf.read(self.member)
+        if len(data) != self.file_size or zlib.crc32(data) != self.crc:
+            raise ValueError(f"{self.path}: {self.member} 내용이 파싱할 때와 다릅니다. (파싱 후 파일이 수정됨)")
+        return data
+
+class PresizedImage(bytes):
+    """
+    슬라이드 그래프 칸 크기 그대로 그린 이미지 바이너리 (chart_render 결과).
+    bytes 와 똑같이 쓰이고, 슬라이드에 넣기 전 축소/재압축(fit_image_to_box)을 건너뜁니다.
+    """
+    __slots__ = ()
+
+
+def image_bytes(image) -> bytes:
+    """
+    MetricBlock.images 항목(bytes 또는 ImageRef)의 이미지 바이너리.
+    """
+    return image.read() if isinstance(image, ImageRef) else image
+
+
+# -----------------------------
+# zip 내부 경로/관계(rels) 해석
+# -----------------------------
+def _rels_path(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+def _resolve_target(part: str, target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+
+def read_rels(zf: zipfile.ZipFile, part: str) -> Dict[str, str]:
+    """
+    part의 .rels 파일을 읽어 {rId: zip 내부 경로} 반환. rels가 없으면 빈 dict.
+    """
+    path = _rels_path(part)
+    if path not in zf.namelist():
+        return {}
+    root = ET.fromstring(zf.read(path))
+    rels = {}
+    for rel in root.iter(f"{{{NS_PKG_REL}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        rels[rel.get("Id")] = _resolve_target(part, rel.get("Target"))
+    return rels
+
+def column_index(letters: str) -> int:
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx
+
+
+# -----------------------------
+# zip 멤버 원본(압축된 바이트) 복사
+# -----------------------------
+def _read_compressed(f, offset: int, compress_size: int) -> Optional[bytes]:
+    # offset 의 local file header 를 건너뛰고 압축된 데이터를 그대로 읽음. header 가 아니면 None
+    f.seek(offset)
+    header = f.read(30)
+    if len(header) < 30 or header[:4] != b"PK\x03\x04":
+        return None
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    f.seek(name_len + extra_len, 1)
+    return f.read(compress_size)
+
+_ZIP32_LIMIT = 0xFFFFFFFF
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+
+
+def raw_copy_supported(infos: List[zipfile.ZipInfo]) -> bool:
+    """
+    ZipRawWriter 로 옮길 수 있는지 (zip64 가 필요 없는 크기/개수인지). 아니면 zipfile 로 다시 압축해서 씁니다.
+    """
+    total = sum(_LOCAL_HEADER.size + len(i.filename.encode("utf-8")) + i.compress_size for i in infos)
+    return (len(infos) < 0xFFFF and total < _ZIP32_LIMIT
+            and all(i.compress_size < _ZIP32_LIMIT and i.file_size < _ZIP32_LIMIT for i in infos))
+
+
+class ZipRawWriter:
+    """
+    다른 zip 의 멤버를 압축을 풀지 않고(압축된 바이트 그대로) 옮겨 담는 최소 zip 작성기.
+    zipfile 내부 구현에 기대지 않도록 local header / central directory 를 struct 로 직접 씁니다.
+    zip64 는 지원하지 않으므로 raw_copy_supported 로 먼저 확인하세요.
+    """
+    def __init__(self, fileobj):
+        self.f = fileobj
+        self.entries: List[Tuple[zipfile.ZipInfo, bytes, int, int]] = []  # (원본 info, 파일명, flag, header 위치)
+
+    def copy(self, src, info: zipfile.ZipInfo):
+        """
+        src(원본 zip 을 "rb" 로 연 파일 객체)에서 info 멤버의 압축된 데이터를 그대로 복사.
+        압축 방식/CRC/크기/시각/속성은 유지하고, 크기와 CRC 를 local header 에 바로 쓰므로 data descriptor 는 뺍니다.
+        """
+        data = _read_compressed(src, info.header_offset, info.compress_size)
+        if data is None or len(data) != info.compress_size:
+            raise ValueError(f"{info.filename}: local file header 를 찾을 수 없습니다.")
+
+        try:
+            name, flag = info.filename.encode("ascii"), info.flag_bits & ~0x800
+        except UnicodeEncodeError:
+            name, flag = info.filename.encode("utf-8"), info.flag_bits | 0x800
+        flag &= ~0x08
+
+        offset = self.f.tell()
+        self.f.write(_LOCAL_HEADER.pack(
+            b"PK\x03\x04", self._extract_version(info), 0, flag, info.compress_type, *self._dos_time(info),
+            info.CRC, info.compress_size, info.file_size, len(name), 0,
+        ))
+        self.f.write(name)
+        self.f.write(data)
+        self.entries.append((info, name, flag, offset))
+
+    def close(self):
+        start = self.f.tell()
+        for info, name, flag, offset in self.entries:
+            comment = info.comment or b""
+            self.f.write(_CENTRAL_HEADER.pack(
+                b"PK\x01\x02", min(info.create_version, 63), info.create_system,
+                self._extract_version(info), 0, flag, info.compress_type, *self._dos_time(info),
+                info.CRC, info.compress_size, info.file_size, len(name), 0, len(comment),
+                0, info.internal_attr, info.external_attr, offset,
+            ))
+            self.f.write(name)
+            self.f.write(comment)
+        size = self.f.tell() - start
+        self.f.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, len(self.entries), len(self.entries), size, start, 0))
+
+    @staticmethod
+    def _extract_version(info: zipfile.ZipInfo) -> int:
+        # zip64 extra 를 옮기지 않으므로 저장/deflate 는 2.0 으로 낮춤
+        if info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return 20
+        return info.extract_version
+
+    @staticmethod
+    def _dos_time(info: zipfile.ZipInfo) -> Tuple[int, int]:
+        y, mo, d, h, mi, sec = info.date_time
+        return (h << 11) | (mi << 5) | (sec // 2), ((y - 1980) << 9) | (mo << 5) | d
+
+
+# -----------------------------
+# 워크북/시트 메타 정보
+# -----------------------------
+def find_sheet_part(zf: zipfile.ZipFile, sheet_name: Optional[str] = None) -> str:
+    """
+    시트명(없으면 활성 시트)에 해당하는 시트 XML 경로 반환. openpyxl의 wb.active 와 같은 규칙.
+    """
+    wb_part = "xl/workbook.xml"
+    root = ET.fromstring(zf.read(wb_part))
+    rels = read_rels(zf, wb_part)
+
+    sheets = root.findall(f"{{{NS_MAIN}}}sheets/{{{NS_MAIN}}}sheet")
+    if not sheets:
+        raise RuntimeError("워크북에 시트가 없습니다.")
+
+    if sheet_name is not None:
+        matched = [s for s in sheets if s.get("name") == sheet_name]
+        if not matched:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        sheet = matched[0]
+    else:
+        view = root.find(f"{{{NS_MAIN}}}bookViews/{{{NS_MAIN}}}workbookView")
+        active = int(view.get("activeTab", 0)) if view is not None else 0
+        sheet = sheets[active] if active < len(sheets) else sheets[0]
+
+    return rels[sheet.get(f"{{{NS_REL}}}id")]
+
+def read_shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    """
+    sharedStrings.xml 을 읽어 인덱스 순서대로 문자열 리스트 반환 (서식 run은 이어붙이고 윗주(rPh)는 제외).
+    """
+    path = "xl/sharedStrings.xml"
+    if path not in zf.namelist():
+        return []
+
+    strings: List[str] = []
+    with zf.open(path) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag != f"{{{NS_MAIN}}}si":
+                continue
+            strings.append(_rich_text(elem))
+            elem.clear()
+    return strings
+
+def _rich_text(elem) -> str:
+    """
+    si / is 요소의 문자열: 바로 아래 t 와 서식 run(r/t)만 이어붙이고 윗주(rPh/t)는 제외 (openpyxl 과 같음).
+    """
+    parts = []
+    for child in elem:
+        if child.tag == f"{{{NS_MAIN}}}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{{{NS_MAIN}}}r":
+            t = child.find(f"{{{NS_MAIN}}}t")
+            if t is not None:
+                parts.append(t.text or "")
+    return "".join(parts)
+
+
+# -----------------------------
+# 셀 값 스트리밍
+# -----------------------------
+def _cast_number(text: str):
+    # openpyxl 과 동일하게 정수로 표현 가능한 값은 int, 나머지는 float
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+def _cell_value(c, shared: List[str]) -> Any:
+    t = c.get("t", "n")
+    if t == "inlineStr":
+        is_ = c.find(f"{{{NS_MAIN}}}is")
+        if is_ is None:
+            return None
+        return _rich_text(is_)
+
+    v = c.find(f"{{{NS_MAIN}}}v")
+    if v is None or v.text is None:
+        return None
+    text = v.text
+
+    if t == "s":
+        return shared[int(text)]
+    if t == "b":
+        return text == "1"
+    if t in ("str", "e"):
+        return text
+    try:
+        return _cast_number(text)
+    except ValueError:
+        return text
+
+def iter_rows(zf: zipfile.ZipFile, sheet_part: str, shared: List[str],
+              max_col: Optional[int] = None) -> Iterator[Tuple[int, Dict[int, Any]]]:
+    """
+    시트 XML을 한 행씩 읽어 (행번호, {열번호: 값}) 을 순서대로 반환. 값이 없는 셀은 포함하지 않음.
+    max_col 을 주면 그보다 오른쪽 열은 읽지 않습니다.
+    """
+    tag_row = f"{{{NS_MAIN}}}row"
+    tag_c = f"{{{NS_MAIN}}}c"
+    tag_sheet_data = f"{{{NS_MAIN}}}sheetData"
+
+    sheet_data = None
+    row_idx = 0
+    with zf.open(sheet_part) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if elem.tag == tag_sheet_data:
+                    sheet_data = elem
+                continue
+            if elem.tag != tag_row:
+                continue
+
+            r = elem.get("r")
+            row_idx = int(r) if r else row_idx + 1
+
+            cells: Dict[int, Any] = {}
+            col_idx = 0
+            for c in elem.iter(tag_c):
+                ref = c.get("r")
+                m = _CELL_REF.match(ref) if ref else None
+                col_idx = column_index(m.group(1)) if m else col_idx + 1
+                if max_col is not None and col_idx > max_col:
+                    continue
+                val = _cell_value(c, shared)
+                if val is not None:
+                    cells[col_idx] = val
+
+            yield row_idx, cells
+
+            # 처리 끝난 행은 트리에서 제거 (메모리 일정 유지)
+            if sheet_data is not None:
+                sheet_data.clear()
+            else:
+                elem.clear()
+
+
+# -----------------------------
+# 이미지 앵커
+# -----------------------------
+def read_image_anchors(zf: zipfile.ZipFile, sheet_part: str) -> List[ImageAnchor]:
+    """
+    시트에 연결된 drawing XML에서 그림(xdr:pic) 앵커 위치와 media 경로만 읽어 반환. 이미지 바이너리는 읽지 않음.
+    """
+    anchors: List[ImageAnchor] = []
+    sheet_rels = read_rels(zf, sheet_part)
+    drawings = [p for p in sheet_rels.values() if "/drawings/" in p and not p.endswith(".vml")]
+
+    for drawing_part in drawings:
+        if drawing_part not in zf.namelist():
+            continue
+        drawing_rels = read_rels(zf, drawing_part)
+        root = ET.fromstring(zf.read(drawing_part))
+
+        for anchor in root:
+            frm = anchor.find(f"{{{NS_XDR}}}from")
+            if frm is None:
+                continue  # absoluteAnchor 는 행 기준 배치가 아니므로 제외
+            blip = anchor.find(f".//{{{NS_XDR}}}pic//{{{NS_A}}}blip")
+            if blip is None:
+                continue
+            media = drawing_rels.get(blip.get(f"{{{NS_REL}}}embed"))
+            if media is None:
+                continue
+
+            row = int(frm.findtext(f"{{{NS_XDR}}}row", "0")) + 1  # 0-based -> 1-based
+            col = int(frm.findtext(f"{{{NS_XDR}}}col", "0")) + 1
+            item = ImageAnchor(row=row, col=col, media=media)
+
+            to = anchor.find(f"{{{NS_XDR}}}to")
+            if to is not None:
+                item.to_row = int(to.findtext(f"{{{NS_XDR}}}row", "0")) + 1
+                item.to_col = int(to.findtext(f"{{{NS_XDR}}}col", "0")) + 1
+
+            # OneCellAnchor 는 xdr:ext, 그 외에는 그림의 a:xfrm/a:ext 에 크기가 있음
+            ext = anchor.find(f"{{{NS_XDR}}}ext")
+            if ext is None:
+                ext = anchor.find(f".//{{{NS_XDR}}}spPr/{{{NS_A}}}xfrm/{{{NS_A}}}ext")
+            if ext is not None:
+                item.cx = int(ext.get("cx", 0))
+                item.cy = int(ext.get("cy", 0))
+
+            anchors.append(item)
+
+    return anchors
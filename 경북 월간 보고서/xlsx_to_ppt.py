@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import io
-from typing import Dict, Optional, List
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+import time
+from typing import Dict, Iterator, Optional, List, Tuple, Union
 
 from pptx import Presentation
 
@@ -11,9 +14,25 @@ from pptx.enum.text import PP_ALIGN
 from pptx.util import Pt, Emu, Cm
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.table import _Cell
 
 from copy import deepcopy
 
+from PIL import Image
+
+import report_trace
+from xlsx_stream import ImageRef, PresizedImage, image_bytes
+
+# 슬라이드에 넣을 그래프 이미지 해상도 (bbox 크기 기준 DPI). None 이면 원본 그대로 삽입
+IMAGE_DPI = 200
+EMU_PER_INCH = 914400
+# 그래프 이미지 사전 처리 단위 (서버 수). 이 묶음 단위로 이미지를 읽고 줄여 슬라이드에 넣음
+PREPARE_CHUNK_SERVERS = 32
+
+# MetricBlock.images 항목: 이미지 바이너리 또는 xlsx 안 위치 (슬라이드에 넣을 때 읽음)
+ImageItem = Union[bytes, ImageRef]
+
 # -----------------------------
 # Data model
 # -----------------------------
@@ -22,12 +41,14 @@ class Stats:
     min: Optional[float] = None
     max: Optional[float] = None
     avg: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
 
 @dataclass
 class MetricBlock:
     # CPU/MEM 은 2개 지표, Network는 IN/OUT 2개 지표 등 복수 가능
     stats_by_metric: Dict[str, Stats]     # e.g. {"CPU": Stats(...), "MEM": Stats(...)}
-    images: List[bytes]                  # 이미지(PNG/JPG 바이너리). 블록 내 이미지 순서대로 담김
+    images: List[ImageItem]              # 이미지(PNG/JPG 바이너리 또는 ImageRef). 블록 내 이미지 순서대로 담김
 
 @dataclass
 class ServerReport:
@@ -72,8 +93,8 @@ def get_table_cell_bbox(table_shape, row: int, col_start: int, col_end: int = No
 
     return left, top, width, height
 
-def add_picture_over_table_cell(slide, table_shape, image_bytes: bytes, row: int, col_start: int, col_end: int = None):
-    bio = io.BytesIO(image_bytes)
+def add_picture_over_table_cell(slide, table_shape, image: ImageItem, row: int, col_start: int, col_end: int = None):
+    bio = io.BytesIO(image_bytes(image))
 
     left, top, width, height = get_table_cell_bbox(table_shape, row, col_start, col_end)
     # left, top, width, height = get_table_cell_bbox_scaled(table_shape, row, col_start, col_end)
@@ -88,6 +109,125 @@ def add_picture_over_table_cell(slide, table_shape, image_bytes: bytes, row: int
     return pic
 
 
+# -----------------------------
+# 그래프 이미지 사전 처리 (bbox 크기로 축소/재압축)
+# -----------------------------
+def _encode_png(img) -> bytes:
+    # optimize=True 는 4배 가까이 느린데 크기는 몇 % 밖에 줄지 않아 기본 압축 사용
+    bio = io.BytesIO()
+    img.save(bio, format="PNG")
+    return bio.getvalue()
+
+def fit_image_to_box(image_bytes: bytes, width_emu: int, height_emu: int, dpi: int) -> bytes:
+    """
+    이미지를 슬라이드 bbox(EMU)를 dpi 로 환산한 픽셀 크기 이하로 줄이고 PNG로 재압축.
+    색이 256개 이하면 팔레트 PNG(무손실)도 만들어 더 작은 쪽을 쓰고,
+    결과가 원본보다 작지 않으면 원본을 그대로 반환합니다.
+    """
+    max_w = max(1, round(width_emu / EMU_PER_INCH * dpi))
+    max_h = max(1, round(height_emu / EMU_PER_INCH * dpi))
+
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        img.load()
+        if img.width > max_w or img.height > max_h:
+            # 슬라이드에서는 bbox 에 맞춰 늘려 그리므로 축별로 줄임
+            img = img.resize((min(img.width, max_w), min(img.height, max_h)), Image.LANCZOS)
+        if img.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+            img = img.convert("RGBA")
+
+        candidates = [_encode_png(img)]
+        if img.mode in ("RGB", "L"):
+            colors = img.getcolors(256)
+            if colors is not None:
+                candidates.append(_encode_png(img.convert("P", palette=Image.ADAPTIVE, colors=len(colors))))
+
+    out = min(candidates, key=len)
+    if len(out) >= len(image_bytes):
+        return image_bytes
+    return out
+
+def _prepare_image(image, box: Tuple[int, int], dpi: int):
+    if isinstance(image, PresizedImage):
+        return image
+    data = image_bytes(image)
+    fitted = fit_image_to_box(data, box[0], box[1], dpi)
+    # 줄일 필요가 없던 이미지는 원래 항목(ImageRef 면 위치만)을 그대로 둠
+    return image if fitted is data else fitted
+
+def _prepare_server_images(first_images: List[Optional[ImageItem]], boxes: List[Tuple[int, int]],
+                           dpi: int) -> List[Optional[ImageItem]]:
+    return [
+        None if img is None else _prepare_image(img, box, dpi)
+        for img, box in zip(first_images, boxes)
+    ]
+
+def _apply_prepared(reports: List[ServerReport], attrs: List[str], prepared) -> List[ServerReport]:
+    results = []
+    for rep, imgs in zip(reports, prepared):
+        changes = {}
+        for a, img in zip(attrs, imgs):
+            block = getattr(rep, a)
+            if img is not None:
+                changes[a] = replace(block, images=[img] + list(block.images[1:]))
+        results.append(replace(rep, **changes))
+    return results
+
+def iter_prepared_reports(reports: List[ServerReport], boxes: Dict[str, Tuple[int, int]],
+                          dpi: int = IMAGE_DPI, parallel: bool = True,
+                          chunk_size: int = PREPARE_CHUNK_SERVERS) -> Iterator[ServerReport]:
+    """
+    슬라이드에 실제로 들어가는 그래프(각 MetricBlock 의 images[0])를 bbox 크기에 맞게 사전 처리해
+    서버 순서대로 하나씩 내보냄. boxes: {ServerReport 속성명: (width_emu, height_emu)}
+    chunk_size 서버씩 프로세스 풀에 보내고(다음 묶음을 미리 보내 둔 채) 현재 묶음을 내보내므로,
+    이미지 바이너리는 처리 중인 두 묶음만큼만 메모리에 있습니다. 원본 report 는 바꾸지 않습니다.
+    """
+    attrs = list(boxes)
+    box_list = [boxes[a] for a in attrs]
+
+    def job(rep):
+        # ImageRef 는 위치만 worker 로 보내고, 읽기/축소는 worker 에서
+        # 칸 크기로 그린 그래프(PresizedImage)는 처리할 것이 없어 보내지 않음 (None 이면 원래 이미지 유지)
+        images = [getattr(rep, a).images[0] if getattr(rep, a).images else None for a in attrs]
+        return [None if isinstance(img, PresizedImage) else img for img in images]
+
+    tracer = report_trace.current()
+    chunks = [reports[i:i + chunk_size] for i in range(0, len(reports), max(1, chunk_size))]
+    workers = os.cpu_count() or 1
+    if not (parallel and len(reports) > 1 and workers > 1):
+        for chunk in chunks:
+            t0 = time.perf_counter()
+            prepared = [_prepare_server_images(job(rep), box_list, dpi) for rep in chunk]
+            tracer.event("prepare_images", time.perf_counter() - t0, servers=len(chunk), dpi=dpi)
+            yield from _apply_prepared(chunk, attrs, prepared)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = None
+        for chunk in chunks + [None]:
+            submitted = None
+            if chunk is not None:
+                items = [job(rep) for rep in chunk]
+                submitted = (chunk, [
+                    pool.submit(_prepare_server_images, imgs, box_list, dpi)
+                    if any(img is not None for img in imgs) else imgs
+                    for imgs in items
+                ])
+            if pending is not None:
+                t0 = time.perf_counter()
+                prepared = [f.result() if isinstance(f, Future) else f for f in pending[1]]
+                # 슬라이드 채우기와 겹쳐 돌기 때문에 결과를 기다린 시간만 기록
+                tracer.event("prepare_images", time.perf_counter() - t0, servers=len(pending[0]), dpi=dpi)
+                yield from _apply_prepared(pending[0], attrs, prepared)
+            pending = submitted
+
+def prepare_report_images(reports: List[ServerReport], boxes: Dict[str, Tuple[int, int]],
+                          dpi: int = IMAGE_DPI, parallel: bool = True) -> List[ServerReport]:
+    """
+    iter_prepared_reports 결과를 한 번에 리스트로 반환.
+    """
+    return list(iter_prepared_reports(reports, boxes, dpi=dpi, parallel=parallel))
+
+
 # -----------------------------
 # PPT 테이블 찾기 함수
 # -----------------------------
@@ -140,6 +280,54 @@ def set_cell_text_style(
         font.bold = True
 
 
+# 표 셀 스타일: (정렬, 글꼴, 글꼴 크기, 굵게, 글꼴 색)
+_NAME_CELL_STYLE = ("center", "맑은 고딕", 10, True, RGBColor(0xFF, 0xFF, 0xFF))
+_STAT_CELL_STYLE = ("right", "맑은 고딕", 8, False, RGBColor(0x00, 0x00, 0x00))
+
+# 서버 슬라이드에서 채우는 표 셀 위치 (row, col, 스타일). 순서는 _report_cell_values 와 같아야 함
+_REPORT_CELL_LAYOUT = [
+    (0, 0, _NAME_CELL_STYLE),                                                       # 서버명
+    (3, 2, _STAT_CELL_STYLE), (3, 3, _STAT_CELL_STYLE), (3, 4, _STAT_CELL_STYLE),    # CPU max/min/avg
+    (4, 2, _STAT_CELL_STYLE), (4, 3, _STAT_CELL_STYLE), (4, 4, _STAT_CELL_STYLE),    # MEM
+    (8, 2, _STAT_CELL_STYLE), (8, 3, _STAT_CELL_STYLE), (8, 4, _STAT_CELL_STYLE),    # In bps
+    (9, 2, _STAT_CELL_STYLE), (9, 3, _STAT_CELL_STYLE), (9, 4, _STAT_CELL_STYLE),    # Out bps
+    (13, 2, _STAT_CELL_STYLE), (13, 3, _STAT_CELL_STYLE), (13, 4, _STAT_CELL_STYLE), # 파일시스템
+]
+
+# 그래프 이미지 위치: (ServerReport 속성명, 표 row, col_start, col_end)
+_REPORT_IMAGE_LAYOUT = [
+    ("cpu_mem", 1, 1, 4),
+    ("network", 6, 1, 4),
+    ("filesystem", 11, 1, 4),
+]
+
+def _cell_text(value) -> str:
+    """
+    표 셀에 쓸 문자열. 원시 시계열로 계산한 숫자는 SMS 요약표와 같은 소수 둘째 자리로,
+    요약표에서 읽은 값은 그대로, 값이 없으면 빈 칸.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+def _report_cell_values(report: ServerReport) -> list:
+    """
+    _REPORT_CELL_LAYOUT 순서대로 표에 넣을 값 리스트 반환.
+    """
+    # Excel 에 없는 지표(요약표를 못 찾은 블록 등)는 빈 칸으로 둠
+    cpu_stats = report.cpu_mem.stats_by_metric.get("● CPU Used (%)", Stats())
+    mem_stats = report.cpu_mem.stats_by_metric.get("● MEM Used (%)", Stats())
+    in_stats = report.network.stats_by_metric.get("● In bps (bps)", Stats())
+    out_stats = report.network.stats_by_metric.get("● Out bps (bps)", Stats())
+    fs_stats = report.filesystem.stats_by_metric.get("● 파일시스템 사용률 (%)", Stats())
+
+    values = [report.server_name]
+    for st in (cpu_stats, mem_stats, in_stats, out_stats, fs_stats):
+        values += [st.max, st.min, st.avg]
+    return values
+
 def populate_slide_with_report(
     slide,
     report: ServerReport
@@ -148,42 +336,17 @@ def populate_slide_with_report(
     table_shape = find_main_table(slide)
     tbl = table_shape.table
 
-    # ---- 2) 서버명 삽입 ----
-    set_cell_text_style(tbl.cell(0,0), "center", "맑은 고딕", 10, report.server_name, True, RGBColor(0xFF, 0xFF, 0xFF))
-
-    # ---- 2) 표 채우기 및 그래프 이미지 삽입 (이름 기반 우선) ----
-    cpu_mem = report.cpu_mem
-    cpu_stats = cpu_mem.stats_by_metric["● CPU Used (%)"]
-    mem_stats = cpu_mem.stats_by_metric["● MEM Used (%)"]
-    cpu_mem_images = cpu_mem.images
-    set_cell_text_style(tbl.cell(3, 2), "right", "맑은 고딕", 8, cpu_stats.max)
-    set_cell_text_style(tbl.cell(3, 3), "right", "맑은 고딕", 8, cpu_stats.min)
-    set_cell_text_style(tbl.cell(3, 4), "right", "맑은 고딕", 8, cpu_stats.avg)
-    set_cell_text_style(tbl.cell(4, 2), "right", "맑은 고딕", 8, mem_stats.max)
-    set_cell_text_style(tbl.cell(4, 3), "right", "맑은 고딕", 8, mem_stats.min)
-    set_cell_text_style(tbl.cell(4, 4), "right", "맑은 고딕", 8, mem_stats.avg)
-    add_picture_over_table_cell(slide, table_shape, image_bytes=cpu_mem_images[0], row=1, col_start=1, col_end=4)
-
-    network = report.network
-    network_stats = network.stats_by_metric
-    network_images = network.images
-    set_cell_text_style(tbl.cell(8, 2), "right", "맑은 고딕", 8, network_stats["● In bps (bps)"].max)
-    set_cell_text_style(tbl.cell(8, 3), "right", "맑은 고딕", 8, network_stats["● In bps (bps)"].min)
-    set_cell_text_style(tbl.cell(8, 4), "right", "맑은 고딕", 8, network_stats["● In bps (bps)"].avg)
-    set_cell_text_style(tbl.cell(9, 2), "right", "맑은 고딕", 8, network_stats["● Out bps (bps)"].max)
-    set_cell_text_style(tbl.cell(9, 3), "right", "맑은 고딕", 8, network_stats["● Out bps (bps)"].min)
-    set_cell_text_style(tbl.cell(9, 4), "right", "맑은 고딕", 8, network_stats["● Out bps (bps)"].avg)
-    add_picture_over_table_cell(slide, table_shape, image_bytes=network_images[0], row=6, col_start=1, col_end=4)
-    # replace_picture_in_bbox(tbl.cell(6, 1), network_images[0])
-
-    filesystem = report.filesystem
-    filesystem_stats = filesystem.stats_by_metric
-    filesystem_images = filesystem.images
-    set_cell_text_style(tbl.cell(13, 2), "right", "맑은 고딕", 8, filesystem_stats["● 파일시스템 사용률 (%)"].max)
-    set_cell_text_style(tbl.cell(13, 3), "right", "맑은 고딕", 8, filesystem_stats["● 파일시스템 사용률 (%)"].min)
-    set_cell_text_style(tbl.cell(13, 4), "right", "맑은 고딕", 8, filesystem_stats["● 파일시스템 사용률 (%)"].avg)
-    add_picture_over_table_cell(slide, table_shape, image_bytes=filesystem_images[0], row=11, col_start=1, col_end=4)
-    # replace_picture_in_bbox(tbl.cell(11, 1), report.filesystem.images[0])
+    # ---- 2) 서버명 삽입 및 표 채우기 ----
+    for (row, col, style), value in zip(_REPORT_CELL_LAYOUT, _report_cell_values(report)):
+        align, font_name, font_size, is_bold, font_color = style
+        set_cell_text_style(tbl.cell(row, col), align, font_name, font_size, _cell_text(value), is_bold, font_color)
+
+    # ---- 3) 그래프 이미지 삽입 (그래프가 없는 블록은 칸을 비워 둠) ----
+    for attr, row, col_start, col_end in _REPORT_IMAGE_LAYOUT:
+        images = getattr(report, attr).images
+        if not images:
+            continue
+        add_picture_over_table_cell(slide, table_shape, images[0], row=row, col_start=col_start, col_end=col_end)
 
 # -----------------------------
 # PPT 제목 플레이스홀더 클리어 함수
@@ -222,16 +385,107 @@ def duplicate_slide(prs, slide_index=0):
 
 
 # -----------------------------
-# PPT 빌드 함수 (안전 버전)
+# 컴파일된 템플릿 (서버 수백 대용)
 # -----------------------------
-def build_ppt_from_template(template_pptx, output_pptx,reports, date):
+class CompiledSlideTemplate:
+    """
+    템플릿 슬라이드를 한 번만 분석해 두고 서버별 슬라이드를 찍어내는 템플릿.
+    - 표 셀 스타일(정렬/글꼴/색)을 미리 적용한 shape XML 트리를 만들어 두고
+    - 값이 들어갈 a:t 요소의 트리 경로(자식 인덱스 목록)와 그래프 이미지 bbox 를 미리 계산
+    → 슬라이드마다 트리 복사 1번 + 텍스트 대입 + 이미지 삽입만 수행합니다.
+    """
+    def __init__(self, prs, slide_index: int = 0):
+        source = prs.slides[slide_index]
+        self.layout = source.slide_layout
+
+        shapes = list(source.shapes)
+        table_shape = find_main_table(source)
+        if table_shape is None:
+            raise ValueError("템플릿 슬라이드에서 표를 찾을 수 없습니다.")
+        self._table_pos = [shp.element for shp in shapes].index(table_shape.element)
+
+        # 원본 슬라이드는 건드리지 않고 복사본에 셀 스타일을 적용
+        self._elements = [deepcopy(shp.element) for shp in shapes]
+        table_el = self._elements[self._table_pos]
+        tbl = table_el.xpath(".//a:tbl")[0]
+
+        self._text_paths: List[List[int]] = []
+        for row, col, style in _REPORT_CELL_LAYOUT:
+            align, font_name, font_size, is_bold, font_color = style
+            tc = tbl.tr_lst[row].tc_lst[col]
+            set_cell_text_style(_Cell(tc, None), align, font_name, font_size, "", is_bold, font_color)
+            t = tc.xpath("./a:txBody/a:p/a:r/a:t")[0]
+            self._text_paths.append(self._path_from(table_el, t))
+
+        self._image_boxes = [
+            (attr, get_table_cell_bbox(table_shape, row, col_start, col_end))
+            for attr, row, col_start, col_end in _REPORT_IMAGE_LAYOUT
+        ]
+
+    @staticmethod
+    def _path_from(root, el) -> List[int]:
+        path = []
+        while el is not root:
+            parent = el.getparent()
+            path.append(parent.index(el))
+            el = parent
+        return path[::-1]
+
+    def _fill(self, slide, report: ServerReport):
+        sp_tree = slide.shapes._spTree
+        copies = [deepcopy(el) for el in self._elements]
+        for el in copies:
+            sp_tree.insert_element_before(el, 'p:extLst')
+
+        table_el = copies[self._table_pos]
+        for path, value in zip(self._text_paths, _report_cell_values(report)):
+            node = table_el
+            for i in path:
+                node = node[i]
+            node.text = _cell_text(value)
+
+        for attr, (left, top, width, height) in self._image_boxes:
+            images = getattr(report, attr).images
+            if not images:
+                continue
+            slide.shapes.add_picture(io.BytesIO(image_bytes(images[0])), left, top, width=width, height=height)
+
+    def add_slide(self, prs, report: ServerReport):
+        """
+        템플릿 레이아웃으로 새 슬라이드를 만들고 report 값을 채워 반환.
+        """
+        new_slide = prs.slides.add_slide(self.layout)
+        # 레이아웃이 만든 기본 제목 제거
+        clear_title_placeholders(new_slide)
+        self._fill(new_slide, report)
+        return new_slide
+
+    def populate(self, slide, report: ServerReport):
+        """
+        템플릿 슬라이드 자신을 report 로 채움 (기존 shape 를 컴파일된 트리로 교체).
+        """
+        sp_tree = slide.shapes._spTree
+        for shp in list(slide.shapes):
+            sp_tree.remove(shp.element)
+        self._fill(slide, report)
 
-    prs = Presentation(template_pptx)
-    if not reports:
-        raise ValueError("reports가 비어 있습니다.")
-    
-    # 날짜 수정
-    for shape in prs.slides[0].shapes:
+
+# -----------------------------
+# PPT 빌드 함수 (안전 버전)
+# -----------------------------
+def _move_appended_slides(prs, n_before: int, position: int):
+    """
+    n_before 번째 이후에 추가된 슬라이드들을 순서를 유지한 채 position 위치로 옮김.
+    (뒤쪽 고정 슬라이드가 있는 덱에서 서버 슬라이드를 본문 자리에 끼워 넣을 때 사용)
+    """
+    sld_id_lst = prs.slides._sldIdLst
+    appended = list(sld_id_lst)[n_before:]
+    for offset, sld_id in enumerate(appended):
+        sld_id_lst.remove(sld_id)
+        sld_id_lst.insert(position + offset, sld_id)
+
+def _set_template_date(template_slide, date):
+    for shape in template_slide.shapes:
         if not shape.name=="날짜": continue
         if not shape.has_text_frame:continue
         tf = shape.text_frame
@@ -245,19 +499,185 @@ def build_ppt_from_template(template_pptx, output_pptx,reports, date):
         for r in p.runs[1:]:
             r.text = ""
         run.text = f"(기간: {date})"
-        
 
-    # 템플릿 슬라이드(0번)를 report 수만큼 확장
-    while len(prs.slides) < len(reports):
-        duplicate_slide(prs, slide_index=0)
+def report_image_boxes(template_slide) -> Dict[str, Tuple[int, int]]:
+    """
+    템플릿 슬라이드의 그래프 칸 크기 {ServerReport 속성명: (width_emu, height_emu)}.
+    """
+    table_shape = find_main_table(template_slide)
+    return {
+        attr: get_table_cell_bbox(table_shape, row, col_start, col_end)[2:]
+        for attr, row, col_start, col_end in _REPORT_IMAGE_LAYOUT
+    }
 
-    # 각 슬라이드에 각 report 매핑
-    for i, rep in enumerate(reports):
-        populate_slide_with_report(prs.slides[i], rep)
+def report_chart_sizes(template_pptx, slide_index: int = 0, dpi: int = IMAGE_DPI) -> Dict[str, Tuple[int, int]]:
+    """
+    그래프 칸을 dpi 로 환산한 픽셀 크기 {ServerReport 속성명: (width_px, height_px)}.
+    원시 시계열로 그래프를 직접 그릴 때 슬라이드에 들어갈 크기 그대로 그리기 위해 사용.
+    """
+    template_slide = Presentation(template_pptx).slides[slide_index]
+    return {
+        attr: (max(1, round(w / EMU_PER_INCH * dpi)), max(1, round(h / EMU_PER_INCH * dpi)))
+        for attr, (w, h) in report_image_boxes(template_slide).items()
+    }
+
+def _prepare_images_for_template(template_slide, reports, image_dpi: Optional[int], parallel: bool):
+    if not image_dpi:
+        return iter(reports)
+    return iter_prepared_reports(reports, report_image_boxes(template_slide), dpi=image_dpi, parallel=parallel)
+
+def _fill_report_slides(prs, reports, date, body_start: int = 0, body_count: Optional[int] = None,
+                        compiled: bool = True, image_dpi: Optional[int] = IMAGE_DPI, parallel: bool = True):
+    """
+    prs 의 body_start 번째 슬라이드를 서버 슬라이드 템플릿으로 사용해 reports 를 채움.
+    - body_start ~ body_start+body_count-1 : 템플릿에 원래 있던 본문 슬라이드 (순서대로 채움)
+    - 모자란 만큼 새 슬라이드를 만들어 본문 슬라이드 바로 뒤에 끼워 넣음
+    """
+    if not reports:
+        raise ValueError("reports가 비어 있습니다.")
+    if body_count is None:
+        body_count = len(prs.slides) - body_start
+    template_slide = prs.slides[body_start]
+
+    # 날짜 수정
+    _set_template_date(template_slide, date)
+
+    tracer = report_trace.current()
+
+    # 그래프 이미지 사전 처리 (묶음 단위로 처리되는 대로 슬라이드에 넣음)
+    n_reports = len(reports)
+    reports = _prepare_images_for_template(template_slide, reports, image_dpi, parallel)
+
+    n_before = len(prs.slides)
+    if compiled:
+        template = CompiledSlideTemplate(prs, slide_index=body_start)
+        for i, rep in enumerate(reports):
+            with tracer.timed("populate_server", server=rep.server_name):
+                if i == 0:
+                    template.populate(template_slide, rep)
+                elif i < body_count:
+                    populate_slide_with_report(prs.slides[body_start + i], rep)
+                else:
+                    template.add_slide(prs, rep)
+    else:
+        # 템플릿 슬라이드를 report 수만큼 확장
+        while body_count + (len(prs.slides) - n_before) < n_reports:
+            duplicate_slide(prs, slide_index=body_start)
+
+        # 각 슬라이드에 각 report 매핑
+        slides = list(prs.slides)
+        for i, rep in enumerate(reports):
+            idx = body_start + i if i < body_count else n_before + (i - body_count)
+            with tracer.timed("populate_server", server=rep.server_name):
+                populate_slide_with_report(slides[idx], rep)
+
+    if len(prs.slides) > n_before and body_start + body_count < n_before:
+        _move_appended_slides(prs, n_before, body_start + body_count)
+
+def build_ppt_from_template(template_pptx, output_pptx,reports, date, compiled: bool = True,
+                            image_dpi: Optional[int] = IMAGE_DPI):
+    """
+    compiled=True(기본)면 CompiledSlideTemplate 로 슬라이드를 생성하고,
+    False면 기존 방식(duplicate_slide + populate_slide_with_report)으로 생성합니다.
+    image_dpi 가 있으면 그래프 이미지를 삽입 전에 bbox 크기(해당 DPI)로 줄여 재압축합니다.
+    """
+    prs = Presentation(template_pptx)
+    _fill_report_slides(prs, reports, date, compiled=compiled, image_dpi=image_dpi)
 
     prs.save(output_pptx)
     print(f"PPTX 파일 생성 완료: {output_pptx}")
 
+def build_report_deck(combined_pptx, output_pptx, reports, date, body_start: int, body_count: int,
+                      compiled: bool = True, image_dpi: Optional[int] = IMAGE_DPI, parallel: bool = True):
+    """
+    앞/본문/뒤 템플릿이 이미 하나로 합쳐진 덱(merge_templates_cached 결과)에
+    서버 슬라이드를 바로 채워 output_pptx 로 한 번만 저장.
+    build → save → merge → reload 과정 없이 최종 월간보고서를 만듭니다.
+    body_start/body_count: 합쳐진 덱에서 본문(template02) 슬라이드의 시작 위치와 개수
+    parallel=False 면 그래프 이미지 사전 처리를 현재 프로세스에서만 수행
+    """
+    prs = Presentation(combined_pptx)
+    _fill_report_slides(prs, reports, date, body_start=body_start, body_count=body_count,
+                        compiled=compiled, image_dpi=image_dpi, parallel=parallel)
+
+    prs.save(output_pptx)
+    print(f"PPTX 파일 생성 완료: {output_pptx}")
+
+def _clear_slide(slide):
+    """
+    슬라이드의 shape 와 그림 관계를 모두 제거 (이전 그래프 이미지가 파일에 남지 않도록).
+    add_picture 는 같은 이미지의 기존 관계를 재사용하므로, 다시 채우기 전에 정리해야 합니다.
+    """
+    sp_tree = slide.shapes._spTree
+    for shp in list(slide.shapes):
+        sp_tree.remove(shp.element)
+    for rId, rel in list(slide.part.rels.items()):
+        if rel.reltype == RT.IMAGE:
+            slide.part.drop_rel(rId)
+
+def update_report_deck(previous_pptx, combined_pptx, output_pptx, reports, previous_servers: List[str],
+                       stale: set, date, body_start: int, image_dpi: Optional[int] = IMAGE_DPI,
+                       parallel: bool = True):
+    """
+    이전에 만든 월간보고서(previous_pptx)에서 바뀐 서버 슬라이드만 다시 만들어 output_pptx 로 저장.
+    previous_servers: previous_pptx 의 서버 슬라이드 순서 (body_start 부터 한 장씩)
+    stale: 다시 채울 서버명 (값/그래프가 바뀐 서버). reports 에 없는 서버의 슬라이드는 삭제하고,
+           previous_servers 에 없는 서버는 새 슬라이드를 추가한 뒤 reports 순서로 정렬합니다.
+    템플릿/날짜/이미지 해상도가 바뀐 경우에는 쓰지 말고 build_report_deck 으로 전체를 다시 만드세요.
+    """
+    if not reports:
+        raise ValueError("reports가 비어 있습니다.")
+
+    # 서버 슬라이드는 원본 본문 템플릿에서 컴파일 (이전 덱의 본문 슬라이드는 이미 채워져 있음)
+    template_prs = Presentation(combined_pptx)
+    template_slide = template_prs.slides[body_start]
+    _set_template_date(template_slide, date)
+    template = CompiledSlideTemplate(template_prs, slide_index=body_start)
+
+    prs = Presentation(previous_pptx)
+    sld_id_lst = prs.slides._sldIdLst
+    sld_ids = list(sld_id_lst)
+    slide_by_server = {
+        name: (sld_ids[body_start + i], prs.slides[body_start + i])
+        for i, name in enumerate(previous_servers)
+    }
+    # 새 슬라이드도 이전 서버 슬라이드와 같은 레이아웃으로 (템플릿 덱의 레이아웃은 다른 패키지 소속)
+    template.layout = prs.slides[body_start].slide_layout
+
+    current = {rep.server_name for rep in reports}
+    for name, (sld_id, _) in list(slide_by_server.items()):
+        if name in current:
+            continue
+        sld_id_lst.remove(sld_id)
+        prs.part.drop_rel(sld_id.rId)
+        del slide_by_server[name]
+    # 새 슬라이드 파트명(slide{n+1}.xml)이 남은 슬라이드와 겹치지 않도록 번호를 다시 매김
+    prs.part.rename_slide_parts([sld_id.rId for sld_id in sld_id_lst])
+
+    targets = [rep for rep in reports if rep.server_name in stale or rep.server_name not in slide_by_server]
+
+    tracer = report_trace.current()
+    for rep in _prepare_images_for_template(template_slide, targets, image_dpi, parallel):
+        with tracer.timed("populate_server", server=rep.server_name):
+            if rep.server_name in slide_by_server:
+                _, slide = slide_by_server[rep.server_name]
+                _clear_slide(slide)
+                template.populate(slide, rep)
+            else:
+                template.add_slide(prs, rep)
+                slide_by_server[rep.server_name] = (list(sld_id_lst)[-1], prs.slides[-1])
+
+    # 서버 슬라이드를 reports 순서로 본문 자리에 다시 배치
+    ordered = [slide_by_server[rep.server_name][0] for rep in reports]
+    for sld_id in ordered:
+        sld_id_lst.remove(sld_id)
+    for offset, sld_id in enumerate(ordered):
+        sld_id_lst.insert(body_start + offset, sld_id)
+    prs.part.rename_slide_parts([sld_id.rId for sld_id in sld_id_lst])
+
+    prs.save(output_pptx)
+    print(f"PPTX 파일 갱신 완료: {output_pptx} (서버 슬라이드 {len(targets)}장 다시 생성)")
+
 
 # -----------------------------
 # Example usage
@@ -1,12 +1,20 @@
 import openpyxl
 import re
 import os
+import csv
+import functools
+import zipfile
+import posixpath
+import html
 import openpyxl.workbook
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+import xml.etree.ElementTree as ET
 
 
 # 사용자 입력값 (예시)
-start_row = 11  # A열의 시작 행 (필요에 따라 수정)
-max_search_rows = 280
+start_row = 11  # A열의 시작 행 (필요에 따라 수정). 이 행부터 끝까지 파드 블록(■ 헤더)을 찾는다
+reader_cache_size = 64  # 읽은 파일 결과를 몇 개까지 기억할지 (같은 파일을 다시 읽으면 재사용)
 
 string_list = ['hwabul-master01', 'hwabul-master02', 'hwabul-master03', 'hwabul-ingress01', 'hwabul-ingress02', 'hwabul-ingress03', 
                 'hwabul-node01', 'hwabul-node02', 'hwabul-node03', 'hwabul-node04', 'hwabul-node05', 'hwabul-node06', 'hwabul-node07', 
@@ -14,6 +22,17 @@ string_list = ['hwabul-master01', 'hwabul-master02', 'hwabul-master03', 'hwabul-
                 'hwabul-webhwp', 'hwabul-nas', 'SECLOUDiT-Console', 'SECLOUDiT-LB', 'SECLOUDiT-Logging', 'SECLOUDiT-Registry', 'hwabul-v3', 
                 'hwabul-ngs', 'hwabul-petra', 'hwabul-cspm1', 'hwabul-webfilter', 'hwabul-commgt'] # 정렬 순서를 위한 문자열 리스트
 pattern = r'■ (.*?) \(' #  r'■ ([^(]+) \('
+header_pattern = re.compile(r'^\s*■')  # 파드 블록 헤더 (A열)
+
+# 블록 안에서 값(H열)을 읽을 행을 찾는 A열 라벨 (영문 단어는 앞뒤가 영문자가 아닐 때만 일치)
+# 리소스 파일은 (CPU, MEM), 네트워크 파일은 (수신, 송신) 순서로 반환
+def _label(words):
+    return re.compile('|'.join(w if not w.isascii() else rf'(?<![a-z]){w}(?![a-z])' for w in words), re.I)
+
+value_labels = [
+    (_label(['cpu']), _label(['mem', 'memory', '메모리'])),
+    (_label(['in', 'rx', 'receive', '수신']), _label(['out', 'tx', 'transmit', '송신'])),
+]
 
 
 ### 파일 이름 읽어오기
@@ -28,66 +47,592 @@ def get_filenames(dir):
     return file_list
 
 
+### 엑셀 값 스트리밍 읽기 (필요한 열만)
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+READ_CHUNK = 1024 * 1024
+
+_CELL = re.compile(rb'<c\b[^>]*?\br=["\']([A-Z]+)(\d+)["\']([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_CELL_TYPE = re.compile(rb'\bt=["\'](\w+)["\']')
+_CELL_V = re.compile(rb'<v>(.*?)</v>', re.S)
+_CELL_T = re.compile(rb'<t[^>]*>(.*?)</t>', re.S)
+_CELL_RPH = re.compile(rb'<rPh\b.*?</rPh>', re.S)  # 윗주(rPh) 는 값에서 제외
+
+
+def _active_sheet_path(zf):
+    """
+    ## 활성 시트 XML 경로
+    openpyxl 의 wb.active 와 같은 시트 (workbookView 의 activeTab, 없으면 첫 번째 시트)
+    """
+    root = ET.fromstring(zf.read('xl/workbook.xml'))
+    view = root.find(f'{NS_MAIN}bookViews/{NS_MAIN}workbookView')
+    active = int(view.get('activeTab', 0)) if view is not None else 0
+    sheets = root.findall(f'{NS_MAIN}sheets/{NS_MAIN}sheet')
+    rid = sheets[min(active, len(sheets) - 1)].get(f'{NS_REL}id')
+
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iter(f'{NS_PKG_REL}Relationship'):
+        if rel.get('Id') == rid:
+            target = rel.get('Target')
+            return target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+    raise KeyError(f'{rid} 시트를 찾을 수 없습니다.')
+
+
+def _read_shared_strings(zf, wanted):
+    """
+    ## 공유 문자열 중 필요한 것만 읽기
+    sharedStrings.xml 을 스트리밍으로 읽으며 wanted(인덱스 집합)에 있는 문자열만 남긴다.
+    """
+    found = {}
+    if not wanted or 'xl/sharedStrings.xml' not in zf.namelist():
+        return found
+    last = max(wanted)
+    idx = 0
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, el in ET.iterparse(f):
+            if el.tag != f'{NS_MAIN}si':
+                continue
+            if idx in wanted:
+                # 서식이 섞인 문자열(r 요소 여러 개)은 t 를 모두 이어 붙이고, 윗주(rPh)는 제외 (openpyxl 과 같음)
+                parts = []
+                for child in el:
+                    if child.tag == f'{NS_MAIN}t':
+                        parts.append(child.text or '')
+                    elif child.tag == f'{NS_MAIN}r':
+                        t = child.find(f'{NS_MAIN}t')
+                        if t is not None:
+                            parts.append(t.text or '')
+                found[idx] = ''.join(parts)
+            el.clear()
+            idx += 1
+            if idx > last:
+                break
+    return found
+
+
+def _cell_value(kind, body):
+    if body is None:
+        return None
+    if kind == b'inlineStr':
+        return html.unescape(b''.join(_CELL_T.findall(_CELL_RPH.sub(b'', body))).decode('utf-8'))
+    m = _CELL_V.search(body)
+    if m is None:
+        return None
+    raw = m.group(1).decode('utf-8')
+    if kind == b's':
+        return int(raw)  # 공유 문자열 인덱스 (나중에 문자열로 바꿈)
+    if kind in (b'str', b'e'):
+        return html.unescape(raw)
+    if kind == b'b':
+        return raw == '1'
+    try:
+        return float(raw) if any(ch in raw for ch in '.eE') else int(raw)
+    except ValueError:
+        return raw
+
+
+def read_columns(file_path, columns=('A', 'H'), max_row=None):
+    """
+    ## 필요한 열의 값만 스트리밍으로 읽기
+    openpyxl 로 워크북 전체(서식, 수식 포함)를 올리지 않고, 활성 시트 XML 을 조금씩 읽으며
+    columns 에 해당하는 셀의 값만 골라낸다. max_row 가 있으면 그 행까지만 읽고 멈춘다.
+    수식 셀은 저장된 계산 결과를 읽는다.
+
+    Args:
+        file_path: 엑셀 파일 경로
+        columns: 읽을 열 (예: ('A', 'H'))
+        max_row: 마지막으로 읽을 행 번호. None 이면 끝까지
+
+    Returns:
+        {행 번호: {열: 값}}
+    """
+    wanted_cols = {c.encode() for c in columns}
+    rows = {}
+    shared = []  # (행, 열, 공유 문자열 인덱스)
+
+    with zipfile.ZipFile(file_path) as zf:
+        with zf.open(_active_sheet_path(zf)) as f:
+            buf = b''
+            done = False
+            while not done:
+                chunk = f.read(READ_CHUNK)
+                buf += chunk
+                # 마지막 완성된 행까지만 처리하고 나머지는 다음 조각과 이어 붙임
+                if chunk:
+                    end = buf.rfind(b'</row>')
+                    if end < 0:
+                        continue
+                    end += len(b'</row>')
+                else:
+                    end = len(buf)
+                    done = True
+                for m in _CELL.finditer(buf, 0, end):
+                    col, row = m.group(1), int(m.group(2))
+                    if max_row is not None and row > max_row:
+                        done = True
+                        break
+                    if col not in wanted_cols:
+                        continue
+                    type_m = _CELL_TYPE.search(m.group(3))
+                    kind = type_m.group(1) if type_m else b'n'
+                    value = _cell_value(kind, m.group(4))
+                    if value is None:
+                        continue
+                    col = col.decode()
+                    if kind == b's':
+                        shared.append((row, col, value))
+                    rows.setdefault(row, {})[col] = value
+                buf = buf[end:]
+
+        strings = _read_shared_strings(zf, {idx for _, _, idx in shared})
+
+    for row, col, idx in shared:
+        rows[row][col] = strings.get(idx)
+    return rows
+
+
 ### 리소스 데이터 읽어오기
-def read_data(file_path, a_i_data={}):
-    # 워크북 로드 및 시트 선택
-    wb = openpyxl.load_workbook(file_path)
-    sheet = wb.active
-
-    # 데이터 추출 로직
-    for row in range(start_row, max_search_rows + 1, 8):
-        s = sheet[f'A{row}'].value
-        if s is not None:
-            s = re.search(pattern, s).group(1)
-            a_value = s.replace('#','').replace(' ','')
-            i_value = (sheet[f'H{row + 4}'].value, sheet[f'H{row + 5}'].value)
-            a_i_data[a_value] = i_value
-            
-    wb.close()
+def _pod_name(header):
+    m = re.search(pattern, header)
+    # "■ 파드명 (IP)" 형식이 아니면 ■ 뒤, 괄호 앞까지를 파드명으로
+    name = m.group(1) if m else header.strip().lstrip('■').split('(')[0]
+    return name.replace('#','').replace(' ','')
+
+
+def _block_values(cells, header_row, labels):
+    """
+    ## 블록의 값 읽기
+    블록 안 A열 라벨로 값 행을 찾아 H열 값 2개를 반환한다.
+    라벨을 못 찾으면 기존 위치(헤더 +4, +5행)를 사용한다.
+    """
+    for first_label, second_label in value_labels:
+        first = next((row for row, label in labels if first_label.search(label)), None)
+        second = next((row for row, label in labels if second_label.search(label)), None)
+        if first is not None and second is not None:
+            return (cells[first].get('H'), cells[second].get('H'))
+    return (cells.get(header_row + 4, {}).get('H'), cells.get(header_row + 5, {}).get('H'))
+
+
+@functools.lru_cache(maxsize=reader_cache_size)
+def _read_blocks(file_path, mtime_ns, size):
+    """
+    ## 파일 하나의 파드별 값 (캐시)
+    (경로, 수정 시각, 크기)가 같으면 파일을 다시 읽지 않고 이전 결과를 돌려준다.
+    파일이 바뀌면 키가 달라져 새로 읽고, 오래된 결과는 LRU 로 밀려난다.
+    결과는 호출한 쪽에서 바꿀 수 없도록 ((파드명, (값1, 값2)), ...) 튜플로 반환한다.
+    """
+    # A열(파드명/라벨)과 H열(값)만 스트리밍으로 읽음
+    cells = read_columns(file_path, columns=('A', 'H'))
+
+    # 데이터 추출 로직: 행을 한 번 훑으며 ■ 헤더마다 블록을 나누고, 블록 안 라벨 행을 모음
+    blocks = []
+    block = None  # (파드명, 헤더 행, [(행, 라벨)])
+    for row in sorted(cells):
+        if row < start_row:
+            continue
+        a = cells[row].get('A')
+        if not isinstance(a, str):
+            continue
+        if header_pattern.match(a):
+            if block is not None:
+                blocks.append((block[0], _block_values(cells, block[1], block[2])))
+            block = (_pod_name(a), row, [])
+        elif block is not None:
+            block[2].append((row, a))
+
+    if block is not None:
+        blocks.append((block[0], _block_values(cells, block[1], block[2])))
+
+    return tuple(blocks)
+
+
+def read_data(file_path, a_i_data=None):
+    """
+    ## 리소스/트래픽 데이터 읽어오기
+    파일의 파드별 값을 {파드명: (값1, 값2)} 로 반환한다. (리소스: CPU, MEM / 네트워크: 수신, 송신)
+    a_i_data 를 넘기면 그 dict 에 더해서 반환하고 (part1/part2 합치기), 없으면 호출마다 새 dict 를 만든다.
+    같은 파일을 다시 읽으면 캐시(_read_blocks)를 사용한다.
+    """
+    stat = os.stat(file_path)
+    blocks = _read_blocks(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
 
+    if a_i_data is None:
+        a_i_data = {}
+    a_i_data.update(blocks)
     return a_i_data
 
+
 ### 데이터 저장하기
-def save_resource(wb, sheet, data):
-    # 새 파일 생성 및 데이터 쓰기
-    
-    if sheet not in wb.sheetnames:
-        ws = wb.create_sheet(title=sheet)
-
-        # 헤더 추가 (선택 사항)
-        ws['A1'] = '파드명'
-        ws['B1'] = 'CPU'  # I열을 B열에 저장 (필요 시 위치 변경)
-        ws['C1'] = 'MEM'  # I열을 B열에 저장 (필요 시 위치 변경)
-
-        # 데이터 쓰기
-        for i, s in enumerate(string_list):
-            ws[f'A{i+2}'] = s
-
-            if data.get(s):
-                ws[f'B{i+2}'] = data.get(s)[0]  # I열 데이터를 B열에 저장
-                ws[f'C{i+2}'] = data.get(s)[1]  # I열 데이터를 B열에 저장
-            else:
-                ws[f'B{i+2}'] = '-'
-                ws[f'C{i+2}'] = '-'
-
-        print(f'처리 완료! {sheet} 시트가 생성되었습니다.')
-    
+resource_header = ['파드명', 'CPU', 'MEM']
+traffic_header = ['송신', '수신']
+long_columns = ['month', 'pod', 'cpu', 'mem', 'tx', 'rx']
+
+
+def sheet_rows(resource, traffic):
+    """
+    ## 월 시트 행
+    string_list 순서대로 [파드명, CPU, MEM(, 송신, 수신)] 행을 만든다. 값이 없는 칸은 '-'.
+    traffic 이 None 이면 트래픽 열(D, E)은 만들지 않는다.
+
+    Args:
+        resource: {파드명: (CPU, MEM)} 또는 None
+        traffic: {파드명: (수신, 송신)} 또는 None
+    """
+    yield resource_header + (traffic_header if traffic is not None else [])
+    for s in string_list:
+        row = [s]
+        row += list(resource[s]) if resource and resource.get(s) else ['-', '-']
+        if traffic is not None:
+            row += [traffic[s][1], traffic[s][0]] if traffic.get(s) else ['-', '-']
+        yield row
+
+
+def save_months(filepath, months):
+    """
+    ## 월별 시트 저장
+    파일이 없으면 write-only 워크북으로 모든 월 시트를 한 번에 흘려 쓴다. (셀 객체를 메모리에 쌓지 않음)
+    파일이 있으면 기존 워크북을 열어 months 에 있는 월 시트의 값만 바꾼다.
+    월 시트가 아닌 시트, 넘기지 않은 월 시트, 서식/열 너비는 그대로 둔다. 새 월 시트는 맨 뒤에 추가한다.
+
+    Args:
+        filepath: 저장할 파일
+        months: {월: [리소스 데이터 또는 None, 트래픽 데이터 또는 None]} (시트 순서대로)
+    """
+    if not os.path.exists(filepath):
+        wb = openpyxl.Workbook(write_only=True)
+        for ym, (resource, traffic) in months.items():
+            ws = wb.create_sheet(title=ym)
+            for row in sheet_rows(resource, traffic):
+                ws.append(row)
+            print(f'처리 완료! {ym} 시트가 저장되었습니다.')
+        wb.save(filepath)
+        wb.close()
+        return
+
+    wb = openpyxl.load_workbook(filepath)
+    for ym, (resource, traffic) in months.items():
+        if ym in wb.sheetnames:
+            _replace_values(wb[ym], list(sheet_rows(resource, traffic)))
+            print(f'처리 완료! {ym} 시트가 갱신되었습니다.')
+        else:
+            ws = wb.create_sheet(title=ym)
+            for row in sheet_rows(resource, traffic):
+                ws.append(row)
+            print(f'처리 완료! {ym} 시트가 저장되었습니다.')
+    wb.save(filepath)
+    wb.close()
+
+
+def _replace_values(ws, rows):
+    # 기존 시트의 값만 rows 로 바꾸고, rows 밖에 남은 예전 값은 지운다. (셀 서식은 유지)
+    n_rows, n_cols = len(rows), max(map(len, rows))
+    for merged in list(ws.merged_cells.ranges):
+        if merged.min_row <= n_rows and merged.min_col <= n_cols:
+            print(f'경고: {ws.title} 시트의 병합 {merged.coord} 를 풀고 값을 씁니다.')
+            ws.unmerge_cells(merged.coord)
+
+    for r, row in enumerate(rows, start=1):
+        for c, value in enumerate(row, start=1):
+            ws.cell(row=r, column=c, value=value)
+    for row in ws.iter_rows():
+        for cell in row:
+            if (cell.row > n_rows or cell.column > len(rows[cell.row - 1])) \
+                    and cell.value is not None and not isinstance(cell, openpyxl.cell.cell.MergedCell):
+                cell.value = None
+
+
+def load_months(filepath):
+    """
+    ## 저장된 월별 시트 읽기
+    save_months 로 만든 파일을 읽기 전용으로 읽어 {월: [리소스, 트래픽]} 으로 되돌린다.
+    한 달만 추가/교체하거나 전체 월을 긴 형식으로 내보낼 때 기존 월 데이터를 읽기 위해 사용한다.
+    """
+    months = {}
+    if not os.path.exists(filepath):
+        return months
+
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    for ws in wb.worksheets:
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header or header[0] != resource_header[0]:
+            continue  # 월 시트가 아님 (예: 빈 기본 시트)
+        has_traffic = len(header) >= 5 and header[3] == traffic_header[0]
+
+        resource, traffic = {}, ({} if has_traffic else None)
+        for row in rows:
+            row = list(row) + [None] * (5 - len(row))
+            if row[0] is None:
+                continue
+            if row[1] != '-' or row[2] != '-':
+                resource[row[0]] = (row[1], row[2])
+            if has_traffic and (row[3] != '-' or row[4] != '-'):
+                traffic[row[0]] = (row[4], row[3])
+        months[ws.title] = [resource, traffic]
+    wb.close()
+    return months
+
+
+def export_long(months, path):
+    """
+    ## 긴 형식(long format) 내보내기
+    월별 데이터를 (month, pod, cpu, mem, tx, rx) 한 행씩 CSV 또는 Parquet 으로 저장한다.
+    엑셀을 열지 않고 여러 해 치 이력을 조회/집계할 때 사용한다.
+    파드는 string_list 순서, 목록에 없는 파드는 이름순으로 뒤에 붙인다. 값이 없으면 빈 칸.
+
+    Args:
+        months: {월: [리소스 데이터 또는 None, 트래픽 데이터 또는 None]}
+        path: 저장할 파일. 확장자가 .parquet 이면 Parquet (pyarrow 필요), 그 외에는 CSV
+    """
+    def records():
+        for ym, (resource, traffic) in months.items():
+            resource, traffic = resource or {}, traffic or {}
+            extra = sorted((set(resource) | set(traffic)) - set(string_list))
+            for pod in string_list + extra:
+                cpu, mem = resource.get(pod) or (None, None)
+                rx, tx = traffic.get(pod) or (None, None)
+                yield [ym, pod, cpu, mem, tx, rx]
+
+    if path.endswith('.parquet'):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError('Parquet 로 저장하려면 pyarrow 를 설치하세요. (pip install pyarrow)') from e
+        columns = list(zip(*records())) or [[] for _ in long_columns]
+        table = pa.table({name: pa.array(values) for name, values in zip(long_columns, columns)})
+        pq.write_table(table, path)
     else:
-        ws = wb[sheet]
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(long_columns)
+            writer.writerows(records())
+    print(f'처리 완료! {path} 에 긴 형식 데이터가 저장되었습니다.')
+
+
+### 월별 리소스 큐브 (분석용)
+# numpy 는 큐브를 만들거나 조회할 때만 import 한다. (추출/저장만 할 때는 필요 없음)
+cube_metrics = ['cpu', 'mem', 'tx', 'rx']
+# 노드 그룹: 파드명으로 구분 (어느 그룹에도 속하지 않는 파드는 롤업에서 제외)
+node_groups = {
+    'master': re.compile(r'master', re.I),
+    'ingress': re.compile(r'ingress', re.I),
+    'node': re.compile(r'-node\d*$', re.I),
+    'db': re.compile(r'db', re.I),
+}
+_number_pattern = re.compile(r'^\s*([-+]?\d[\d,]*(?:\.\d+)?)\s*%?\s*$')
+
+
+def _number(value):
+    # 셀 값을 숫자로 (없거나 '-' 등 숫자가 아니면 NaN). "12.5%", "1,024" 형식 허용
+    if isinstance(value, bool) or value is None:
+        return float('nan')
+    if isinstance(value, (int, float)):
+        return float(value)
+    m = _number_pattern.match(str(value))
+    return float(m.group(1).replace(',', '')) if m else float('nan')
+
+
+@dataclass
+class ResourceCube:
+    """
+    ## 월별 리소스 큐브
+    values[월, 파드, 지표] 로 모든 달의 CPU/MEM/송신/수신 값을 담은 float64 배열. 값이 없으면 NaN.
+    월은 시간순, 파드는 string_list 순서(목록에 없는 파드는 이름순으로 뒤), 지표는 cube_metrics 순서.
+    """
+    months: list
+    pods: list
+    values: 'numpy.ndarray'
+
+    def series(self, metric):
+        """(월 x 파드) 배열. metric 은 cube_metrics 중 하나"""
+        return self.values[:, :, cube_metrics.index(metric)]
+
+    def deltas(self, metric, periods=1):
+        """
+        전월 대비 증감 (월 x 파드). periods 개월 전과 비교하며, 비교할 달이 없는 앞쪽 행은 NaN.
+        """
+        import numpy as np
+        if not 1 <= periods < len(self.months):
+            raise ValueError(f'periods 는 1 이상 {len(self.months)} 미만이어야 합니다. (현재 {periods})')
+        values = self.series(metric)
+        result = np.full_like(values, np.nan)
+        result[periods:] = values[periods:] - values[:-periods]
+        return result
+
+    def top_growers(self, metric, n=10, start=None, end=None):
+        """
+        start 월 대비 end 월에 가장 많이 늘어난 파드 n 개를 [(파드명, 증감)] 으로 반환 (큰 순서).
+        start/end 를 생략하면 첫 달과 마지막 달. 두 달 중 한쪽이라도 값이 없는 파드는 제외.
+        """
+        import numpy as np
+        if not self.months:
+            return []
+        values = self.series(metric)
+        first = self.months.index(start) if start is not None else 0
+        last = self.months.index(end) if end is not None else len(self.months) - 1
+        growth = values[last] - values[first]
+
+        valid = np.flatnonzero(~np.isnan(growth))
+        n = min(n, len(valid))
+        if n == 0:
+            return []
+        top = valid[np.argpartition(-growth[valid], n - 1)[:n]]
+        top = top[np.argsort(-growth[top], kind='stable')]
+        return [(self.pods[i], float(growth[i])) for i in top]
+
+    def months_over(self, metric, threshold):
+        """
+        값이 threshold 를 넘은 달을 {파드명: [월, ...]} 으로 반환. 한 번도 넘지 않은 파드는 제외.
+        """
+        import numpy as np
+        over = self.series(metric) > threshold  # NaN 은 False
+        result = {}
+        for pod_index, month_index in zip(*np.nonzero(over.T)):
+            result.setdefault(self.pods[pod_index], []).append(self.months[month_index])
+        return result
+
+    def rollup(self, metric, how='mean', groups=None):
+        """
+        노드 그룹별 월 집계를 {그룹: (월 수,) 배열} 로 반환. how 는 'mean', 'sum', 'max', 'min'.
+        groups 를 생략하면 node_groups. 그룹에 속한 파드가 없거나 값이 모두 없는 달은 NaN.
+        """
+        import numpy as np
+        reduce = {'mean': np.nanmean, 'sum': np.nansum, 'max': np.nanmax, 'min': np.nanmin}[how]
+        values = self.series(metric)
+        result = {}
+        for name, group in (groups or node_groups).items():
+            members = [i for i, pod in enumerate(self.pods) if group.search(pod)]
+            block = values[:, members]
+            has = ~np.isnan(block).all(axis=1)
+            rolled = np.full(len(self.months), np.nan)
+            if members and has.any():
+                rolled[has] = reduce(block[has], axis=1)
+            result[name] = rolled
+        return result
+
+
+def build_cube(months):
+    """
+    ## 월별 데이터를 큐브로
+    {월: [리소스 데이터 또는 None, 트래픽 데이터 또는 None]} (extract_months/load_months 결과)를
+    ResourceCube 로 바꾼다.
+    """
+    import numpy as np
+    order = sorted(months)
+    # string_list 의 서버는 데이터가 없어도 자리를 둔다 (전부 NaN). 목록에 없는 서버는 뒤에 붙임
+    pods = list(dict.fromkeys(string_list))
+    extras = set()
+    for resource, traffic in months.values():
+        extras |= set(resource or {}) | set(traffic or {})
+    pods += sorted(extras - set(pods))
+    pod_index = {pod: i for i, pod in enumerate(pods)}
+
+    values = np.full((len(order), len(pods), len(cube_metrics)), np.nan)
+    for m, ym in enumerate(order):
+        resource, traffic = months[ym]
+        for pod, (cpu, mem) in (resource or {}).items():
+            values[m, pod_index[pod], 0:2] = _number(cpu), _number(mem)
+        for pod, (rx, tx) in (traffic or {}).items():
+            values[m, pod_index[pod], 2:4] = _number(tx), _number(rx)
+    return ResourceCube(months=order, pods=pods, values=values)
+
+
+def load_cube(filepath="데이터 추출.xlsx"):
+    """
+    ## 저장된 월별 시트로 큐브 만들기
+    예) load_cube().top_growers('cpu', 5)
+    """
+    return build_cube(load_months(filepath))
+
+
+### 월별 파일 목록
+ym_pattern = re.compile(r"\b\d{4}\b")
+
+def list_month_files(resource_dir="./리소스", network_dir="./네트워크"):
+    """
+    ## 월별 파일 목록
+    리소스 파일과 네트워크 파일(part1/part2 는 한 쌍)을 월(시트명)과 함께 디렉토리 순서대로 반환.
+
+    Returns:
+        ([(월, 리소스 파일)], [(월, 네트워크 part1 또는 단일 파일, part2 파일 또는 '')])
+    """
+    resources = []
+    if resource_dir:
+        for filename in get_filenames(resource_dir):
+            resources.append((re.search(ym_pattern, filename).group(), os.path.join(resource_dir, filename)))
+
+    networks = []
+    if network_dir:
+        for filename in get_filenames(network_dir):
+            if 'part2' in filename:
+                continue
+            part2 = ''
+            if 'part1' in filename:
+                part2 = os.path.join(network_dir, filename.replace('part1', 'part2'))
+            networks.append((re.search(ym_pattern, filename).group(), os.path.join(network_dir, filename), part2))
+    return resources, networks
+
+
+def read_network(network_filename1, network_filename2=''):
+    """
+    ## 네트워크 송수신량 읽기
+    part1/part2 로 나뉜 파일은 두 파일의 결과를 합친다.
+    """
+    data = read_data(network_filename1)
+    if network_filename2 != '':
+        data = read_data(network_filename2, data)
+    return data
 
-        # 헤더 추가 (선택 사항)
-        ws['D1'] = '송신'
-        ws['E1'] = '수신'
 
-        for i, s in enumerate(string_list):
-            if data.get(s):
-                ws[f'D{i+2}'] = data.get(s)[1]
-                ws[f'E{i+2}'] = data.get(s)[0]
+def read_months(resources, networks, workers=None):
+    """
+    ## 여러 월 파일 동시에 읽기
+    월별 리소스 파일과 네트워크 파일(쌍)을 프로세스 풀에서 동시에 읽는다.
+    결과는 입력 순서 그대로 반환하므로 시트 순서와 내용은 순서대로 읽을 때와 같다.
 
-            else:
-                ws[f'B{i+2}'] = '-'
-                ws[f'C{i+2}'] = '-'
-        print(f'처리 완료! {sheet} 시트에 트래픽 내역이 추가가되었습니다.')
+    Returns:
+        ([(월, 리소스 데이터)], [(월, 트래픽 데이터)])
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        resource_jobs = [(ym, pool.submit(read_data, path)) for ym, path in resources]
+        network_jobs = [(ym, pool.submit(read_network, part1, part2)) for ym, part1, part2 in networks]
+        return ([(ym, job.result()) for ym, job in resource_jobs],
+                [(ym, job.result()) for ym, job in network_jobs])
+
+
+### 여러 월의 리소스/트래픽 한 번에 추출
+def extract_months(resource_dir="./리소스", network_dir="./네트워크", filepath="데이터 추출.xlsx", workers=None,
+                   long_path=None):
+    """
+    ## 여러 월의 리소스/트래픽 한 번에 추출
+    모든 달의 리소스 파일과 네트워크 파일을 동시에 읽은 뒤,
+    월별 시트(리소스 월 순서, 그 뒤에 네트워크에만 있는 월)를 한 번에 흘려 쓴다.
+
+    Args:
+        resource_dir: 월별 리소스 파일 디렉토리. None 이면 리소스는 건너뜀
+        network_dir: 월별 네트워크 파일 디렉토리. None 이면 트래픽은 건너뜀
+        filepath: 저장할 파일
+        workers: 동시에 읽을 프로세스 수. None 이면 CPU 수
+        long_path: 지정하면 (month, pod, cpu, mem, tx, rx) 긴 형식 CSV/Parquet 도 저장
+
+    Returns:
+        {월: [리소스, 트래픽]} (build_cube 로 큐브를 만들 수 있음)
+    """
+    resources, networks = list_month_files(resource_dir, network_dir)
+    resource_data, network_data = read_months(resources, networks, workers)
+
+    months = {}
+    for ym, data in resource_data:
+        months.setdefault(ym, [None, None])[0] = data
+    for ym, data in network_data:
+        months.setdefault(ym, [None, None])[1] = data
+
+    save_months(filepath, months)
+    if long_path:
+        export_long(months, long_path)
+    return months
 
 
 ### 여러 월의 리소스 추출
@@ -97,26 +642,9 @@ def extract_resources():
     리소스(CPU, MEM) 사용률을 읽어와 추출 및 저장하는 함수.  
     특정 디렉토리 안에 있는 여러 달의 정보를 가져오며,  
     새로운 파일을 만들 때 사용한다. 
+    트래픽까지 함께 만들 때는 extract_months 를 쓰면 파일을 한 번만 저장한다.
     """
-    # 1. 파일 읽어오기
-    resource_file_list = get_filenames("./리소스")
-
-    # 2. 편집할 파일 열기
-    filepath_new = "데이터 추출.xlsx"
-    wb_new = openpyxl.Workbook()
-
-    # 3. 파일별 데이터 가져오기
-    for filename in resource_file_list:   
-        data = read_data(f'./리소스/{filename}')
-
-        # 4. 데이터 추가하기기
-        ym_pattern = re.compile(r"\b\d{4}\b")
-        sheet=re.search(ym_pattern, filename).group()
-        save_resource(wb_new, sheet, data)
-
-    # 5. 파일 저장 및 닫기
-    wb_new.save(filepath_new)
-    wb_new.close()
+    extract_months(network_dir=None)
 
 
 ### 여러 월의 트래픽 추출
@@ -127,74 +655,59 @@ def extract_traffics():
     특정 디렉토리 안에 있는 여러 달의 정보를 가져오며,  
     **반드시 extract_resources 실행 후에 동작해야 한다.**
     """
-    resource_file_list = get_filenames("./네트워크")
-    filepath = "데이터 추출.xlsx"
-    wb = openpyxl.load_workbook(filepath)
+    _, networks = list_month_files(None, "./네트워크")
+    _, network_data = read_months([], networks)
 
-    for filename in resource_file_list:
-        if 'part2' not in filename:
-            if 'part1' in filename:
-                data = read_data(f'./네트워크/{filename}')
-                data = read_data(f'./네트워크/{filename.replace('part1', 'part2')}', data)
-                
-            else: 
-                data = read_data(f'./네트워크/{filename}')
-            
-            print(data)
-
-            # 4. 데이터 추가하기기
-            ym_pattern = re.compile(r"\b\d{4}\b")
-            sheet=re.search(ym_pattern, filename).group()
-            save_resource(wb, sheet, data)
- 
-    # 5. 파일 저장 및 닫기
-    wb.save(filepath)
-    wb.close()
+    filepath = "데이터 추출.xlsx"
+    months = load_months(filepath)
+    for ym, data in network_data:
+        print(data)
+        months.setdefault(ym, [None, None])[1] = data
+    # 트래픽을 읽은 월 시트만 갱신 (다른 시트는 그대로)
+    save_months(filepath, {ym: months[ym] for ym, _ in network_data})
 
 
 ### 특정 월 리소스/트래픽 추출
-def extract_network_resource(ym, resource_filename, network_filename1, network_filename2=''):
+def extract_network_resource(ym, resource_filename, network_filename1, network_filename2='', long_path=None):
     """
     특정  월의 리소스,트래픽 추출출
     특정 월의 엑셀 파일만 추출하는 함수.  
     파드의 리소스(CPU, MEM) 사용량, 네트워크 송수신 트래픽 정보
+    기존 파일의 다른 시트는 그대로 두고 해당 월 시트의 값만 새로 쓴다.
     Args:
         ym: 연도-월. 시트명이 된다.  
         resource_filename: 리소스(CPU, MEM) 정보가 저장된 엑셀파일
         network_filename1: 네트워크 송수신 정보가 저장된 엑셀파일
         network_filename2: 네트워크 송수신 정보가 저장된 엑셀파일 part2. 정보가 많아 두 개 파일로 나눌 때 사용되는 인자이다.
+        long_path: 지정하면 전체 월의 긴 형식 CSV/Parquet 도 저장
     """
 
-    # 1. 파일 생성 및 열기
+    # 1. 기존 파일의 월별 데이터 읽기
     dir=r'C:\Users\INNOGRID\Documents\Amaranth10\NIA 월간운영보고서 재작성 요청'
     filepath = os.path.join(dir,"데이터 추출.xlsx")
-    if os.path.exists(filepath):
-        wb = openpyxl.load_workbook(filepath)
-    else:
-        wb = openpyxl.Workbook()
-
-    # 2. 리소스 추출 및 파일 저장
-    resource_data = read_data(resource_filename)  
-    save_resource(wb, ym, resource_data)
-    
-    # 3. 네트워크 추출 및 파일 저장
-    network_data = read_data(network_filename1)
-    if network_filename2 != '':
-        network_data = read_data(network_filename2, network_data)
-    save_resource(wb, ym, network_data)
+    months = load_months(filepath)
 
-    wb.save(filepath)
-    wb.close()
+    # 2. 리소스/네트워크 추출
+    resource_data = read_data(resource_filename)
+    network_data = read_network(network_filename1, network_filename2)
+    months[ym] = [resource_data, network_data]
 
+    # 3. 파일 저장 (해당 월 시트만 갱신)
+    save_months(filepath, {ym: months[ym]})
+    if long_path:
+        export_long(months, long_path)
 
-dir=r'C:\Users\INNOGRID\Documents\Amaranth10\NIA 월간운영보고서 재작성 요청'
-resource="리소스-2412.xlsx"
-netework1="화성-네트워크-2412-part1.xlsx"
-netework2="화성-네트워크-2412-part2.xlsx"
-r_file=os.path.join(dir, resource)
-n_file=os.path.join(dir, netework1)
-n_file2=os.path.join(dir, netework2)
 
-extract_network_resource('2412', r_file, n_file, n_file2)
+# 프로세스 풀(extract_months)의 worker 가 이 파일을 다시 import 할 때 실행되지 않도록 main 에서만 실행
+if __name__ == "__main__":
+    dir=r'C:\Users\INNOGRID\Documents\Amaranth10\NIA 월간운영보고서 재작성 요청'
+    resource="리소스-2412.xlsx"
+    netework1="화성-네트워크-2412-part1.xlsx"
+    netework2="화성-네트워크-2412-part2.xlsx"
+    r_file=os.path.join(dir, resource)
+    n_file=os.path.join(dir, netework1)
+    n_file2=os.path.join(dir, netework2)
+
+    extract_network_resource('2412', r_file, n_file, n_file2)
 
 #수기로 하면 월 하나 당 20분 걸렸는데, 클릭 한 번으로 되니까 거의 1초면 됨
\ No newline at end of file
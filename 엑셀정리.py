@@ -1,14 +1,19 @@
 import os
 import tarfile
 import re
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from openpyxl import Workbook
 from openpyxl import load_workbook
 
+# 로그 형식을 정규 표현식으로 정의 (날짜, 서버명, 권한, 내용)
+log_pattern = re.compile(r"^(\w+ \d+ \d+:\d+:\d+) (\S+) (\S+): (.+)$")
+archive_suffix = "_secure.tar.gz"
+
 # 해당 경로에서 *_secure.tar 파일 찾기
+# (writeExcel 은 압축 파일을 바로 읽으므로, 풀어 둔 파일이 따로 필요할 때만 사용)
 def unzip(dir):
     for file_name in os.listdir(dir):
-        if file_name.endswith("_secure.tar.gz"):
+        if file_name.endswith(archive_suffix):
             file_path = os.path.join(dir, file_name)
             
             # 압축 해제할 폴더 생성 (파일명과 동일한 폴더)
@@ -21,35 +26,67 @@ def unzip(dir):
                 print(f"압축 해제 완료: {file_path} → {extract_dir}")
 
 
-def writeExcel(dir):
+def parse_secure(lines):
+    """
+    secure 로그 줄들을 (날짜, 서버명, 권한, 내용) 리스트로 변환. 형식이 맞지 않는 줄은 건너뜀
+    """
+    logs = []
+    for line in lines:
+        match = log_pattern.match(line.strip())
+        if match:
+            logs.append(match.groups())
+    return logs
+
+
+def read_secure_archive(file_path):
+    """
+    *_secure.tar.gz 를 디스크에 풀지 않고 secure 파일만 압축 스트림에서 바로 한 줄씩 읽어 파싱
+    """
+    # r|gz: 앞에서부터 순서대로만 읽는 스트림 모드 (tar 전체를 임시로 풀거나 되감지 않음)
+    with tarfile.open(file_path, "r|gz") as tar:
+        for member in tar:
+            if member.isfile() and os.path.basename(member.name) == "secure":
+                # 스트림 모드의 파일 객체는 되감기(seek)가 안 돼 TextIOWrapper 대신 바이트 줄을 직접 디코딩
+                with tar.extractfile(member) as f:
+                    return parse_secure(line.decode("utf-8", errors="replace") for line in f)
+    return []
+
+
+def read_secure_dir(dir_path):
+    # 예전 방식(unzip)으로 이미 풀어 둔 폴더
+    with open(os.path.join(dir_path, "secure"), "r", encoding="utf-8") as f:
+        return parse_secure(f)
+
+
+def writeExcel(dir, workers=None):
+    """
+    dir 안의 *_secure.tar.gz 를 프로세스 풀에서 동시에 파싱해 서버별 시트로 secure_logs.xlsx 저장.
+    압축 파일이 없는, 이미 풀어 둔 폴더(폴더/secure)도 함께 읽는다. (unzip 을 먼저 실행할 필요 없음)
+    시트명은 압축 파일명에서 .tar.gz 를 뺀 이름 (폴더라면 폴더명)
+    """
     excel_path = os.path.join(dir, "secure_logs.xlsx")
-    wb = Workbook()
-    wb.remove(wb.active)  # 기본 시트 제거
-
-    # 로그 형식을 정규 표현식으로 정의
-    log_pattern = re.compile(r"^(\w+ \d+ \d+:\d+:\d+) (\S+) (\S+): (.+)$")
 
-    # 지정된 경로 안의 디렉토리 찾기
-    for dir_name in os.listdir(dir):
-        dir_path = os.path.join(dir, dir_name)
-        
-        if os.path.isdir(dir_path):  # 디렉토리인지 확인
-            secure_file_path = os.path.join(dir_path, "secure")
-
-            if os.path.exists(secure_file_path):  # secure 파일이 존재하면 처리
-                logs = []
-                with open(secure_file_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        match = log_pattern.match(line.strip())
-                        if match:
-                            logs.append(match.groups())  # (날짜, 서버명, 권한, 내용) 형태로 저장
-
-                # 데이터프레임으로 변환 후 엑셀 시트에 저장
-                if logs:
-                    df = pd.DataFrame(logs, columns=["날짜", "서버명", "권한", "내용"])
-                    ws = wb.create_sheet(title=dir_name)
-                    for row in df.itertuples(index=False, name=None):
-                        ws.append(row)
+    # 지정된 경로 안의 압축 파일/폴더 찾기 (같은 이름이면 압축 파일만 읽음)
+    jobs = []
+    names = os.listdir(dir)
+    for name in names:
+        path = os.path.join(dir, name)
+        if name.endswith(archive_suffix) and os.path.isfile(path):
+            jobs.append((name[:-len(".tar.gz")], read_secure_archive, path))
+        elif os.path.isdir(path) and os.path.exists(os.path.join(path, "secure")) \
+                and name + ".tar.gz" not in names:
+            jobs.append((name, read_secure_dir, path))
+
+    # write-only 워크북으로 시트를 흘려 씀 (결과는 목록 순서대로)
+    wb = Workbook(write_only=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(sheet, pool.submit(read, path)) for sheet, read, path in jobs]
+        for sheet, future in futures:
+            logs = future.result()
+            if logs:
+                ws = wb.create_sheet(title=sheet)
+                for row in logs:
+                    ws.append(row)
 
     # 엑셀 저장
     wb.save(excel_path)
@@ -90,6 +127,8 @@ def findUserState(dir):
     wb.save(dir)
     print(f"엑셀 파일 업데이트 완료: {dir}")
 
-dir=r"C:\Users\INNOGRID\Documents\Amaranth10\[울산항만공사 대표홈페이지] 접속기록 및 정책설정 로그"
-dir2=r"C:\Users\INNOGRID\Documents\Amaranth10\secure_logs_수정 by Moon.xlsx"
-findUserState(dir2)
\ No newline at end of file
+# 프로세스 풀(writeExcel)의 worker 가 이 파일을 다시 import 할 때 실행되지 않도록 main 에서만 실행
+if __name__ == "__main__":
+    dir=r"C:\Users\INNOGRID\Documents\Amaranth10\[울산항만공사 대표홈페이지] 접속기록 및 정책설정 로그"
+    dir2=r"C:\Users\INNOGRID\Documents\Amaranth10\secure_logs_수정 by Moon.xlsx"
+    findUserState(dir2)
\ No newline at end of file